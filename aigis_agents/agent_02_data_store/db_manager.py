@@ -314,6 +314,7 @@ CREATE TABLE IF NOT EXISTS propositions (
 _INDEX_DDL = """
 CREATE INDEX IF NOT EXISTS idx_prod_deal_case   ON production_series(deal_id, case_name);
 CREATE INDEX IF NOT EXISTS idx_prod_period       ON production_series(period_start, period_end);
+CREATE INDEX IF NOT EXISTS idx_prod_deal_entity_period ON production_series(deal_id, entity_name, period_start, product);
 CREATE INDEX IF NOT EXISTS idx_fin_deal_case     ON financial_series(deal_id, case_name);
 CREATE INDEX IF NOT EXISTS idx_fin_line_item     ON financial_series(line_item);
 CREATE INDEX IF NOT EXISTS idx_scalar_deal       ON scalar_datapoints(deal_id, metric_key);
@@ -321,6 +322,7 @@ CREATE INDEX IF NOT EXISTS idx_cells_sheet       ON excel_cells(deal_id, doc_id,
 CREATE INDEX IF NOT EXISTS idx_cells_assumption  ON excel_cells(deal_id, is_assumption);
 CREATE INDEX IF NOT EXISTS idx_conflicts_deal    ON data_conflicts(deal_id, severity);
 CREATE INDEX IF NOT EXISTS idx_reserves_deal     ON reserve_estimates(deal_id, reserve_class);
+CREATE INDEX IF NOT EXISTS idx_reserve_deal_entity_class ON reserve_estimates(deal_id, entity_name, reserve_class);
 CREATE INDEX IF NOT EXISTS idx_cost_deal         ON cost_benchmarks(deal_id, metric);
 CREATE INDEX IF NOT EXISTS idx_fiscal_deal       ON fiscal_terms(deal_id, term_name);
 CREATE INDEX IF NOT EXISTS idx_cn_name_deal      ON concept_nodes(name, deal_id);
@@ -330,6 +332,88 @@ CREATE INDEX IF NOT EXISTS idx_prop_subj         ON propositions(subject, predic
 CREATE INDEX IF NOT EXISTS idx_prop_deal         ON propositions(deal_id);
 """
 
+# Trigram full-text index over the free-text scalar columns. Trigram tokens keep
+# case-insensitive substring semantics (MATCH '"abc"' ≈ LIKE '%abc%'), so callers
+# can swap a LOWER()+LIKE scan for an index lookup. Kept in sync by triggers.
+_SCALAR_FTS_DDL = """
+CREATE VIRTUAL TABLE IF NOT EXISTS scalar_fts USING fts5(
+    metric_key, context, extraction_note,
+    content='scalar_datapoints', content_rowid='rowid', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS scalar_fts_ai AFTER INSERT ON scalar_datapoints BEGIN
+    INSERT INTO scalar_fts(rowid, metric_key, context, extraction_note)
+    VALUES (new.rowid, new.metric_key, new.context, new.extraction_note);
+END;
+CREATE TRIGGER IF NOT EXISTS scalar_fts_ad AFTER DELETE ON scalar_datapoints BEGIN
+    INSERT INTO scalar_fts(scalar_fts, rowid, metric_key, context, extraction_note)
+    VALUES ('delete', old.rowid, old.metric_key, old.context, old.extraction_note);
+END;
+CREATE TRIGGER IF NOT EXISTS scalar_fts_au AFTER UPDATE ON scalar_datapoints BEGIN
+    INSERT INTO scalar_fts(scalar_fts, rowid, metric_key, context, extraction_note)
+    VALUES ('delete', old.rowid, old.metric_key, old.context, old.extraction_note);
+    INSERT INTO scalar_fts(rowid, metric_key, context, extraction_note)
+    VALUES (new.rowid, new.metric_key, new.context, new.extraction_note);
+END;
+"""
+_SCALAR_FTS_REBUILD = "INSERT INTO scalar_fts(scalar_fts) VALUES ('rebuild');"
+
+# Per-(well, case, month) product totals, maintained on write so readers (Agent 07)
+# can skip re-pivoting raw production rows. Each trigger recomputes the affected
+# month from production_series rather than applying deltas, which keeps the view
+# correct under production_series' ON CONFLICT REPLACE (whose implicit deletes
+# do not fire DELETE triggers). Gas is stored in boe, as value_normalised is.
+_MONTHLY_PRODUCTION_DDL = """
+CREATE TABLE IF NOT EXISTS monthly_production (
+    deal_id       TEXT NOT NULL,
+    entity_name   TEXT NOT NULL,
+    case_name     TEXT NOT NULL,
+    period_start  TEXT NOT NULL,
+    period_end    TEXT,
+    oil_bopd      REAL NOT NULL DEFAULT 0,
+    gas_boepd     REAL NOT NULL DEFAULT 0,
+    water_bwpd    REAL NOT NULL DEFAULT 0,
+    boe_explicit  REAL NOT NULL DEFAULT 0,
+    PRIMARY KEY (deal_id, entity_name, case_name, period_start)
+);
+"""
+
+_MONTHLY_PRODUCTION_SELECT = """
+SELECT deal_id, entity_name, case_name, period_start,
+       (SELECT p2.period_end FROM production_series p2
+         WHERE p2.deal_id = p.deal_id AND p2.entity_name = p.entity_name
+           AND p2.case_name = p.case_name AND p2.period_start = p.period_start
+         ORDER BY p2.product LIMIT 1),
+       SUM(CASE WHEN LOWER(product) IN ('oil', 'condensate') THEN COALESCE(value_normalised, 0) ELSE 0 END),
+       SUM(CASE WHEN LOWER(product) IN ('gas', 'gas_mcfd')   THEN COALESCE(value_normalised, 0) ELSE 0 END),
+       SUM(CASE WHEN LOWER(product) IN ('water', 'ngl')      THEN COALESCE(value_normalised, 0) ELSE 0 END),
+       SUM(CASE WHEN LOWER(product) IN ('boe', 'boepd')      THEN COALESCE(value_normalised, 0) ELSE 0 END)
+FROM production_series p
+WHERE {where}
+GROUP BY deal_id, entity_name, case_name, period_start
+"""
+
+
+def _monthly_production_refresh(row: str) -> str:
+    """Trigger body statements recomputing the month identified by NEW/OLD (row)."""
+    key = (f"deal_id = {row}.deal_id AND entity_name = {row}.entity_name "
+           f"AND case_name = {row}.case_name AND period_start = {row}.period_start")
+    return (
+        f"DELETE FROM monthly_production WHERE {key};\n"
+        f"INSERT INTO monthly_production {_MONTHLY_PRODUCTION_SELECT.format(where=key)};\n"
+    )
+
+
+_MONTHLY_PRODUCTION_TRIGGERS = f"""
+CREATE TRIGGER IF NOT EXISTS monthly_production_ai AFTER INSERT ON production_series
+WHEN new.entity_name IS NOT NULL BEGIN
+{_monthly_production_refresh("new")}END;
+CREATE TRIGGER IF NOT EXISTS monthly_production_ad AFTER DELETE ON production_series
+WHEN old.entity_name IS NOT NULL BEGIN
+{_monthly_production_refresh("old")}END;
+CREATE TRIGGER IF NOT EXISTS monthly_production_au AFTER UPDATE ON production_series BEGIN
+{_monthly_production_refresh("old")}{_monthly_production_refresh("new")}END;
+"""
+
 
 # ── Public API ─────────────────────────────────────────────────────────────────
 
@@ -350,14 +434,76 @@ def ensure_db(deal_id: str, output_dir: str | Path = "./outputs") -> Path:
     conn = sqlite3.connect(str(path))
     try:
         conn.executescript(_SCHEMA_DDL)
-        conn.executescript(_INDEX_DDL)
-        conn.commit()
+        ensure_indexes(conn)
     finally:
         conn.close()
 
     return path
 
 
+def ensure_indexes(conn: sqlite3.Connection) -> None:
+    """
+    Create any missing indexes and derived tables (scalar_fts, monthly_production)
+    on an existing DB (stores built by older versions), backfilling them.
+
+    Run by ensure_db() on every Agent 02 ingest. Readers such as Agent 07 do not
+    migrate the store; they check has_monthly_production() / has_scalar_fts().
+    """
+    conn.executescript(_INDEX_DDL)
+    _ensure_scalar_fts(conn)
+    _ensure_monthly_production(conn)
+    conn.commit()
+
+
+def has_monthly_production(conn: sqlite3.Connection) -> bool:
+    """True if the monthly_production materialized view exists in this DB."""
+    return conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name='monthly_production'"
+    ).fetchone() is not None
+
+
+def _ensure_monthly_production(conn: sqlite3.Connection) -> None:
+    """Create monthly_production and its triggers, backfilling from production_series."""
+    if has_monthly_production(conn):
+        return
+    _create_and_backfill(
+        conn,
+        _MONTHLY_PRODUCTION_DDL + _MONTHLY_PRODUCTION_TRIGGERS
+        + "INSERT INTO monthly_production "
+        + _MONTHLY_PRODUCTION_SELECT.format(where="entity_name IS NOT NULL") + ";",
+    )
+
+
+def has_scalar_fts(conn: sqlite3.Connection) -> bool:
+    """True if the scalar_fts full-text index exists in this DB."""
+    return conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name='scalar_fts'"
+    ).fetchone() is not None
+
+
+def _ensure_scalar_fts(conn: sqlite3.Connection) -> None:
+    """Create scalar_fts (backfilling existing rows); no-op if SQLite lacks FTS5 trigram."""
+    if has_scalar_fts(conn):
+        return
+    try:
+        _create_and_backfill(conn, _SCALAR_FTS_DDL + _SCALAR_FTS_REBUILD)
+    except sqlite3.OperationalError:
+        # FTS5 / trigram tokenizer not compiled in, or the rebuild failed —
+        # no index is left behind, so callers fall back to LIKE
+        return
+
+
+def _create_and_backfill(conn: sqlite3.Connection, script: str) -> None:
+    """Run a derived table's DDL and backfill *script* as one transaction, so
+    the table never exists (and is never trusted) without its rows."""
+    try:
+        conn.executescript(f"BEGIN;\n{script}\nCOMMIT;")
+    except sqlite3.Error:
+        if conn.in_transaction:
+            conn.rollback()
+        raise
+
+
 def get_connection(deal_id: str, output_dir: str | Path = "./outputs") -> sqlite3.Connection:
     """Return an open SQLite connection with row_factory and FK support."""
     path = db_path_for_deal(deal_id, output_dir)
@@ -14,6 +14,22 @@ from aigis_agents.agent_04_finance_calculator.models import (
     Jurisdiction,
 )
 
+# Jurisdiction benchmark tables: (warn, critical, benchmark description) for LOE/boe,
+# and (low, high) typical EV/2P range in $/boe.
+_LOE_TABLE: dict[Jurisdiction, tuple[float, float, str]] = {
+    Jurisdiction.GoM:    (30.0, 50.0, "GoM shallow water: $8–$35/boe; deepwater: $25–$80/boe"),
+    Jurisdiction.UKCS:   (35.0, 55.0, "UKCS producing: $15–$50/boe typical"),
+    Jurisdiction.Norway: (20.0, 35.0, "Norway producing: $8–$25/boe typical (lower cost base)"),
+}
+_LOE_DEFAULT = (30.0, 50.0, "International: varies widely by location")
+
+_EV2P_TABLE: dict[Jurisdiction, tuple[float, float]] = {
+    Jurisdiction.GoM:    (5.0, 25.0),
+    Jurisdiction.UKCS:   (4.0, 20.0),
+    Jurisdiction.Norway: (6.0, 22.0),
+}
+_EV2P_DEFAULT = (3.0, 20.0)
+
 
 def _flag(severity: str, metric: str, value: float | None, threshold: str, message: str) -> FinancialQualityFlag:
     return FinancialQualityFlag(severity=severity, metric=metric, value=value, threshold=threshold, message=message)
@@ -79,22 +95,7 @@ def validate_metrics(
 
     if summary.loe_per_boe is not None:
         # Benchmark varies by jurisdiction and water depth
-        if jurisdiction == Jurisdiction.GoM:
-            loe_warn = 30.0
-            loe_crit = 50.0
-            benchmark_desc = "GoM shallow water: $8–$35/boe; deepwater: $25–$80/boe"
-        elif jurisdiction == Jurisdiction.UKCS:
-            loe_warn = 35.0
-            loe_crit = 55.0
-            benchmark_desc = "UKCS producing: $15–$50/boe typical"
-        elif jurisdiction == Jurisdiction.Norway:
-            loe_warn = 20.0
-            loe_crit = 35.0
-            benchmark_desc = "Norway producing: $8–$25/boe typical (lower cost base)"
-        else:
-            loe_warn = 30.0
-            loe_crit = 50.0
-            benchmark_desc = "International: varies widely by location"
+        loe_warn, loe_crit, benchmark_desc = _LOE_TABLE.get(jurisdiction, _LOE_DEFAULT)
 
         if summary.loe_per_boe > loe_crit:
             flags.append(_flag(
@@ -140,14 +141,7 @@ def validate_metrics(
     # ── EV/2P ──────────────────────────────────────────────────────────────────
 
     if summary.ev_2p_usd_boe is not None:
-        if jurisdiction == Jurisdiction.GoM:
-            ev2p_low, ev2p_high = 5.0, 25.0
-        elif jurisdiction == Jurisdiction.UKCS:
-            ev2p_low, ev2p_high = 4.0, 20.0
-        elif jurisdiction == Jurisdiction.Norway:
-            ev2p_low, ev2p_high = 6.0, 22.0
-        else:
-            ev2p_low, ev2p_high = 3.0, 20.0
+        ev2p_low, ev2p_high = _EV2P_TABLE.get(jurisdiction, _EV2P_DEFAULT)
 
         if summary.ev_2p_usd_boe > ev2p_high:
             flags.append(_flag(
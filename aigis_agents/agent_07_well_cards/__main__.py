@@ -26,6 +26,7 @@ import json
 import logging
 import os
 import sys
+import time
 
 logging.basicConfig(
     level=logging.INFO,
@@ -66,6 +67,8 @@ def main(argv: list[str] | None = None) -> None:
     parser = _build_parser()
     args   = parser.parse_args(argv)
 
+    _warmup()
+
     # ── Build LLM ─────────────────────────────────────────────────────────────
     try:
         from aigis_agents.shared.llm_bridge import get_chat_model
@@ -107,46 +110,70 @@ def main(argv: list[str] | None = None) -> None:
         _print_summary(result, args.well_name)
 
 
+def _warmup() -> None:
+    """
+    Pay one-off import/compile costs of the DCA fitting path before the run.
+
+    Importing dca_engine loads scipy.optimize and compiles (or loads cached)
+    Numba kernels when numba is installed, and the first ``fit_decline_curve``
+    call warms the solver path; doing both here on a tiny synthetic series
+    keeps the cost off the first well of a fleet run.
+    """
+    t0 = time.perf_counter()
+    try:
+        import numpy as np
+        from aigis_agents.agent_07_well_cards.dca_engine import fit_decline_curve
+
+        t = np.arange(8, dtype=float)
+        fit_decline_curve(t, 1000.0 * np.exp(-0.05 * t))
+    except Exception as exc:  # warmup is best-effort only
+        log.debug("Warmup skipped: %s", exc)
+        return
+    log.debug("Warmup completed in %.3fs", time.perf_counter() - t0)
+
+
 def _print_summary(result: dict, well_name: str | None) -> None:
-    """Print a human-readable summary to the terminal."""
+    """Print a human-readable summary to the terminal (single buffered write)."""
+    lines: list[str] = []
     if well_name:
         # Single-well
         rag = result.get("rag_status", "?")
-        emoji = {"GREEN": "🟢", "AMBER": "🟡", "RED": "🔴", "BLACK": "⚫"}.get(rag, "")
-        print(f"\n{emoji} Well: {result.get('well_name', well_name)}")
-        print(f"   RAG:       {rag} — {result.get('rag_label', '')}")
+        emoji = result.get("rag_emoji", "")
+        lines.append(f"\n{emoji} Well: {result.get('well_name', well_name)}")
+        lines.append(f"   RAG:       {rag} — {result.get('rag_label', '')}")
         m = result.get("metrics", {})
         if m.get("current_rate_boepd"):
-            print(f"   Rate:      {m['current_rate_boepd']:,.0f} boe/d")
+            lines.append(f"   Rate:      {m['current_rate_boepd']:,.0f} boe/d")
         dc = result.get("decline_curve", {})
         if dc.get("eur_mmboe"):
-            print(f"   EUR (DCA): {dc['eur_mmboe']:.3f} MMboe")
+            lines.append(f"   EUR (DCA): {dc['eur_mmboe']:.3f} MMboe")
         flags = result.get("flags", [])
         if flags:
-            print(f"   Flags ({len(flags)}):")
+            lines.append(f"   Flags ({len(flags)}):")
             for f in flags[:3]:
-                print(f"     • {f[:100]}")
+                lines.append(f"     • {f[:100]}")
             if len(flags) > 3:
-                print(f"     … +{len(flags)-3} more")
+                lines.append(f"     … +{len(flags)-3} more")
     else:
         # Fleet
         n   = result.get("total_wells", 0)
         rag = result.get("rag_summary", {})
         fm  = result.get("fleet_metrics", {})
-        print(f"\n📊 Agent 07 Fleet Report — {n} wells")
-        print(f"   RAG:  🟢{rag.get('GREEN',0)}  🟡{rag.get('AMBER',0)}  🔴{rag.get('RED',0)}  ⚫{rag.get('BLACK',0)}")
+        lines.append(f"\n📊 Agent 07 Fleet Report — {n} wells")
+        lines.append(f"   RAG:  🟢{rag.get('GREEN',0)}  🟡{rag.get('AMBER',0)}  🔴{rag.get('RED',0)}  ⚫{rag.get('BLACK',0)}")
         if fm.get("total_current_rate_boepd"):
-            print(f"   Rate: {fm['total_current_rate_boepd']:,.0f} boe/d")
+            lines.append(f"   Rate: {fm['total_current_rate_boepd']:,.0f} boe/d")
         if fm.get("total_eur_mmboe"):
-            print(f"   EUR:  {fm['total_eur_mmboe']:.2f} MMboe")
+            lines.append(f"   EUR:  {fm['total_eur_mmboe']:.2f} MMboe")
         if fm.get("critical_flag_count"):
-            print(f"   ⚠️  Critical flags: {fm['critical_flag_count']}")
+            lines.append(f"   ⚠️  Critical flags: {fm['critical_flag_count']}")
         paths = result.get("output_paths", {})
         if paths.get("md_report"):
-            print(f"\n   Report:    {paths['md_report']}")
+            lines.append(f"\n   Report:    {paths['md_report']}")
         if paths.get("html_dashboard"):
-            print(f"   Dashboard: {paths['html_dashboard']}")
-    print()
+            lines.append(f"   Dashboard: {paths['html_dashboard']}")
+    sys.stdout.write("\n".join(lines) + "\n\n")
+    sys.stdout.flush()
 
 
 class _FallbackLLM:
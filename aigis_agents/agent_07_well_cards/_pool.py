@@ -0,0 +1,35 @@
+"""
+Process pools for Agent 07's fleet-level fan-out (DCA fits, card
+preparation, chart rendering).
+
+Pools are sized to the work (never more workers than jobs) and start their
+workers with forkserver where available, else spawn. Agent 07 usually runs
+inside AgentBase.ainvoke(), whose asyncio.to_thread loads leave the process
+multi-threaded; forking from there can deadlock on a lock held by another
+thread (and warns on Python 3.12+). Jobs and worker functions must
+therefore be picklable module-level objects.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+# Below this many wells, fleet DCA fits and card preparation run serially;
+# worker start-up costs more than it saves
+PARALLEL_MIN_WELLS = 8
+
+_MP_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+
+def pool_size(max_workers: int | None, n_jobs: int) -> int:
+    """Worker count: max_workers (None → os.cpu_count()), capped at n_jobs."""
+    return max(1, min(max_workers or os.cpu_count() or 1, n_jobs))
+
+
+def process_pool(workers: int) -> ProcessPoolExecutor:
+    """ProcessPoolExecutor with *workers* workers and the non-fork start method."""
+    return ProcessPoolExecutor(max_workers=workers, mp_context=_MP_CONTEXT)
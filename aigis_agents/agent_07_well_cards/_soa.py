@@ -0,0 +1,81 @@
+"""
+Structure-of-arrays view over Agent 07 well cards.
+
+Well cards are returned to callers as a list of dicts, but the fleet-level
+chart, dashboard and report builders only read one or two fields per card
+across every well. build_soa() walks the cards once and returns column
+arrays so those consumers can sort, colour and aggregate with NumPy indexing
+instead of repeated nested dict lookups.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from aigis_agents.agent_07_well_cards.rag_classifier import GREEN, AMBER, RED, BLACK
+
+# RAG status → int8 code (also the report ordering: GREEN first, BLACK last)
+RAG_STATUSES: tuple[str, ...] = (GREEN, AMBER, RED, BLACK)
+RAG_CODES: dict[str, int] = {s: i for i, s in enumerate(RAG_STATUSES)}
+
+
+def build_soa(well_cards: list[dict]) -> dict[str, np.ndarray]:
+    """
+    Build a column view of the fleet's well cards.
+
+    Returns:
+        {
+          "names":          object array of well names,
+          "rag":            int8 RAG codes (index into RAG_STATUSES),
+          "rate":           float64 current rate boe/d (missing → 0),
+          "eur":            float64 DCA EUR MMboe (missing → NaN),
+          "cpr_2p":         float64 CPR 2P EUR MMboe (missing → NaN),
+          "eur_vs_cpr_pct": float64 DCA vs CPR 2P variance % (missing → NaN),
+        }
+        Row i of every array corresponds to well_cards[i].
+    """
+    n = len(well_cards)
+    names          = np.empty(n, dtype=object)
+    rag            = np.empty(n, dtype=np.int8)
+    rate           = np.zeros(n, dtype=np.float64)
+    eur            = np.full(n, np.nan)
+    cpr_2p         = np.full(n, np.nan)
+    eur_vs_cpr_pct = np.full(n, np.nan)
+
+    black = RAG_CODES[BLACK]
+    for i, card in enumerate(well_cards):
+        dc  = card.get("decline_curve") or {}
+        res = card.get("_reserve_estimates") or card.get("reserve_estimates") or {}
+
+        names[i] = card.get("well_name", "?")
+        rag[i]   = RAG_CODES.get(card.get("rag_status", GREEN), black)
+        rate[i]  = (card.get("metrics") or {}).get("current_rate_boepd") or 0.0
+
+        v = dc.get("eur_mmboe")
+        if v is not None:
+            eur[i] = v
+        v = res.get("2P")
+        if v is not None:
+            cpr_2p[i] = v
+        v = dc.get("eur_vs_cpr_2p_pct")
+        if v is not None:
+            eur_vs_cpr_pct[i] = v
+
+    return {
+        "names":          names,
+        "rag":            rag,
+        "rate":           rate,
+        "eur":            eur,
+        "cpr_2p":         cpr_2p,
+        "eur_vs_cpr_pct": eur_vs_cpr_pct,
+    }
+
+
+def rate_order(soa: dict[str, np.ndarray]) -> np.ndarray:
+    """Indices that sort the fleet by current rate, highest first (stable)."""
+    return np.argsort(-soa["rate"], kind="stable")
+
+
+def rag_order(soa: dict[str, np.ndarray]) -> np.ndarray:
+    """Indices that sort the fleet GREEN → AMBER → RED → BLACK (stable)."""
+    return np.argsort(soa["rag"], kind="stable")
@@ -85,62 +85,53 @@ class Agent07(AgentBase):
             Path(charts_dir).mkdir(parents=True, exist_ok=True)
 
         # ── Load well list ────────────────────────────────────────────────────
-        from aigis_agents.agent_07_well_cards.production_processor import load_well_names
-
-        if well_name:
-            well_names = [well_name]
-        else:
-            well_names = load_well_names(deal_id, output_dir)
-
-        if not well_names:
-            log.warning("Agent07: no wells found for deal %s", deal_id)
-            return {
-                "deal_id":   deal_id,
-                "status":    "no_data",
-                "error":     "No wells found in production_series for this deal_id",
-                "well_cards": [],
-            }
-
-        log.info("Agent07: processing %d well(s) for deal %s", len(well_names), deal_id)
-
-        # ── Build well cards ──────────────────────────────────────────────────
-        from aigis_agents.agent_07_well_cards.well_card_builder import build_well_card
-
-        well_cards: list[dict] = []
-        for wn in well_names:
-            log.info("Agent07: building card for well %s", wn)
-            try:
-                card = build_well_card(
-                    deal_id              = deal_id,
-                    well_name            = wn,
-                    main_llm             = main_llm,
-                    dk_context           = dk_context,
-                    entity_context       = entity_context,
-                    patterns             = patterns,
-                    output_dir           = output_dir,
-                    downtime_treatment   = downtime_treatment,
-                    default_uptime_pct   = default_uptime_pct,
-                    forecast_case        = forecast_case,
-                    economic_limit_boepd = economic_limit_boepd,
-                    projection_years     = projection_years,
-                    charts_dir           = charts_dir if mode == "standalone" else None,
-                    generate_charts      = (mode == "standalone"),
-                )
-                well_cards.append(card)
-            except Exception as exc:
-                log.error("Agent07: failed to build card for %s: %s", wn, exc)
-                well_cards.append({
+        from aigis_agents.agent_07_well_cards.production_processor import (
+            close_connections,
+            load_well_names,
+        )
+
+        # Cached read handles (each with a 256 MB mmap) must not outlive the
+        # run, whether it returns early or the build raises
+        try:
+            if well_name:
+                well_names = [well_name]
+            else:
+                well_names = load_well_names(deal_id, output_dir)
+
+            if not well_names:
+                log.warning("Agent07: no wells found for deal %s", deal_id)
+                return {
                     "deal_id":   deal_id,
-                    "well_name": wn,
-                    "rag_status": "BLACK",
-                    "rag_label":  "Error — card generation failed",
-                    "rag_emoji":  "⚫",
-                    "flags":     [f"Card generation error: {exc}"],
-                    "narrative":  "",
-                    "metrics":    {},
-                    "decline_curve": {},
-                    "data_quality": {"months_of_data": 0, "completeness_pct": 0},
-                })
+                    "status":    "no_data",
+                    "error":     "No wells found in production_series for this deal_id",
+                    "well_cards": [],
+                }
+
+            log.info("Agent07: processing %d well(s) for deal %s", len(well_names), deal_id)
+
+            # ── Build well cards ──────────────────────────────────────────────
+            from aigis_agents.agent_07_well_cards.well_card_builder import build_well_cards_bulk
+
+            # Fleet runs preload every well's rows in one query per table, then
+            # send the narrative prompts to the LLM as one batch
+            well_cards = build_well_cards_bulk(
+                deal_id              = deal_id,
+                well_names           = well_names,
+                main_llm             = main_llm,
+                dk_context           = dk_context,
+                entity_context       = entity_context,
+                patterns             = patterns,
+                output_dir           = output_dir,
+                downtime_treatment   = downtime_treatment,
+                default_uptime_pct   = default_uptime_pct,
+                forecast_case        = forecast_case,
+                economic_limit_boepd = economic_limit_boepd,
+                projection_years     = projection_years,
+                charts_dir           = charts_dir if mode == "standalone" else None,
+                generate_charts      = (mode == "standalone"),
+            )
+        finally:
+            close_connections()
 
         # ── Single-well mode: return card directly ────────────────────────────
         if well_name:
@@ -159,14 +150,18 @@ class Agent07(AgentBase):
         output_paths: dict = {}
 
         if mode == "standalone":
+            # Column view shared by the chart, dashboard and report builders
+            from aigis_agents.agent_07_well_cards._soa import build_soa
+            soa = build_soa(well_cards)
+
             # Fleet summary chart
             try:
                 from aigis_agents.agent_07_well_cards.chart_generator import (
                     generate_fleet_summary_chart,
                     generate_fleet_dashboard,
                 )
-                generate_fleet_summary_chart(well_cards, fleet_chart)
-                generate_fleet_dashboard(well_cards, dash_path, deal_name=deal_name)
+                generate_fleet_summary_chart(well_cards, fleet_chart, soa=soa)
+                generate_fleet_dashboard(well_cards, dash_path, deal_name=deal_name, soa=soa)
             except Exception as exc:
                 log.warning("Agent07: chart/dashboard generation failed: %s", exc)
 
@@ -185,6 +180,7 @@ class Agent07(AgentBase):
                     forecast_case        = forecast_case,
                     economic_limit_boepd = economic_limit_boepd,
                     projection_years     = projection_years,
+                    soa                  = soa,
                 )
             except Exception as exc:
                 log.error("Agent07: report generation failed: %s", exc)
@@ -230,7 +226,9 @@ class Agent07(AgentBase):
                 "critical_flag_count":       fleet_stats.get("critical_flag_count", 0),
                 "weighted_decline_rate_pct": fleet_stats.get("weighted_decline_rate_pct"),
             },
-            "well_cards":    well_cards,
+            # Internal keys (per-well history, raw reserves) served the charts
+            # and report above; the returned payload carries public fields only
+            "well_cards":    [_public_card(c) for c in well_cards],
             "output_paths":  output_paths,
             "_deal_context_section": deal_context_section,
         }
@@ -238,6 +236,11 @@ class Agent07(AgentBase):
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
 
+def _public_card(card: dict) -> dict:
+    """Card without its "_"-prefixed internal keys."""
+    return {k: v for k, v in card.items() if not k.startswith("_")}
+
+
 def _single_well_result(
     card: dict,
     deal_id: str,
@@ -246,7 +249,7 @@ def _single_well_result(
     deal_context: str,
 ) -> dict:
     """Strip internal keys and build the single-well return dict."""
-    result = {k: v for k, v in card.items() if not k.startswith("_")}
+    result = _public_card(card)
     result["deal_id"]   = deal_id
     result["well_name"] = well_name
 
@@ -11,11 +11,17 @@ matplotlib is not installed (charts are skipped with a warning flag).
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
 import os
+import threading
+from concurrent.futures import Future
 from pathlib import Path
 from typing import Any
 
+from aigis_agents.agent_07_well_cards.rag_classifier import RAG_EMOJI
+
 log = logging.getLogger(__name__)
 
 # ── Aigis dark theme palette ──────────────────────────────────────────────────
@@ -42,6 +48,67 @@ _RAG_COLOURS = {
     "BLACK": "#8b949e",
 }
 
+# PNG encoder settings (Agg → Pillow). The dark palette has large flat regions,
+# so low zlib levels cost little in file size but save most of the encode time.
+_PNG_PIL_KWARGS       = {"compress_level": 3, "optimize": False}
+_PNG_PIL_KWARGS_FLEET = {"compress_level": 1, "optimize": False}
+
+_EMPTY: dict = {}   # shared read-only default for missing forecast periods
+
+# Default raster resolution for PNG charts (on-screen / MD embedding)
+_DEFAULT_DPI = 90
+
+# Lazily-imported plotting modules (resolved once per process)
+_MPL:    tuple | None = None
+_PLOTLY: tuple | None = None
+_project_decline_curve = None
+
+# Minimum batch size before generate_well_charts() fans out to worker processes
+_PARALLEL_MIN_JOBS = 4
+
+# Per-thread reusable per-well figure (see _get_well_figure)
+_WELL_FIG = threading.local()
+
+
+def _lazy_mpl() -> tuple:
+    """Return (pyplot, ticker, numpy), importing matplotlib with the Agg backend on first use."""
+    global _MPL
+    if _MPL is None:
+        import matplotlib
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+        import matplotlib.ticker as mticker
+        import numpy as np
+        _MPL = (plt, mticker, np)
+    return _MPL
+
+
+def _lazy_plotly() -> tuple:
+    """Return (plotly.graph_objects, make_subplots, numpy), importing on first use."""
+    global _PLOTLY
+    if _PLOTLY is None:
+        import plotly.graph_objects as go
+        from plotly.subplots import make_subplots
+        import numpy as np
+        _PLOTLY = (go, make_subplots, np)
+    return _PLOTLY
+
+
+def _lazy_project_decline_curve():
+    """Return dca_engine.project_decline_curve, bound on first use."""
+    global _project_decline_curve
+    if _project_decline_curve is None:
+        from aigis_agents.agent_07_well_cards.dca_engine import project_decline_curve
+        _project_decline_curve = project_decline_curve
+    return _project_decline_curve
+
+
+def _rag_palette():
+    """RAG colours as an array indexable by the int8 codes in _soa.build_soa()."""
+    import numpy as np
+    from aigis_agents.agent_07_well_cards._soa import RAG_STATUSES
+    return np.array([_RAG_COLOURS[s] for s in RAG_STATUSES], dtype=object)
+
 
 # ── Per-well matplotlib chart ─────────────────────────────────────────────────
 
@@ -52,6 +119,8 @@ def generate_well_chart(
     forecast_data:  dict[str, dict],     # {period_str: {"boe_boepd": float}} CPR forecast
     rag_status:     str,
     output_path:    str,
+    dpi:            int  = _DEFAULT_DPI,
+    force:          bool = False,
 ) -> str | None:
     """
     Render a 3-panel production chart for a single well and save to output_path.
@@ -61,15 +130,16 @@ def generate_well_chart(
                          + CPR forecast dashed (purple)
     Panel 2 (mid, 25%): GOR trend (scf/stb) + 20% and 40% rise threshold bands
     Panel 3 (bot, 25%): Water cut (%) + 8 ppt and 15 ppt rise threshold bands
+    Panels 2/3 are hidden when the well has no GOR / water-cut data; with
+    neither, Panel 1 fills the figure.
+
+    Rendering is skipped when output_path exists and its .hash sidecar matches
+    the inputs (pass force=True to always re-render). Use dpi=120+ for print.
 
     Returns the saved file path, or None if matplotlib unavailable / data insufficient.
     """
     try:
-        import matplotlib
-        matplotlib.use("Agg")
-        import matplotlib.pyplot as plt
-        import matplotlib.ticker as mticker
-        import numpy as np
+        _, mticker, np = _lazy_mpl()
     except ImportError:
         log.warning("matplotlib not installed — skipping per-well chart for %s", well_name)
         return None
@@ -78,56 +148,97 @@ def generate_well_chart(
         log.debug("No production periods for %s — skipping chart", well_name)
         return None
 
-    # ── Build time axis ───────────────────────────────────────────────────────
-    labels    = [p["period"] for p in periods]
-    n         = len(labels)
-    x_idx     = np.arange(n)
+    fingerprint = _chart_fingerprint(well_name, periods, dca_result, forecast_data, rag_status, dpi)
+    if not force and _chart_is_fresh(output_path, fingerprint):
+        log.debug("Well chart up to date — skipping render: %s", output_path)
+        return output_path
 
-    oil_vals  = np.array([p.get("oil_norm",   p.get("oil_bopd",   0.0) or 0.0) for p in periods])
-    gas_vals  = np.array([p.get("gas_norm",   p.get("gas_boe",    0.0) or 0.0) for p in periods])
-    wat_vals  = np.array([p.get("water_norm", p.get("water_boe",  0.0) or 0.0) for p in periods])
-    boe_vals  = np.array([p.get("boe_norm",   p.get("boe_boepd",  0.0) or 0.0) for p in periods])
-    gor_vals  = np.array([p.get("gor_scf_stb", None) for p in periods], dtype=object)
-    wc_vals   = np.array([p.get("wc_pct",      None) for p in periods], dtype=object)
-
-    # ── CPR forecast on Panel 1 ───────────────────────────────────────────────
-    forecast_boe = []
-    for lbl in labels:
-        fd = forecast_data.get(lbl, {})
-        forecast_boe.append(fd.get("boe_boepd") or fd.get("boe_norm"))
-    forecast_arr = np.array(forecast_boe, dtype=float)
-    has_forecast = not np.all(np.isnan(forecast_arr))
+    # ── Build time axis + series (single pass over periods) ──────────────────
+    n         = len(periods)
+    labels    = [""] * n
+    x_idx     = np.arange(n)
+    _nan      = np.nan
+
+    oil_vals     = np.empty(n)
+    gas_vals     = np.empty(n)
+    wat_vals     = np.empty(n)
+    boe_vals     = np.empty(n)
+    gor_numeric  = np.empty(n)
+    wc_numeric   = np.empty(n)
+    forecast_arr = np.empty(n)   # CPR forecast on Panel 1
+
+    fc_get = forecast_data.get
+    has_forecast = False
+    # Panel 2/3 summary stats accumulated in the same pass (no nanmean/nanmax rescans)
+    gor_sum, gor_count = 0.0, 0
+    wc_max = -np.inf
+    for i, p in enumerate(periods):
+        get = p.get
+        lbl = p["period"]
+        labels[i] = lbl
+
+        v = get("oil_norm")
+        oil_vals[i] = v if v is not None else (get("oil_bopd") or 0.0)
+        v = get("gas_norm")
+        gas_vals[i] = v if v is not None else (get("gas_boe") or 0.0)
+        v = get("water_norm")
+        wat_vals[i] = v if v is not None else (get("water_boe") or 0.0)
+        v = get("boe_norm")
+        boe_vals[i] = v if v is not None else (get("boe_boepd") or 0.0)
+
+        v = get("gor_scf_stb")
+        if v is None or v != v:     # None or NaN
+            gor_numeric[i] = _nan
+        else:
+            gor_numeric[i] = v
+            gor_sum += v
+            gor_count += 1
+        v = get("wc_pct")
+        if v is None or v != v:
+            wc_numeric[i] = _nan
+        else:
+            wc_numeric[i] = v
+            if v > wc_max:
+                wc_max = v
+
+        fd = fc_get(lbl) or _EMPTY
+        v = fd.get("boe_boepd") or fd.get("boe_norm")
+        if v is None:
+            forecast_arr[i] = _nan
+        else:
+            forecast_arr[i] = v
+            has_forecast = True
+
+    has_gor = gor_count > 0
+    has_wc  = wc_max > -np.inf
+
+    # Stack base for the water bars
+    oil_gas = np.empty_like(oil_vals)
+    np.add(oil_vals, gas_vals, out=oil_gas)
 
     # ── DCA overlay on Panel 1 ────────────────────────────────────────────────
     dca_x = dca_y = None
     if dca_result is not None and dca_result.curve_type not in ("insufficient_data", "failed"):
         try:
-            from aigis_agents.agent_07_well_cards.dca_engine import project_decline_curve
             proj_months = 60
-            t_raw, q_raw = project_decline_curve(dca_result, months_ahead=n + proj_months)
+            t_raw, q_raw = _lazy_project_decline_curve()(dca_result, months_ahead=n + proj_months)
             dca_x = t_raw
             dca_y = q_raw
         except Exception as exc:
             log.debug("DCA projection failed: %s", exc)
 
-    # ── Figure setup ──────────────────────────────────────────────────────────
-    fig = plt.figure(figsize=(10, 8), facecolor=_BG)
-    gs  = fig.add_gridspec(4, 1, hspace=0.45)
-    ax1 = fig.add_subplot(gs[:2, 0])   # Panel 1 — 50%
-    ax2 = fig.add_subplot(gs[2,  0])   # Panel 2 — 25%
-    ax3 = fig.add_subplot(gs[3,  0])   # Panel 3 — 25%
+    # ── Figure setup (reused across wells; axes cleared per render) ──────────
+    fig, ax1, ax2, ax3 = _get_well_figure()
+
+    # Production panel takes the full height when neither trend panel has data
+    gs = ax1.get_subplotspec().get_gridspec()
+    ax1.set_subplotspec(gs[:2, 0] if (has_gor or has_wc) else gs[:, 0])
 
     rag_colour = _RAG_COLOURS.get(rag_status, _MUTED)
 
-    for ax in (ax1, ax2, ax3):
-        ax.set_facecolor(_SURFACE)
-        ax.tick_params(colors=_MUTED, labelsize=8)
-        ax.spines[:].set_color(_BORDER)
-        for spine in ax.spines.values():
-            spine.set_linewidth(0.8)
-        ax.xaxis.label.set_color(_MUTED)
-        ax.yaxis.label.set_color(_MUTED)
-        ax.title.set_color(_TEXT)
+    _style_axis(ax1)
+    _style_axis(ax2)
+    _style_axis(ax3)
 
     fig.suptitle(
         f"{well_name}  |  {rag_status}",
@@ -139,7 +250,7 @@ def generate_well_chart(
     ax1.bar(x_idx, oil_vals, bar_w, label="Oil (boe/d)", color=_COL_OIL,  alpha=0.85)
     ax1.bar(x_idx, gas_vals, bar_w, label="Gas (boe/d)", color=_COL_GAS,  alpha=0.80, bottom=oil_vals)
     ax1.bar(x_idx, wat_vals, bar_w, label="Water (boe/d)", color=_COL_WATER, alpha=0.65,
-            bottom=oil_vals + gas_vals)
+            bottom=oil_gas)
     ax1.plot(x_idx, boe_vals, color=_COL_BOE, linewidth=1.8, label="Total BOE/d", zorder=5)
 
     if has_forecast:
@@ -161,53 +272,196 @@ def generate_well_chart(
     # Separator at last historical period
     ax1.axvline(n - 1, color=_MUTED, linewidth=0.8, linestyle=":")
 
-    # ── Panel 2: GOR trend ────────────────────────────────────────────────────
-    gor_numeric = np.array([v if v is not None else np.nan for v in gor_vals], dtype=float)
-    ax2.plot(x_idx, gor_numeric, color=_COL_GOR, linewidth=1.5, label="GOR (scf/stb)")
-    ax2.fill_between(x_idx, gor_numeric, alpha=0.15, color=_COL_GOR)
+    # ── Panel 2: GOR trend (hidden when the well reports no GOR) ─────────────
+    ax2.set_visible(has_gor)
+    if has_gor:
+        ax2.plot(x_idx, gor_numeric, color=_COL_GOR, linewidth=1.5, label="GOR (scf/stb)")
+        ax2.fill_between(x_idx, gor_numeric, alpha=0.15, color=_COL_GOR)
 
-    # Threshold bands (relative — draw as flat reference lines for anomaly context)
-    if not np.all(np.isnan(gor_numeric)):
-        gor_mean = float(np.nanmean(gor_numeric))
+        # Threshold bands (relative — draw as flat reference lines for anomaly context)
+        gor_mean = gor_sum / gor_count
         ax2.axhline(gor_mean * 1.20, color=_RAG_COLOURS["AMBER"], linewidth=0.8,
                     linestyle="--", alpha=0.7, label="+20% from mean (AMBER)")
         ax2.axhline(gor_mean * 1.40, color=_RAG_COLOURS["RED"], linewidth=0.8,
                     linestyle="--", alpha=0.7, label="+40% from mean (RED)")
 
-    ax2.set_ylabel("GOR scf/stb", fontsize=9)
-    ax2.set_title("Gas-Oil Ratio Trend", fontsize=9, pad=4)
-    _set_xticks(ax2, labels, x_idx)
-    ax2.legend(fontsize=6, facecolor=_SURFACE, edgecolor=_BORDER,
-               labelcolor=_TEXT, loc="upper left", ncol=2)
+        ax2.set_ylabel("GOR scf/stb", fontsize=9)
+        ax2.set_title("Gas-Oil Ratio Trend", fontsize=9, pad=4)
+        _set_xticks(ax2, labels, x_idx)
+        ax2.legend(fontsize=6, facecolor=_SURFACE, edgecolor=_BORDER,
+                   labelcolor=_TEXT, loc="upper left", ncol=2)
 
-    # ── Panel 3: Water cut ────────────────────────────────────────────────────
-    wc_numeric = np.array([v if v is not None else np.nan for v in wc_vals], dtype=float)
-    ax3.plot(x_idx, wc_numeric, color=_COL_WC, linewidth=1.5, label="WC %")
-    ax3.fill_between(x_idx, wc_numeric, alpha=0.15, color=_COL_WC)
-    ax3.set_ylim(0, max(100.0, float(np.nanmax(wc_numeric)) * 1.15) if not np.all(np.isnan(wc_numeric)) else 100)
+    # ── Panel 3: Water cut (hidden when the well reports no water cut) ───────
+    ax3.set_visible(has_wc)
+    if has_wc:
+        ax3.plot(x_idx, wc_numeric, color=_COL_WC, linewidth=1.5, label="WC %")
+        ax3.fill_between(x_idx, wc_numeric, alpha=0.15, color=_COL_WC)
+        ax3.set_ylim(0, max(100.0, float(wc_max) * 1.15))
 
-    ax3.set_ylabel("Water cut %", fontsize=9)
-    ax3.set_title("Water Cut Trend", fontsize=9, pad=4)
-    _set_xticks(ax3, labels, x_idx)
+        ax3.set_ylabel("Water cut %", fontsize=9)
+        ax3.set_title("Water Cut Trend", fontsize=9, pad=4)
+        _set_xticks(ax3, labels, x_idx)
 
     # Save
     Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-    fig.savefig(output_path, dpi=120, bbox_inches="tight", facecolor=_BG)
-    plt.close(fig)
+    fig.savefig(output_path, dpi=dpi, facecolor=_BG,
+                pil_kwargs=_PNG_PIL_KWARGS)
+    _write_chart_fingerprint(output_path, fingerprint)
     log.info("Saved well chart: %s", output_path)
     return output_path
 
 
+def generate_well_charts(
+    jobs: list[tuple],
+    max_workers: int | None = None,
+) -> list[str | None]:
+    """
+    Render many per-well charts, in parallel across processes for larger fleets.
+
+    Each job is the positional argument tuple for generate_well_chart()
+    (well_name, periods, dca_result, forecast_data, rag_status, output_path
+    [, dpi, force]); every job must write to a distinct output_path.
+    Fleets smaller than _PARALLEL_MIN_JOBS render serially, where worker
+    start-up would cost more than it saves.
+
+    Returns output paths (None where a chart was skipped or failed), in job order.
+    """
+    if len(jobs) < _PARALLEL_MIN_JOBS or max_workers == 1:
+        return _render_serial(jobs)
+
+    from aigis_agents.agent_07_well_cards._pool import pool_size, process_pool
+
+    with process_pool(pool_size(max_workers, len(jobs))) as ex:
+        return list(ex.map(_render_one, jobs))
+
+
+def submit_well_charts(
+    jobs: list[tuple],
+    max_workers: int | None = None,
+) -> Future:
+    """
+    Start generate_well_charts(jobs, max_workers) in the background.
+
+    Returns a Future for the same result list, so the caller can overlap
+    rendering with other work (e.g. LLM calls) and collect the paths later.
+    Small fleets render serially on one background thread. For larger fleets
+    the jobs are submitted to a process pool here, on the calling thread; one
+    background thread then gathers their results and shuts the pool down.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    runner = ThreadPoolExecutor(max_workers=1, thread_name_prefix="well-charts")
+    if len(jobs) < _PARALLEL_MIN_JOBS or max_workers == 1:
+        future = runner.submit(_render_serial, jobs)
+    else:
+        from aigis_agents.agent_07_well_cards._pool import pool_size, process_pool
+
+        ex = process_pool(pool_size(max_workers, len(jobs)))
+        results = ex.map(_render_one, jobs)   # submits (and starts workers) now
+
+        def _collect() -> list[str | None]:
+            try:
+                return list(results)
+            finally:
+                ex.shutdown()
+
+        future = runner.submit(_collect)
+    runner.shutdown(wait=False)
+    return future
+
+
+def _render_one(job: tuple) -> str | None:
+    """Process-pool worker: render one chart, logging rather than raising on failure."""
+    try:
+        return generate_well_chart(*job)
+    except Exception as exc:
+        log.warning("Chart generation failed for %s: %s", job[0] if job else "?", exc)
+        return None
+
+
+def _get_well_figure() -> tuple:
+    """
+    Return this thread's reusable (fig, ax1, ax2, ax3) for per-well charts.
+
+    Figure/axes construction is the most expensive part of a render, so the
+    3-panel layout is built once per thread and its axes are cleared between
+    wells. The Figure is created without pyplot (no global figure manager), so
+    threads rendering concurrently each get their own instance.
+    """
+    cached = getattr(_WELL_FIG, "axes", None)
+    if cached is None:
+        from matplotlib.figure import Figure
+        fig = Figure(figsize=(10, 8), facecolor=_BG)
+        # Fixed margins so savefig renders once (no bbox_inches="tight" measuring pass)
+        gs  = fig.add_gridspec(4, 1, left=0.08, right=0.98, top=0.93, bottom=0.08, hspace=0.45)
+        ax1 = fig.add_subplot(gs[:2, 0])   # Panel 1 — 50%
+        ax2 = fig.add_subplot(gs[2,  0])   # Panel 2 — 25%
+        ax3 = fig.add_subplot(gs[3,  0])   # Panel 3 — 25%
+        cached = _WELL_FIG.axes = (fig, ax1, ax2, ax3)
+    else:
+        for ax in cached[1:]:
+            ax.clear()
+    return cached
+
+
+def _render_serial(jobs: list[tuple]) -> list[str | None]:
+    """Render *jobs* on this thread, then release its reusable figure."""
+    try:
+        return [_render_one(job) for job in jobs]
+    finally:
+        _WELL_FIG.axes = None
+
+
+def _style_axis(ax: Any) -> None:
+    """Apply the dark Aigis theme to a per-well chart panel."""
+    ax.set_facecolor(_SURFACE)
+    ax.tick_params(colors=_MUTED, labelsize=8)
+    ax.spines[:].set(color=_BORDER, linewidth=0.8)
+    ax.xaxis.label.set_color(_MUTED)
+    ax.yaxis.label.set_color(_MUTED)
+    ax.title.set_color(_TEXT)
+
+
 def _set_xticks(ax: Any, labels: list[str], x_idx: Any) -> None:
-    """Show every Nth label so they don't overlap."""
-    import numpy as np
+    """Show every Nth label so they don't overlap (x_idx is the np.arange position array)."""
+    np = _lazy_mpl()[2]
     n = len(labels)
     step = max(1, n // 10)
-    visible = list(range(0, n, step))
-    if (n - 1) not in visible:
-        visible.append(n - 1)
-    ax.set_xticks([x_idx[i] for i in visible])
-    ax.set_xticklabels([labels[i][:7] for i in visible], rotation=45, ha="right", fontsize=7)
+    visible = range(0, n, step)
+    ticks = x_idx[::step]
+    tick_labels = [labels[i][:7] for i in visible]
+    if (n - 1) % step:
+        # Always label the last period
+        ticks = np.append(ticks, x_idx[n - 1])
+        tick_labels.append(labels[n - 1][:7])
+    ax.set_xticks(ticks)
+    ax.set_xticklabels(tick_labels, rotation=45, ha="right", fontsize=7)
+
+
+# ── Render skipping (content fingerprint sidecar) ─────────────────────────────
+
+def _chart_fingerprint(*parts: Any) -> str:
+    """Stable digest of the chart inputs (hash() is salted per process, so use blake2b)."""
+    payload = json.dumps(parts, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _chart_is_fresh(output_path: str, fingerprint: str) -> bool:
+    """True if output_path exists and was rendered from identical inputs."""
+    try:
+        return (
+            os.path.exists(output_path)
+            and Path(output_path + ".hash").read_text(encoding="utf-8") == fingerprint
+        )
+    except OSError:
+        return False
+
+
+def _write_chart_fingerprint(output_path: str, fingerprint: str) -> None:
+    try:
+        Path(output_path + ".hash").write_text(fingerprint, encoding="utf-8")
+    except OSError as exc:
+        log.debug("Could not write chart fingerprint for %s: %s", output_path, exc)
 
 
 # ── Fleet summary matplotlib PNG ─────────────────────────────────────────────
@@ -215,16 +469,20 @@ def _set_xticks(ax: Any, labels: list[str], x_idx: Any) -> None:
 def generate_fleet_summary_chart(
     well_cards: list[dict],
     output_path: str,
+    soa: dict | None = None,
+    dpi: int = _DEFAULT_DPI,
+    force: bool = False,
 ) -> str | None:
     """
     Render a fleet-level summary bar chart (production by well, coloured by RAG status).
     Saved as a PNG for embedding in the MD report.
+
+    soa is the column view from _soa.build_soa(); it is built here when the
+    caller has not already done so. As with generate_well_chart, an unchanged
+    chart is not re-rendered unless force=True.
     """
     try:
-        import matplotlib
-        matplotlib.use("Agg")
-        import matplotlib.pyplot as plt
-        import numpy as np
+        plt, _, np = _lazy_mpl()
     except ImportError:
         log.warning("matplotlib not installed — skipping fleet summary chart")
         return None
@@ -232,16 +490,21 @@ def generate_fleet_summary_chart(
     if not well_cards:
         return None
 
+    from aigis_agents.agent_07_well_cards._soa import build_soa, rate_order
+
+    if soa is None:
+        soa = build_soa(well_cards)
+
     # Sort descending by current rate
-    cards = sorted(
-        well_cards,
-        key=lambda c: c.get("metrics", {}).get("current_rate_boepd", 0),
-        reverse=True,
-    )
-    names   = [c.get("well_name", "?") for c in cards]
-    rates   = [c.get("metrics", {}).get("current_rate_boepd", 0) for c in cards]
-    statuses = [c.get("rag_status", "GREEN") for c in cards]
-    colours  = [_RAG_COLOURS.get(s, _MUTED) for s in statuses]
+    order   = rate_order(soa)
+    names   = soa["names"][order].tolist()
+    rates   = soa["rate"][order]
+    colours = _rag_palette()[soa["rag"][order]].tolist()
+
+    fingerprint = _chart_fingerprint(names, rates.tolist(), colours, dpi)
+    if not force and _chart_is_fresh(output_path, fingerprint):
+        log.debug("Fleet summary chart up to date — skipping render: %s", output_path)
+        return output_path
 
     fig, ax = plt.subplots(figsize=(max(8, len(names) * 0.9), 5), facecolor=_BG)
     ax.set_facecolor(_SURFACE)
@@ -250,13 +513,16 @@ def generate_fleet_summary_chart(
         sp.set_color(_BORDER)
 
     x = np.arange(len(names))
-    bars = ax.bar(x, rates, 0.65, color=colours, alpha=0.90)
+    ax.bar(x, rates, 0.65, color=colours, alpha=0.90)
 
-    # Rate labels
-    for bar, rate in zip(bars, rates):
-        if rate > 0:
-            ax.text(bar.get_x() + bar.get_width() / 2, bar.get_height() + max(rates) * 0.01,
-                    f"{rate:,.0f}", ha="center", va="bottom", fontsize=8, color=_TEXT)
+    # Rate labels — bars are centred on x with height = rate, so place labels
+    # from the arrays directly rather than querying each bar artist
+    max_rate    = float(rates.max()) if rates.size else 0.0
+    text_offset = max_rate * 0.01
+    for i in np.flatnonzero(rates > 0):
+        rate = rates[i]
+        ax.text(x[i], rate + text_offset,
+                f"{rate:,.0f}", ha="center", va="bottom", fontsize=8, color=_TEXT)
 
     ax.set_xticks(x)
     ax.set_xticklabels(names, rotation=45, ha="right", fontsize=9, color=_TEXT)
@@ -271,8 +537,10 @@ def generate_fleet_summary_chart(
 
     fig.tight_layout()
     Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-    fig.savefig(output_path, dpi=120, bbox_inches="tight", facecolor=_BG)
+    fig.savefig(output_path, dpi=dpi, facecolor=_BG,
+                pil_kwargs=_PNG_PIL_KWARGS_FLEET)
     plt.close(fig)
+    _write_chart_fingerprint(output_path, fingerprint)
     log.info("Saved fleet summary chart: %s", output_path)
     return output_path
 
@@ -283,6 +551,7 @@ def generate_fleet_dashboard(
     well_cards: list[dict],
     output_path: str,
     deal_name: str = "",
+    soa: dict | None = None,
 ) -> str | None:
     """
     Generate a Plotly HTML fleet dashboard with 2×2 grid:
@@ -291,12 +560,12 @@ def generate_fleet_dashboard(
       - Bot-left:  Scatter — DCA EUR vs. CPR EUR (colour = RAG)
       - Bot-right: Waterfall — fleet rate by well (descending)
 
+    soa is the column view from _soa.build_soa(); built here if not supplied.
+
     Returns the saved file path, or None if plotly unavailable.
     """
     try:
-        import plotly.graph_objects as go
-        from plotly.subplots import make_subplots
-        import numpy as np
+        go, make_subplots, np = _lazy_plotly()
     except ImportError:
         log.warning("plotly not installed — skipping fleet dashboard")
         return None
@@ -305,15 +574,15 @@ def generate_fleet_dashboard(
         log.debug("No well cards — skipping fleet dashboard")
         return None
 
-    cards = sorted(
-        well_cards,
-        key=lambda c: c.get("metrics", {}).get("current_rate_boepd", 0),
-        reverse=True,
-    )
+    from aigis_agents.agent_07_well_cards._soa import build_soa, rate_order
 
-    # ── Colour map ────────────────────────────────────────────────────────────
-    def _rag_hex(status: str) -> str:
-        return _RAG_COLOURS.get(status, _MUTED)
+    if soa is None:
+        soa = build_soa(well_cards)
+
+    order = rate_order(soa)
+    cards = [well_cards[i] for i in order]
+    # RAG colour per sorted row — shared by the table, overlay, scatter and bars
+    row_colours = _rag_palette()[soa["rag"][order]].tolist()
 
     # ── Build subplot grid ────────────────────────────────────────────────────
     fig = make_subplots(
@@ -332,25 +601,27 @@ def generate_fleet_dashboard(
     table_headers = ["Well", "Rate (boe/d)", "EUR (MMboe)", "vs CPR", "Status", "Top Flag"]
     table_rows: list[list] = [[], [], [], [], [], []]
 
+    app = [r.append for r in table_rows]
     for card in cards:
-        m  = card.get("metrics", {})
-        dc = card.get("decline_curve", {})
+        m   = card.get("metrics") or {}
+        dc  = card.get("decline_curve") or {}
         rag = card.get("rag_status", "GREEN")
-        table_rows[0].append(card.get("well_name", "?"))
-        table_rows[1].append(f"{m.get('current_rate_boepd', 0):,.0f}")
-        table_rows[2].append(f"{dc.get('eur_mmboe', 0):.2f}")
+        app[0](card.get("well_name", "?"))
+        app[1](f"{m.get('current_rate_boepd', 0):,.0f}")
+        app[2](f"{dc.get('eur_mmboe', 0):.2f}")
         eur_vs_cpr = dc.get("eur_vs_cpr_2p_pct")
-        table_rows[3].append(f"{eur_vs_cpr:+.0f}%" if eur_vs_cpr is not None else "N/A")
-        emoji = {"GREEN": "🟢", "AMBER": "🟡", "RED": "🔴", "BLACK": "⚫"}.get(rag, "")
-        table_rows[4].append(f"{emoji} {rag}")
-        flags = card.get("flags", [])
-        top_flag = flags[0][:60] + "…" if flags and len(flags[0]) > 60 else (flags[0] if flags else "")
-        table_rows[5].append(top_flag)
-
-    cell_colours_col = [
-        [_rag_hex(c.get("rag_status", "GREEN")) + "33"] * len(cards)
-        for _ in range(len(table_headers))
-    ]
+        app[3](f"{eur_vs_cpr:+.0f}%" if eur_vs_cpr is not None else "N/A")
+        app[4](f"{RAG_EMOJI.get(rag, '')} {rag}")
+        flags = card.get("flags")
+        if flags:
+            top = flags[0]
+            app[5](top[:60] + "…" if len(top) > 60 else top)
+        else:
+            app[5]("")
+
+    # One tinted RAG colour per row, shared by every column
+    colours_per_row  = [h + "33" for h in row_colours]
+    cell_colours_col = [colours_per_row] * len(table_headers)
 
     fig.add_trace(
         go.Table(
@@ -374,51 +645,49 @@ def generate_fleet_dashboard(
     )
 
     # ── Top-right: Production overlay lines ───────────────────────────────────
-    for card in cards:
+    for card, colour in zip(cards, row_colours):
         hist = card.get("_production_history", [])
         if not hist:
             continue
         periods = [p["period"] for p in hist]
         rates   = [p.get("boe_norm", p.get("boe_boepd", 0)) for p in hist]
-        rag     = card.get("rag_status", "GREEN")
         fig.add_trace(
-            go.Scatter(
+            go.Scattergl(   # WebGL canvas: scales to large fleets without SVG node bloat
                 x=periods, y=rates,
                 mode="lines",
                 name=card.get("well_name", "?"),
-                line=dict(color=_rag_hex(rag), width=1.8),
+                line=dict(color=colour, width=1.8),
                 hovertemplate="%{x}: %{y:,.0f} boe/d<extra>%{fullData.name}</extra>",
             ),
             row=1, col=2,
         )
 
-    # ── Bot-left: EUR scatter ─────────────────────────────────────────────────
-    for card in cards:
-        dc  = card.get("decline_curve", {})
-        eur = dc.get("eur_mmboe")
-        res = card.get("_reserve_estimates", {})
-        cpr = res.get("2P")
-        if eur is None:
-            continue
-        rag  = card.get("rag_status", "GREEN")
-        name = card.get("well_name", "?")
+    # ── Bot-left: EUR scatter (one trace, one point per well with a DCA EUR) ──
+    eur_sorted = soa["eur"][order]
+    has_eur    = ~np.isnan(eur_sorted)
+    if has_eur.any():
+        cpr_sorted = soa["cpr_2p"][order][has_eur]
         fig.add_trace(
             go.Scatter(
-                x=[cpr], y=[eur],
+                x=[None if np.isnan(v) else float(v) for v in cpr_sorted],
+                y=eur_sorted[has_eur].tolist(),
                 mode="markers+text",
-                marker=dict(color=_rag_hex(rag), size=12, line=dict(color="#ffffff33", width=1)),
-                text=[name], textposition="top center",
+                marker=dict(
+                    color=[h for h, keep in zip(row_colours, has_eur) if keep],
+                    size=12, line=dict(color="#ffffff33", width=1),
+                ),
+                text=soa["names"][order][has_eur].tolist(), textposition="top center",
                 textfont=dict(size=9, color="#e6edf3"),
                 showlegend=False,
-                hovertemplate=f"{name}<br>DCA EUR: %{{y:.2f}} MMboe<br>CPR 2P: %{{x:.2f}} MMboe<extra></extra>",
+                hovertemplate="%{text}<br>DCA EUR: %{y:.2f} MMboe<br>CPR 2P: %{x:.2f} MMboe<extra></extra>",
             ),
             row=2, col=1,
         )
 
     # 45° parity line
-    eur_vals = [c.get("decline_curve", {}).get("eur_mmboe", 0) for c in cards if c.get("decline_curve", {}).get("eur_mmboe")]
-    if eur_vals:
-        max_v = max(eur_vals) * 1.2
+    eur_vals = soa["eur"][soa["eur"] > 0]
+    if eur_vals.size:
+        max_v = float(eur_vals.max()) * 1.2
         fig.add_trace(
             go.Scatter(x=[0, max_v], y=[0, max_v], mode="lines",
                        line=dict(dash="dot", color=_MUTED, width=1),
@@ -427,15 +696,14 @@ def generate_fleet_dashboard(
         )
 
     # ── Bot-right: Waterfall bar chart ────────────────────────────────────────
-    names_sorted = [c.get("well_name", "?") for c in cards]
-    oil_r  = [c.get("metrics", {}).get("current_rate_boepd", 0) for c in cards]
-    colors_ = [_rag_hex(c.get("rag_status", "GREEN")) for c in cards]
+    names_sorted = soa["names"][order].tolist()
+    oil_r   = soa["rate"][order].tolist()
 
     fig.add_trace(
         go.Bar(
             x=names_sorted,
             y=oil_r,
-            marker_color=colors_,
+            marker_color=row_colours,
             text=[f"{r:,.0f}" for r in oil_r],
             textposition="outside",
             textfont=dict(size=9, color="#e6edf3"),
@@ -488,6 +756,14 @@ def generate_fleet_dashboard(
     fig.update_yaxes(title_text="boe/d", row=1, col=2)
 
     Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-    fig.write_html(output_path, include_plotlyjs="cdn", full_html=True)
+    fig.write_html(
+        output_path,
+        include_plotlyjs="cdn",
+        include_mathjax=False,
+        full_html=True,
+        validate=False,            # traces are built above from known-good kwargs
+        div_id="aigis-fleet-dashboard",
+        config={"responsive": True, "displaylogo": False},
+    )
     log.info("Saved fleet dashboard: %s", output_path)
     return output_path
@@ -14,21 +14,35 @@ GoM deepwater Miocene benchmarks (used for anomaly detection):
 from __future__ import annotations
 
 import logging
+import math
 from dataclasses import dataclass, field
 
 import numpy as np
 
+from aigis_agents.agent_07_well_cards._pool import PARALLEL_MIN_WELLS, pool_size, process_pool
+
 log = logging.getLogger(__name__)
 
+_SCIPY_AVAILABLE = False
+try:
+    from scipy.optimize import least_squares  # type: ignore[import]
+    _SCIPY_AVAILABLE = True
+except ImportError:
+    least_squares = None
+
 # Minimum data points required to attempt curve fitting
 MIN_DATA_POINTS = 6
 
-# GoM parameter bounds for curve_fit (per-month rates)
+# GoM parameter bounds for the least-squares fits (per-month rates)
 _BOUNDS_HYPERBOLIC = (
-    [0.0,   0.001, 0.05],   # lower: qi, Di/month, b
-    [np.inf, 0.5,  1.0],    # upper: qi, Di/month, b
+    np.array([0.0,   0.001, 0.05]),   # lower: qi, Di/month, b
+    np.array([np.inf, 0.5,  1.0]),    # upper: qi, Di/month, b
 )
 _P0_HYPERBOLIC = None       # auto-set to [qi_first, 0.05, 0.5] at runtime
+_BOUNDS_EXPONENTIAL = (
+    np.array([0.0,    0.0001]),       # lower: qi, Di/month
+    np.array([np.inf, 0.5]),          # upper: qi, Di/month
+)
 
 # Annual decline rate thresholds for secondary flags
 DI_STEEP_AMBER_PCT  = 30.0   # annual %
@@ -38,10 +52,13 @@ B_ANOMALY_THRESHOLD = 0.80   # flag if b > this value
 # R² threshold below which fit is considered unreliable
 R2_POOR_THRESHOLD = 0.70
 
+# Log-linear R² above which a curvature-free history skips the hyperbolic fit
+LOG_LINEAR_R2_SKIP = 0.95
+
 
 # ── Data classes ──────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class DCAResult:
     """Result of decline curve analysis for a single well."""
     curve_type:         str               # "hyperbolic" | "exponential" | "insufficient_data" | "failed"
@@ -55,6 +72,109 @@ class DCAResult:
     insufficient_data:  bool   = False    # True if < MIN_DATA_POINTS
 
 
+# Compact column layout for fleet-wide screening of many DCAResults
+DCA_RESULT_DTYPE = np.dtype([
+    ("qi",  "f4"),    # qi_boepd
+    ("Di",  "f4"),    # Di_annual_pct
+    ("b",   "f4"),    # b_factor
+    ("eur", "f4"),    # eur_mmboe
+    ("r2",  "f4"),    # fit_r2
+])
+
+
+def dca_results_to_array(results: list[DCAResult]) -> np.ndarray:
+    """
+    Pack DCAResults into a DCA_RESULT_DTYPE structured array (row i = results[i]).
+
+    Lets callers screen a fleet with one NumPy expression, e.g.
+    ``arr["b"] > 0.8`` or ``np.argsort(arr["eur"])``. float32 is ample for
+    screening; use the DCAResult objects where full precision matters.
+    """
+    return np.fromiter(
+        ((r.qi_boepd, r.Di_annual_pct, r.b_factor, r.eur_mmboe, r.fit_r2) for r in results),
+        dtype=DCA_RESULT_DTYPE, count=len(results),
+    )
+
+
+# ── Optional Numba kernels ────────────────────────────────────────────────────
+#
+# The least-squares fit evaluates the model and Jacobian hundreds of times per
+# well. When numba is installed these run as fused, allocation-free loops;
+# otherwise the NumPy expressions below are used. Signatures force compilation at import
+# (cached on disk via cache=True). fastmath is limited to flags that keep
+# NaN/inf semantics, so an out-of-domain trial point still yields NaN for the
+# optimiser to reject.
+
+_NUMBA_AVAILABLE = False
+try:
+    from numba import njit  # type: ignore[import]
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    pass
+
+if _NUMBA_AVAILABLE:
+    _FASTMATH = {"nsz", "arcp", "contract", "afn", "reassoc"}
+
+    @njit("void(float64[:], float64, float64, float64, float64[:])",
+          cache=True, fastmath=_FASTMATH)
+    def _arps_hyp_nb(t, qi, Di, b, out):
+        inv_b = 1.0 / b
+        for i in range(t.size):
+            out[i] = qi * np.exp(-np.log1p(b * Di * t[i]) * inv_b)
+
+    @njit("void(float64[:], float64, float64, float64[:])",
+          cache=True, fastmath=_FASTMATH)
+    def _arps_exp_nb(t, qi, Di, out):
+        for i in range(t.size):
+            out[i] = qi * np.exp(-Di * t[i])
+
+    @njit("void(float64[:], float64, float64, float64, float64[:, :])",
+          cache=True, fastmath=_FASTMATH)
+    def _arps_hyp_jac_nb(t, qi, Di, b, out):
+        inv_b = 1.0 / b
+        for i in range(t.size):
+            bDt = b * Di * t[i]
+            u = 1.0 + bDt
+            log_u = np.log1p(bDt)
+            base = np.exp(-log_u * inv_b)
+            q = qi * base
+            out[i, 0] = base
+            out[i, 1] = -q * t[i] / u
+            out[i, 2] = q * (log_u * inv_b * inv_b - Di * t[i] * inv_b / u)
+
+    @njit("void(float64[:], float64, float64, float64[:, :])",
+          cache=True, fastmath=_FASTMATH)
+    def _arps_exp_jac_nb(t, qi, Di, out):
+        for i in range(t.size):
+            e = np.exp(-Di * t[i])
+            out[i, 0] = e
+            out[i, 1] = -qi * t[i] * e
+
+    @njit("UniTuple(float64, 2)(float64[:], float64[:])",
+          cache=True, fastmath=_FASTMATH)
+    def _sse_sst_nb(y, y_hat):
+        n = y.size
+        mean = 0.0
+        for i in range(n):
+            mean += y[i]
+        mean /= n
+        ss_res = 0.0
+        ss_tot = 0.0
+        for i in range(n):
+            r = y[i] - y_hat[i]
+            d = y[i] - mean
+            ss_res += r * r
+            ss_tot += d * d
+        return ss_res, ss_tot
+
+
+def _as_f64_1d(t: np.ndarray) -> np.ndarray | None:
+    """Contiguous float64 view/copy of t for the Numba kernels (None → use NumPy path)."""
+    if not _NUMBA_AVAILABLE or np.ndim(t) != 1:
+        return None
+    return np.ascontiguousarray(t, dtype=np.float64)
+
+
 # ── Arps equations ────────────────────────────────────────────────────────────
 
 def arps_hyperbolic(t: np.ndarray, qi: float, Di: float, b: float) -> np.ndarray:
@@ -69,9 +189,18 @@ def arps_hyperbolic(t: np.ndarray, qi: float, Di: float, b: float) -> np.ndarray
 
     Returns:
         Rate array (boe/d) at each time step.
+
+    Evaluated as qi·exp(−log1p(b·Di·t)/b): log1p/exp vectorise where a general
+    pow() does not, and log1p stays accurate as b·Di·t → 0. b is floored at
+    1e-6 once (a scalar clamp) so b=0 still yields the exponential limit.
     """
     b_safe = max(b, 1e-6)
-    return qi / np.power(1.0 + b_safe * Di * t, 1.0 / b_safe)
+    t64 = _as_f64_1d(t)
+    if t64 is not None:
+        out = np.empty(t64.size)
+        _arps_hyp_nb(t64, float(qi), float(Di), float(b_safe), out)
+        return out
+    return qi * np.exp(-np.log1p(b_safe * Di * t) / b_safe)
 
 
 def arps_exponential(t: np.ndarray, qi: float, Di: float) -> np.ndarray:
@@ -86,9 +215,55 @@ def arps_exponential(t: np.ndarray, qi: float, Di: float) -> np.ndarray:
     Returns:
         Rate array (boe/d) at each time step.
     """
+    t64 = _as_f64_1d(t)
+    if t64 is not None:
+        out = np.empty(t64.size)
+        _arps_exp_nb(t64, float(qi), float(Di), out)
+        return out
     return qi * np.exp(-Di * t)
 
 
+def _arps_hyperbolic_jac(t: np.ndarray, qi: float, Di: float, b: float) -> np.ndarray:
+    """
+    Analytic Jacobian of arps_hyperbolic w.r.t. (qi, Di, b), shape (len(t), 3).
+
+    With u = 1 + b·Di·t and q = qi·u^(−1/b):
+        ∂q/∂qi = q / qi
+        ∂q/∂Di = −q·t / u
+        ∂q/∂b  = q · (ln(u)/b² − Di·t/(b·u))
+    """
+    b_safe = max(b, 1e-6)
+    t64 = _as_f64_1d(t)
+    if t64 is not None:
+        jac = np.empty((t64.size, 3))
+        _arps_hyp_jac_nb(t64, float(qi), float(Di), float(b_safe), jac)
+        return jac
+    bDt = b_safe * Di * t
+    u = 1.0 + bDt
+    log_u = np.log1p(bDt)
+    base = np.exp(-log_u / b_safe)
+    q = qi * base
+    jac = np.empty((t.size, 3))
+    jac[:, 0] = base
+    jac[:, 1] = -q * t / u
+    jac[:, 2] = q * (log_u / (b_safe * b_safe) - Di * t / (b_safe * u))
+    return jac
+
+
+def _arps_exponential_jac(t: np.ndarray, qi: float, Di: float) -> np.ndarray:
+    """Analytic Jacobian of arps_exponential w.r.t. (qi, Di), shape (len(t), 2)."""
+    t64 = _as_f64_1d(t)
+    if t64 is not None:
+        jac = np.empty((t64.size, 2))
+        _arps_exp_jac_nb(t64, float(qi), float(Di), jac)
+        return jac
+    e = np.exp(-Di * t)
+    jac = np.empty((t.size, 2))
+    jac[:, 0] = e
+    jac[:, 1] = -qi * t * e
+    return jac
+
+
 # ── EUR calculation ──────────────────────────────────────────────────────────
 
 def compute_eur(
@@ -97,50 +272,172 @@ def compute_eur(
     b: float,
     economic_limit_boepd: float = 25.0,
     projection_months: int = 240,
-    time_step_months: float = 1.0,
 ) -> float:
     """
-    Compute EUR by numerical integration of the decline curve to abandonment.
+    Compute EUR by integrating the decline curve to abandonment.
 
     Integrates q(t) from t=0 until rate drops below economic_limit OR
     projection_months is reached. Returns EUR in boe (not MMboe — caller converts).
 
-    Uses trapezoid rule with monthly steps.
+    Uses the closed-form Arps integrals: the abandonment time t_ab where
+    q(t_ab) = economic_limit is solved analytically and clamped to
+    projection_months, then
+      hyperbolic (b≠1): qi / ((1-b)·Di) · [1 - (1 + b·Di·t_ab)^((b-1)/b)]
+      harmonic   (b=1): qi / Di · ln(1 + Di·t_ab)
+      exponential:      qi / Di · (1 - exp(-Di·t_ab))
     """
     if qi <= 0 or Di_monthly <= 0:
         return 0.0
+    if economic_limit_boepd >= qi:
+        return 0.0
 
-    t_arr = np.arange(0, projection_months + time_step_months, time_step_months)
-    if b > 1e-4:
-        q_arr = arps_hyperbolic(t_arr, qi, Di_monthly, b)
+    hyperbolic = b > 1e-4
+    t_ab = float(projection_months)
+    if economic_limit_boepd > 0:
+        ratio = qi / economic_limit_boepd
+        if hyperbolic:
+            t_ab = min(t_ab, (ratio ** b - 1.0) / (b * Di_monthly))
+        else:
+            t_ab = min(t_ab, math.log(ratio) / Di_monthly)
+
+    if not hyperbolic:
+        cum = qi / Di_monthly * -math.expm1(-Di_monthly * t_ab)
+    elif abs(b - 1.0) < 1e-9:
+        cum = qi / Di_monthly * math.log1p(Di_monthly * t_ab)
     else:
-        q_arr = arps_exponential(t_arr, qi, Di_monthly)
-
-    # Find abandonment month (first time rate < economic limit)
-    below_limit = np.where(q_arr < economic_limit_boepd)[0]
-    if len(below_limit):
-        cutoff = below_limit[0]
-        t_arr = t_arr[:cutoff + 1]
-        q_arr = q_arr[:cutoff + 1]
+        cum = qi / ((1.0 - b) * Di_monthly) * (1.0 - (1.0 + b * Di_monthly * t_ab) ** ((b - 1.0) / b))
 
     # Convert rate (boe/d) to volume per month (boe/month = rate * 30.44 days)
-    # np.trapezoid is the NumPy 2.0 name (np.trapz was removed in NumPy 2.0)
-    _trapz = getattr(np, "trapezoid", None) or getattr(np, "trapz", None)
-    eur_boe = float(_trapz(q_arr * 30.44, t_arr))   # boe/d * days/month * months = boe
-    return eur_boe
+    return float(cum * 30.44)   # boe/d * days/month * months = boe
 
 
 # ── Coefficient of determination ─────────────────────────────────────────────
 
 def _r_squared(y_actual: np.ndarray, y_predicted: np.ndarray) -> float:
     """Calculate R² between actual and model-predicted values."""
-    ss_res = float(np.sum((y_actual - y_predicted) ** 2))
-    ss_tot = float(np.sum((y_actual - np.mean(y_actual)) ** 2))
+    if _NUMBA_AVAILABLE and np.ndim(y_actual) == 1 and np.size(y_actual) > 0:
+        ss_res, ss_tot = _sse_sst_nb(
+            np.ascontiguousarray(y_actual, dtype=np.float64),
+            np.ascontiguousarray(y_predicted, dtype=np.float64),
+        )
+    else:
+        ss_res = float(np.sum((y_actual - y_predicted) ** 2))
+        ss_tot = float(np.sum((y_actual - np.mean(y_actual)) ** 2))
     if ss_tot < 1e-12:
         return 1.0
     return max(0.0, 1.0 - ss_res / ss_tot)
 
 
+# ── Curve fitting helper ──────────────────────────────────────────────────────
+
+def _residual_fn(model):
+    """Residual r(p) = model(t, *p) - rate for scipy.optimize.least_squares."""
+    def residual(p, t, r):
+        return model(t, *p) - r
+    return residual
+
+
+def _jacobian_fn(jac):
+    """Jacobian callable with least_squares' (p, *args) signature."""
+    def jacobian(p, t, r):
+        return jac(t, *p)
+    return jacobian
+
+
+def _fit_lm_first(model, jac, t, r, p0, bounds, maxfev) -> np.ndarray:
+    """
+    Fit with unbounded Levenberg–Marquardt (MINPACK LMDER), falling back to TRF.
+
+    LM is much cheaper than bounded TRF and, from the GoM starting guesses,
+    usually converges inside the physical bounds anyway. Its result is only
+    accepted when every parameter is finite and within bounds; otherwise
+    (or if LM fails to converge) the bounded TRF fit is run with maxfev.
+
+    Calls least_squares directly rather than through curve_fit, which spends
+    most of a small fit's time on signature inspection and argument wrapping.
+    Raises RuntimeError when TRF does not converge (as curve_fit did).
+    """
+    lo, hi = bounds
+    fun, fjac = _residual_fn(model), _jacobian_fn(jac)
+    p0 = np.asarray(p0, dtype=float)
+    try:
+        # MINPACK's default budget: a fit heading out of bounds is abandoned
+        # quickly rather than spending the full TRF budget wandering.
+        res = least_squares(
+            fun, p0, jac=fjac, method="lm", args=(t, r), max_nfev=100 * (len(p0) + 1),
+        )
+        popt = res.x
+        if not res.success:
+            log.debug("LM fit did not converge (%s); refitting with bounded TRF", res.message)
+        elif np.all(np.isfinite(popt)) and np.all(popt >= lo) and np.all(popt <= hi):
+            return popt
+        else:
+            log.debug("LM fit left bounds (%s); refitting with bounded TRF", popt)
+    except Exception as e:
+        log.debug("LM fit failed (%s); refitting with bounded TRF", e)
+
+    res = least_squares(
+        fun, p0, jac=fjac, bounds=bounds, method="trf", args=(t, r), max_nfev=maxfev,
+    )
+    if not res.success:
+        raise RuntimeError(f"Optimal parameters not found: {res.message}")
+    return res.x
+
+
+def _log_linear_prior(t: np.ndarray, r: np.ndarray) -> tuple[float, float, float, bool]:
+    """
+    Cheap exponential prior from ordinary least squares on ln(rate).
+
+    ln q = ln qi − Di·t is linear, so one polyfit gives starting values for
+    the exponential fit. A quadratic fit of the same data measures curvature:
+    an Arps hyperbolic has d²(ln q)/dt² = b·Di² at t=0, so when even the upper
+    ~95% bound of that curvature implies b below the hyperbolic lower bound
+    (and the straight line explains > LOG_LINEAR_R2_SKIP of the variance) the
+    nonlinear hyperbolic fit cannot improve on exponential and is skipped.
+
+    Returns:
+        (qi_seed, Di_seed, log_r2, exp_clean) — seeds are clipped to
+        _BOUNDS_EXPONENTIAL; exp_clean=True means skip the hyperbolic fit.
+    """
+    lo, hi = _BOUNDS_EXPONENTIAL
+    qi_fallback = float(r[0])
+    try:
+        log_r = np.log(r)
+        slope, intercept = np.polyfit(t, log_r, 1)
+        qi_seed, Di_seed = float(np.exp(intercept)), float(-slope)
+        resid = log_r - (intercept + slope * t)
+        ss_tot = float(np.sum((log_r - log_r.mean()) ** 2))
+        log_r2 = 1.0 - float(np.sum(resid ** 2)) / ss_tot if ss_tot > 1e-12 else 0.0
+
+        exp_clean = False
+        if lo[1] <= Di_seed <= hi[1] and log_r2 > LOG_LINEAR_R2_SKIP:
+            coeffs, cov = np.polyfit(t, log_r, 2, cov=True)
+            curvature_hi = 2.0 * (coeffs[0] + 2.0 * math.sqrt(max(cov[0, 0], 0.0)))
+            exp_clean = curvature_hi / Di_seed ** 2 < _BOUNDS_HYPERBOLIC[0][2]
+    except (ValueError, np.linalg.LinAlgError) as e:
+        log.debug("Log-linear prior failed (%s); using default seeds", e)
+        return qi_fallback, 0.05, 0.0, False
+
+    if not (math.isfinite(qi_seed) and qi_seed > 0):
+        qi_seed = qi_fallback
+    Di_seed = min(max(Di_seed, float(lo[1])), float(hi[1])) if math.isfinite(Di_seed) else 0.05
+    return qi_seed, Di_seed, log_r2, exp_clean
+
+
+def _decline_rate_flags(Di_annual: float) -> list[str]:
+    """Steep-decline anomaly flags for an annual decline rate (percent/yr)."""
+    if Di_annual > DI_STEEP_RED_PCT:
+        return [
+            f"Annual decline {Di_annual:.0f}%/yr is very steep (>50%/yr) — "
+            "verify production data quality; may indicate mechanical issue or choke change"
+        ]
+    if Di_annual > DI_STEEP_AMBER_PCT:
+        return [
+            f"Annual decline {Di_annual:.0f}%/yr is above GoM deepwater typical range (15–25%/yr)"
+        ]
+    return []
+
+
 # ── Main fitting function ─────────────────────────────────────────────────────
 
 def fit_decline_curve(
@@ -153,10 +450,12 @@ def fit_decline_curve(
     Fit multi-segment Arps decline to production history.
 
     Steps:
-      1. Try Arps hyperbolic with GoM-bounded parameters.
-      2. If hyperbolic fails (RuntimeError / poor fit), fall back to exponential.
-      3. Compute EUR by integrating fitted curve to economic limit.
-      4. Generate quality flags (steep decline, anomalous b-factor, poor R²).
+      1. Regress ln(rate) on time; if the trend is straight with no
+         significant curvature, go straight to the exponential fit.
+      2. Otherwise try Arps hyperbolic with GoM-bounded parameters.
+      3. If hyperbolic fails (RuntimeError / poor fit), fall back to exponential.
+      4. Compute EUR by integrating fitted curve to economic limit.
+      5. Generate quality flags (steep decline, anomalous b-factor, poor R²).
 
     Args:
         times:                Month index from first production (0, 1, 2, …).
@@ -191,76 +490,67 @@ def fit_decline_curve(
             flags=[f"Fewer than {MIN_DATA_POINTS} non-zero production months after filtering zeros"],
         )
 
-    projection_months = projection_years * 12
-    initial_rate_guess = float(r_fit[0]) if r_fit[0] > 0 else 100.0
-
-    # ── Attempt hyperbolic fit ────────────────────────────────────────────────
-    try:
-        from scipy.optimize import curve_fit  # type: ignore
-
-        popt, _ = curve_fit(
-            arps_hyperbolic,
-            t_fit,
-            r_fit,
-            p0=[initial_rate_guess, 0.05, 0.5],
-            bounds=_BOUNDS_HYPERBOLIC,
-            maxfev=10_000,
-            method="trf",
+    if not _SCIPY_AVAILABLE:
+        return DCAResult(
+            curve_type="failed",
+            months_of_data=n,
+            flags=["DCA fitting failed: scipy is not installed"],
         )
-        qi, Di_monthly, b = float(popt[0]), float(popt[1]), float(popt[2])
-        y_pred = arps_hyperbolic(t_fit, qi, Di_monthly, b)
-        r2 = _r_squared(r_fit, y_pred)
 
-        if r2 < R2_POOR_THRESHOLD:
-            flags.append(
-                f"Hyperbolic fit R²={r2:.2f} is poor (threshold {R2_POOR_THRESHOLD:.2f}) — "
-                "limited confidence in EUR projection; consider requesting additional production history"
-            )
-
-        # Anomaly flags
-        Di_annual = Di_monthly * 12 * 100  # percent per year
-        if Di_annual > DI_STEEP_RED_PCT:
-            flags.append(
-                f"Annual decline {Di_annual:.0f}%/yr is very steep (>50%/yr) — "
-                "verify production data quality; may indicate mechanical issue or choke change"
-            )
-        elif Di_annual > DI_STEEP_AMBER_PCT:
-            flags.append(
-                f"Annual decline {Di_annual:.0f}%/yr is above GoM deepwater typical range (15–25%/yr)"
+    projection_months = projection_years * 12
+    qi_seed, Di_seed, log_r2, exp_clean = _log_linear_prior(t_fit, r_fit)
+
+    # ── Attempt hyperbolic fit (skipped for a straight log-rate trend) ────────
+    if not exp_clean:
+        try:
+            popt = _fit_lm_first(
+                arps_hyperbolic, _arps_hyperbolic_jac, t_fit, r_fit,
+                p0=[qi_seed, max(Di_seed, float(_BOUNDS_HYPERBOLIC[0][1])), 0.5],
+                bounds=_BOUNDS_HYPERBOLIC,
+                maxfev=10_000,
             )
-
-        if b > B_ANOMALY_THRESHOLD:
-            flags.append(
-                f"b-factor {b:.2f} is anomalously high (>{B_ANOMALY_THRESHOLD}); "
-                "cross-check against stated drive mechanism — expected b=0.3–0.7 for GoM Miocene sands"
+            qi, Di_monthly, b = float(popt[0]), float(popt[1]), float(popt[2])
+            y_pred = arps_hyperbolic(t_fit, qi, Di_monthly, b)
+            r2 = _r_squared(r_fit, y_pred)
+
+            if r2 < R2_POOR_THRESHOLD:
+                flags.append(
+                    f"Hyperbolic fit R²={r2:.2f} is poor (threshold {R2_POOR_THRESHOLD:.2f}) — "
+                    "limited confidence in EUR projection; consider requesting additional production history"
+                )
+
+            # Anomaly flags
+            Di_annual = Di_monthly * 12 * 100  # percent per year
+            flags.extend(_decline_rate_flags(Di_annual))
+
+            if b > B_ANOMALY_THRESHOLD:
+                flags.append(
+                    f"b-factor {b:.2f} is anomalously high (>{B_ANOMALY_THRESHOLD}); "
+                    "cross-check against stated drive mechanism — expected b=0.3–0.7 for GoM Miocene sands"
+                )
+
+            eur_boe = compute_eur(qi, Di_monthly, b, economic_limit_boepd, projection_months)
+
+            return DCAResult(
+                curve_type="hyperbolic",
+                qi_boepd=round(qi, 1),
+                Di_annual_pct=round(Di_annual, 1),
+                b_factor=round(b, 3),
+                eur_mmboe=round(eur_boe / 1e6, 3),
+                fit_r2=round(r2, 3),
+                months_of_data=n,
+                flags=flags,
             )
 
-        eur_boe = compute_eur(qi, Di_monthly, b, economic_limit_boepd, projection_months)
-
-        return DCAResult(
-            curve_type="hyperbolic",
-            qi_boepd=round(qi, 1),
-            Di_annual_pct=round(Di_annual, 1),
-            b_factor=round(b, 3),
-            eur_mmboe=round(eur_boe / 1e6, 3),
-            fit_r2=round(r2, 3),
-            months_of_data=n,
-            flags=flags,
-        )
-
-    except Exception as e:
-        log.debug("Hyperbolic fit failed (%s); attempting exponential fallback", e)
+        except Exception as e:
+            log.debug("Hyperbolic fit failed (%s); attempting exponential fallback", e)
 
     # ── Exponential fallback ──────────────────────────────────────────────────
     try:
-        from scipy.optimize import curve_fit  # type: ignore
-
-        popt_exp, _ = curve_fit(
-            arps_exponential,
-            t_fit,
-            r_fit,
-            p0=[initial_rate_guess, 0.05],
-            bounds=([0.0, 0.0001], [np.inf, 0.5]),
+        popt_exp = _fit_lm_first(
+            arps_exponential, _arps_exponential_jac, t_fit, r_fit,
+            p0=[qi_seed, Di_seed],
+            bounds=_BOUNDS_EXPONENTIAL,
             maxfev=5_000,
         )
         qi_exp, Di_exp = float(popt_exp[0]), float(popt_exp[1])
@@ -270,7 +560,14 @@ def fit_decline_curve(
         Di_annual_exp = Di_exp * 12 * 100
         eur_boe_exp = compute_eur(qi_exp, Di_exp, 0.0, economic_limit_boepd, projection_months)
 
-        flags.append("Hyperbolic fit failed; using exponential decline (conservative EUR estimate)")
+        if exp_clean:
+            log.debug(
+                "Log-rate decline is linear (R²=%.2f, no hyperbolic curvature); "
+                "exponential decline fitted directly", log_r2,
+            )
+        else:
+            flags.append("Hyperbolic fit failed; using exponential decline (conservative EUR estimate)")
+        flags.extend(_decline_rate_flags(Di_annual_exp))
         if r2_exp < R2_POOR_THRESHOLD:
             flags.append(
                 f"Exponential fit R²={r2_exp:.2f} is poor — production history may be non-monotonic"
@@ -296,6 +593,48 @@ def fit_decline_curve(
         )
 
 
+# ── Fleet batch fitting ───────────────────────────────────────────────────────
+
+def fit_all_wells(
+    wells: dict[str, tuple[np.ndarray, np.ndarray]],
+    economic_limit_boepd: float = 25.0,
+    projection_years: int = 20,
+    max_workers: int | None = None,
+) -> dict[str, DCAResult]:
+    """
+    Fit every well's decline curve, in parallel across processes for larger fleets.
+
+    Args:
+        wells:                {well_name: (times, rates)} as passed to fit_decline_curve().
+        economic_limit_boepd: Abandonment rate for EUR calculation.
+        projection_years:     Maximum projection horizon.
+        max_workers:          Process count (None → os.cpu_count(), capped at the
+                              well count; 1 → serial).
+
+    Returns:
+        {well_name: DCAResult} in the input order.
+    """
+    jobs = [(t, r, economic_limit_boepd, projection_years) for t, r in wells.values()]
+    if len(jobs) < PARALLEL_MIN_WELLS or max_workers == 1:
+        return dict(zip(wells, map(_fit_one, jobs)))
+
+    workers = pool_size(max_workers, len(jobs))
+    chunksize = max(1, len(jobs) // (workers * 4))
+    with process_pool(workers) as ex:
+        return dict(zip(wells, ex.map(_fit_one, jobs, chunksize=chunksize)))
+
+
+def _fit_one(job: tuple) -> DCAResult:
+    """Process-pool worker: fit one well (numba kernels load from the on-disk cache)."""
+    times, rates, economic_limit_boepd, projection_years = job
+    return fit_decline_curve(
+        np.asarray(times, dtype=float),
+        np.asarray(rates, dtype=float),
+        economic_limit_boepd=economic_limit_boepd,
+        projection_years=projection_years,
+    )
+
+
 def project_decline_curve(
     dca: DCAResult,
     months_ahead: int = 60,
@@ -8,12 +8,20 @@ and computes secondary metrics (GOR, WC, trend deltas).
 
 from __future__ import annotations
 
+import itertools
 import logging
 import sqlite3
+import sys
+from dataclasses import dataclass, field
 from pathlib import Path
 
 import numpy as np
 
+from aigis_agents.agent_02_data_store.db_manager import (
+    has_monthly_production,
+    has_scalar_fts,
+)
+
 log = logging.getLogger(__name__)
 
 # Default GoM uptime assumption when no VDR data is available
@@ -25,6 +33,11 @@ def _db_path(deal_id: str, output_dir: str | Path) -> Path:
     return Path(output_dir) / deal_id / "02_data_store.db"
 
 
+# Long-lived read-only handles on Agent 02 data stores, shared across wells (LRU order)
+_MAX_CONNS = 8
+_CONNS: dict[tuple[str, int, int], sqlite3.Connection] = {}
+
+
 def _connect(deal_id: str, output_dir: str | Path) -> sqlite3.Connection:
     db = _db_path(deal_id, output_dir)
     if not db.exists():
@@ -32,11 +45,30 @@ def _connect(deal_id: str, output_dir: str | Path) -> sqlite3.Connection:
             f"Agent 02 data store not found at {db}. "
             "Run Agent 02 (ingest_vdr or ingest_file) for this deal before Agent 07."
         )
-    conn = sqlite3.connect(str(db))
-    conn.row_factory = sqlite3.Row
+    # Keyed on the inode too, so a data store rebuilt at the same path gets a fresh handle
+    st = db.stat()
+    key = (str(db), st.st_dev, st.st_ino)
+    conn = _CONNS.pop(key, None)
+    if conn is None:
+        conn = sqlite3.connect(str(db), check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        # Schema upgrades are Agent 02's (ensure_db); stores built before
+        # monthly_production / scalar_fts are read via the pivot / LIKE fallbacks
+        conn.execute("PRAGMA query_only=ON")
+        conn.execute("PRAGMA cache_size=-64000")       # 64 MB page cache
+        conn.execute("PRAGMA mmap_size=268435456")     # 256 MB memory-mapped reads
+        while len(_CONNS) >= _MAX_CONNS:
+            _CONNS.pop(next(iter(_CONNS))).close()
+    _CONNS[key] = conn   # re-insert → most recently used last
     return conn
 
 
+def close_connections() -> None:
+    """Close every cached data store connection (call once a run is finished)."""
+    while _CONNS:
+        _CONNS.popitem()[1].close()
+
+
 def _rows_to_dicts(rows) -> list[dict]:
     return [dict(r) for r in rows]
 
@@ -44,22 +76,47 @@ def _rows_to_dicts(rows) -> list[dict]:
 # ── Well discovery ────────────────────────────────────────────────────────────
 
 def load_well_names(deal_id: str, output_dir: str | Path) -> list[str]:
-    """Return distinct entity_names from production_series for this deal."""
+    """
+    Return distinct entity_names from production_series for this deal.
+
+    Names are interned, as are the well keys of the bulk loaders below, so
+    the per-well lookups into the bulk dicts hit the identity fast path.
+    """
     conn = _connect(deal_id, output_dir)
-    try:
-        rows = conn.execute(
-            "SELECT DISTINCT entity_name FROM production_series "
-            "WHERE deal_id=? AND entity_name IS NOT NULL AND entity_name != '' "
-            "ORDER BY entity_name",
-            (deal_id,),
-        ).fetchall()
-        return [r[0] for r in rows]
-    finally:
-        conn.close()
+    rows = conn.execute(
+        "SELECT DISTINCT entity_name FROM production_series "
+        "WHERE deal_id=? AND entity_name IS NOT NULL AND entity_name != '' "
+        "ORDER BY entity_name",
+        (deal_id,),
+    ).fetchall()
+    return [sys.intern(r[0]) for r in rows]
 
 
 # ── Production series ─────────────────────────────────────────────────────────
 
+_PRODUCTION_COLUMNS = """
+    period_start, period_end, product, value_normalised,
+    unit_normalised, case_name, confidence,
+    source_page, extraction_note
+"""
+
+_RESERVE_COLUMNS = """
+    reserve_class, product, value_normalised, unit_normalised,
+    effective_date, report_date, reserve_engineer,
+    source_section, source_page, confidence
+"""
+
+
+def _group_by_well(rows) -> dict[str, list[dict]]:
+    """Group rows ordered by entity_name into {well_name: [row dicts]} (entity_name dropped)."""
+    grouped: dict[str, list[dict]] = {}
+    for well, group in itertools.groupby(rows, key=lambda r: r["entity_name"]):
+        grouped[sys.intern(well)] = [
+            {k: r[k] for k in r.keys() if k != "entity_name"} for r in group
+        ]
+    return grouped
+
+
 def load_production_series(
     deal_id: str,
     well_name: str,
@@ -73,21 +130,36 @@ def load_production_series(
       period_end, confidence, source_page, extraction_note
     """
     conn = _connect(deal_id, output_dir)
-    try:
-        rows = conn.execute(
-            """
-            SELECT period_start, period_end, product, value_normalised,
-                   unit_normalised, case_name, confidence,
-                   source_page, extraction_note
-            FROM production_series
-            WHERE deal_id=? AND entity_name=?
-            ORDER BY period_start ASC, product ASC
-            """,
-            (deal_id, well_name),
-        ).fetchall()
-        return _rows_to_dicts(rows)
-    finally:
-        conn.close()
+    rows = conn.execute(
+        f"""
+        SELECT {_PRODUCTION_COLUMNS}
+        FROM production_series
+        WHERE deal_id=? AND entity_name=?
+        ORDER BY period_start ASC, product ASC
+        """,
+        (deal_id, well_name),
+    ).fetchall()
+    return _rows_to_dicts(rows)
+
+
+def load_all_production_series(deal_id: str, output_dir: str | Path) -> dict[str, list[dict]]:
+    """
+    Bulk form of load_production_series() for every well in the deal.
+
+    One query instead of one per well; returns {well_name: records} with each
+    well's records in the same order and shape as load_production_series().
+    """
+    conn = _connect(deal_id, output_dir)
+    rows = conn.execute(
+        f"""
+        SELECT entity_name, {_PRODUCTION_COLUMNS}
+        FROM production_series
+        WHERE deal_id=? AND entity_name IS NOT NULL AND entity_name != ''
+        ORDER BY entity_name ASC, period_start ASC, product ASC
+        """,
+        (deal_id,),
+    ).fetchall()
+    return _group_by_well(rows)
 
 
 def load_reserve_estimates(
@@ -102,21 +174,41 @@ def load_reserve_estimates(
     effective_date, report_date, reserve_engineer, source_page.
     """
     conn = _connect(deal_id, output_dir)
-    try:
-        rows = conn.execute(
-            """
-            SELECT reserve_class, product, value_normalised, unit_normalised,
-                   effective_date, report_date, reserve_engineer,
-                   source_section, source_page, confidence
-            FROM reserve_estimates
-            WHERE deal_id=? AND entity_name=?
-            ORDER BY reserve_class ASC
-            """,
-            (deal_id, well_name),
-        ).fetchall()
-        return _rows_to_dicts(rows)
-    finally:
-        conn.close()
+    rows = conn.execute(
+        f"""
+        SELECT {_RESERVE_COLUMNS}
+        FROM reserve_estimates
+        WHERE deal_id=? AND entity_name=?
+        ORDER BY reserve_class ASC
+        """,
+        (deal_id, well_name),
+    ).fetchall()
+    return _rows_to_dicts(rows)
+
+
+def load_all_reserve_estimates(deal_id: str, output_dir: str | Path) -> dict[str, list[dict]]:
+    """Bulk form of load_reserve_estimates(): {well_name: records} in one query."""
+    conn = _connect(deal_id, output_dir)
+    rows = conn.execute(
+        f"""
+        SELECT entity_name, {_RESERVE_COLUMNS}
+        FROM reserve_estimates
+        WHERE deal_id=? AND entity_name IS NOT NULL
+        ORDER BY entity_name ASC, reserve_class ASC
+        """,
+        (deal_id,),
+    ).fetchall()
+    return _group_by_well(rows)
+
+
+def _scalar_dict(rows) -> dict[str, float]:
+    result: dict[str, float] = {}
+    for r in rows:
+        try:
+            result[r["metric_name"]] = float(r["value"])
+        except (TypeError, ValueError):
+            pass
+    return result
 
 
 def load_scalar_metrics(
@@ -131,33 +223,100 @@ def load_scalar_metrics(
     Returns dict of {metric_name: value}.
     """
     conn = _connect(deal_id, output_dir)
-    try:
+    # Trigram FTS needs at least 3 characters; shorter names use the LIKE scan
+    if len(well_name) >= 3 and has_scalar_fts(conn):
+        phrase = '"' + well_name.replace('"', '""') + '"'
         rows = conn.execute(
             """
             SELECT metric_name, metric_key, value, unit, as_of_date
             FROM scalar_datapoints
             WHERE deal_id=?
-              AND (
-                LOWER(metric_key) LIKE ?
-                OR LOWER(context) LIKE ?
-                OR LOWER(extraction_note) LIKE ?
-              )
+              AND rowid IN (SELECT rowid FROM scalar_fts WHERE scalar_fts MATCH ?)
             """,
-            (deal_id, f"%{well_name.lower()}%", f"%{well_name.lower()}%", f"%{well_name.lower()}%"),
+            (deal_id, phrase),
         ).fetchall()
-        result: dict[str, float] = {}
-        for r in rows:
-            try:
-                result[r["metric_name"]] = float(r["value"])
-            except (TypeError, ValueError):
-                pass
-        return result
-    finally:
-        conn.close()
+        return _scalar_dict(rows)
+
+    rows = conn.execute(
+        """
+        SELECT metric_name, metric_key, value, unit, as_of_date
+        FROM scalar_datapoints
+        WHERE deal_id=?
+          AND (
+            LOWER(metric_key) LIKE ?
+            OR LOWER(context) LIKE ?
+            OR LOWER(extraction_note) LIKE ?
+          )
+        """,
+        (deal_id, f"%{well_name.lower()}%", f"%{well_name.lower()}%", f"%{well_name.lower()}%"),
+    ).fetchall()
+    return _scalar_dict(rows)
+
+
+def load_all_scalar_metrics(
+    deal_id: str,
+    well_names: list[str],
+    output_dir: str | Path,
+) -> dict[str, dict[str, float]]:
+    """
+    Bulk form of load_scalar_metrics() for the given wells.
+
+    Reads the deal's scalar datapoints once and applies the same
+    substring match (metric_key / context / extraction_note) per well in Python.
+    """
+    conn = _connect(deal_id, output_dir)
+    rows = conn.execute(
+        """
+        SELECT metric_name, value,
+               LOWER(COALESCE(metric_key, ''))      AS k,
+               LOWER(COALESCE(context, ''))         AS c,
+               LOWER(COALESCE(extraction_note, '')) AS n
+        FROM scalar_datapoints
+        WHERE deal_id=?
+        """,
+        (deal_id,),
+    ).fetchall()
+    result: dict[str, dict[str, float]] = {}
+    for well in well_names:
+        needle = well.lower()
+        result[well] = _scalar_dict(
+            r for r in rows if needle in r["k"] or needle in r["c"] or needle in r["n"]
+        )
+    return result
 
 
 # ── Production pivot ──────────────────────────────────────────────────────────
 
+# Product → accumulator row: 0 oil, 1 gas (boe), 2 water, 3 explicit boe
+_PRODUCT_CHANNEL: dict[str, int] = {
+    "oil": 0, "condensate": 0,
+    "gas": 1, "gas_mcfd": 1,
+    "water": 2, "ngl": 2,
+    "boe": 3, "boepd": 3,
+}
+
+def _select_actual_case(cases) -> str | None:
+    """
+    Pick the actual-production case from the available case names.
+
+    Prefers names containing 'actual' (or similar) — falls back to the first
+    non-forecast case, then to the first available case.
+    """
+    available_cases = sorted(c for c in cases if c)
+    # Prefer case names that suggest actuals
+    actual_hints = ("actual", "hist", "reported", "measured")
+    actuals = [c for c in available_cases if any(h in c.lower() for h in actual_hints)]
+    if actuals:
+        return actuals[0]
+    if available_cases:
+        # Use first non-forecast case
+        non_forecast = [c for c in available_cases
+                        if not any(h in c.lower()
+                                   for h in ("cpr", "forecast", "management", "case", "projection"))]
+        return non_forecast[0] if non_forecast else available_cases[0]
+    return None
+
+
 def pivot_production(
     records: list[dict],
     case_name: str | None = None,
@@ -170,62 +329,54 @@ def pivot_production(
     If case_name is provided, filters to that case. If None, uses the first
     case that looks like actual production (no 'forecast', 'cpr', 'case' in name).
     """
-    # Identify actual-production case: prefer entries without a case name
-    # or with case_name containing 'actual' — fall back to first available case
     if case_name is None:
-        available_cases = sorted({r["case_name"] for r in records if r.get("case_name")})
-        # Prefer case names that suggest actuals
-        actual_hints = ("actual", "hist", "reported", "measured")
-        actuals = [c for c in available_cases if any(h in (c or "").lower() for h in actual_hints)]
-        if actuals:
-            case_name = actuals[0]
-        elif available_cases:
-            # Use first non-forecast case
-            non_forecast = [c for c in available_cases
-                            if not any(h in (c or "").lower()
-                                       for h in ("cpr", "forecast", "management", "case", "projection"))]
-            case_name = non_forecast[0] if non_forecast else available_cases[0]
+        case_name = _select_actual_case({r["case_name"] for r in records if r.get("case_name")})
 
     filtered = [r for r in records if r.get("case_name") == case_name]
 
-    # Group by period
-    periods: dict[str, dict] = {}
+    # Period axis — first record of each period supplies its period_end
+    period_end: dict[str, str] = {}
     for r in filtered:
-        p = r["period_start"]
-        if p not in periods:
-            periods[p] = {
-                "period":      p,           # convenience alias = period_start
-                "period_start": p,
-                "period_end": r.get("period_end", p),
-                "case_name": case_name,
-                "oil_bopd": 0.0,
-                "gas_mmcfd": 0.0,
-                "water_bwpd": 0.0,
-                "boe_boepd": 0.0,
-            }
-        product = (r.get("product") or "").lower()
-        val = float(r.get("value_normalised") or 0.0)
-        if product in ("oil", "condensate"):
-            periods[p]["oil_bopd"] += val
-        elif product in ("gas", "gas_mcfd"):
-            # value_normalised in boe already (Agent 02 normalises to boe)
-            # But we also want raw gas in mmcfd for GOR — approximate from boe
-            periods[p]["gas_mmcfd"] += val / 6000.0  # 6 mcf:1 boe → mmcfd
-            periods[p]["boe_boepd"] += val
-        elif product in ("water", "ngl"):
-            periods[p]["water_bwpd"] += val
-        elif product in ("boe", "boepd"):
-            periods[p]["boe_boepd"] += val
-
+        period_end.setdefault(r["period_start"], r.get("period_end", r["period_start"]))
+    keys = sorted(period_end)
+    p_idx = {p: i for i, p in enumerate(keys)}
+
+    # Accumulate every record into a (channel × period) matrix in one np.add.at
+    chans: list[int] = []
+    cols:  list[int] = []
+    vals:  list[float] = []
+    for r in filtered:
+        ch = _PRODUCT_CHANNEL.get((r.get("product") or "").lower())
+        if ch is not None:
+            chans.append(ch)
+            cols.append(p_idx[r["period_start"]])
+            vals.append(float(r.get("value_normalised") or 0.0))
+    acc = np.zeros((4, len(keys)))
+    np.add.at(acc, (chans, cols), vals)
+
+    oil, gas_boe, water, boe = acc
+    # value_normalised for gas is in boe already (Agent 02 normalises to boe);
+    # it counts towards boe and is approximated back to mmcfd for GOR (6 mcf:1 boe)
+    boe = boe + gas_boe
     # Fill boe where not explicit
-    for p in periods:
-        if periods[p]["boe_boepd"] == 0.0:
-            periods[p]["boe_boepd"] = (
-                periods[p]["oil_bopd"]
-                + periods[p]["gas_mmcfd"] * 6000.0
-            )
+    boe = np.where(boe == 0.0, oil + gas_boe, boe)
 
-    return dict(sorted(periods.items()))
+    oil_col, gas_col, water_col, boe_col = (
+        oil.tolist(), (gas_boe / 6000.0).tolist(), water.tolist(), boe.tolist(),
+    )
+    return {
+        p: {
+            "period":      p,           # convenience alias = period_start
+            "period_start": p,
+            "period_end": period_end[p],
+            "case_name": case_name,
+            "oil_bopd": oil_col[i],
+            "gas_mmcfd": gas_col[i],
+            "water_bwpd": water_col[i],
+            "boe_boepd": boe_col[i],
+        }
+        for i, p in enumerate(keys)
+    }
 
 
 def pivot_forecast(
@@ -240,6 +391,88 @@ def pivot_forecast(
     return pivot_production(records, case_name=forecast_case)
 
 
+# ── Materialized pivot (Agent 02 monthly_production) ──────────────────────────
+
+_PIVOTED_SELECT = """
+    SELECT entity_name, case_name, period_start, period_end,
+           oil_bopd, gas_boepd, water_bwpd, boe_explicit
+    FROM monthly_production
+"""
+
+
+def _pivoted_by_case(rows) -> dict[str, dict[str, dict]]:
+    """Rows ordered by period_start → {case_name: {period_start: pivot entry}}."""
+    by_case: dict[str, dict[str, dict]] = {}
+    for r in rows:
+        p, gas_boe = r["period_start"], r["gas_boepd"]
+        boe = r["boe_explicit"] + gas_boe
+        case = sys.intern(r["case_name"])
+        by_case.setdefault(case, {})[p] = {
+            "period":      p,           # convenience alias = period_start
+            "period_start": p,
+            "period_end": r["period_end"] if r["period_end"] is not None else p,
+            "case_name": case,
+            "oil_bopd": r["oil_bopd"],
+            "gas_mmcfd": gas_boe / 6000.0,
+            "water_bwpd": r["water_bwpd"],
+            # Fill boe where not explicit
+            "boe_boepd": boe if boe != 0.0 else r["oil_bopd"] + gas_boe,
+        }
+    return by_case
+
+
+def load_pivoted(
+    deal_id: str,
+    well_name: str,
+    output_dir: str | Path,
+) -> dict[str, dict[str, dict]] | None:
+    """
+    Load a well's pre-aggregated monthly production from Agent 02's monthly_production.
+
+    Returns {case_name: periods} where periods has the same shape as
+    pivot_production() output, or None if the store has no monthly_production
+    table (callers then pivot raw rows themselves).
+    """
+    conn = _connect(deal_id, output_dir)
+    if not has_monthly_production(conn):
+        return None
+    rows = conn.execute(
+        _PIVOTED_SELECT + "WHERE deal_id=? AND entity_name=? ORDER BY period_start ASC",
+        (deal_id, well_name),
+    ).fetchall()
+    return _pivoted_by_case(rows)
+
+
+def load_all_pivoted(
+    deal_id: str,
+    output_dir: str | Path,
+) -> dict[str, dict[str, dict[str, dict]]] | None:
+    """Bulk form of load_pivoted(): {well_name: {case_name: periods}}, or None if unavailable."""
+    conn = _connect(deal_id, output_dir)
+    if not has_monthly_production(conn):
+        return None
+    rows = conn.execute(
+        _PIVOTED_SELECT + "WHERE deal_id=? ORDER BY entity_name ASC, period_start ASC",
+        (deal_id,),
+    ).fetchall()
+    return {
+        sys.intern(well): _pivoted_by_case(group)
+        for well, group in itertools.groupby(rows, key=lambda r: r["entity_name"])
+    }
+
+
+def split_pivoted(
+    by_case: dict[str, dict[str, dict]],
+    forecast_case: str = "cpr_base_case",
+) -> tuple[dict[str, dict], dict[str, dict]]:
+    """
+    Pick (actual_periods, forecast_periods) from load_pivoted() output, using the
+    same case selection as pivot_production() / pivot_forecast().
+    """
+    actual_case = _select_actual_case(by_case)
+    return by_case.get(actual_case, {}), by_case.get(forecast_case, {})
+
+
 # ── Downtime normalization ────────────────────────────────────────────────────
 
 def normalize_production(
@@ -258,33 +491,46 @@ def normalize_production(
     Returns:
         (normalized_periods, assumption_flags)
         normalized_periods is a list[dict] sorted by period, each dict includes:
-          period, oil_norm, gas_norm, water_norm, boe_norm, uptime_factor, uptime_source.
+          period, oil_norm, gas_norm, water_norm, boe_norm, uptime_factor, uptime_source
+          (unrounded).
     """
     flags: list[str] = []
     uptime_frac = default_uptime / 100.0
-    normalized_list: list[dict] = []
-    assumed_count = 0
-
-    for period in sorted(periods.keys()):
-        data = periods[period]
-        entry = dict(data)
-        entry["period"] = period  # ensure accessible as .get("period")
+    keys = sorted(periods)
+    n = len(keys)
+
+    # Column view of the per-period rates so the uptime division runs once per column
+    def _column(field: str) -> np.ndarray:
+        return np.fromiter((periods[k][field] for k in keys), dtype=np.float64, count=n)
+
+    if uptime_data:
+        has_uptime = np.fromiter((k in uptime_data for k in keys), dtype=bool, count=n)
+        actual = np.fromiter(
+            (uptime_data.get(k, default_uptime) for k in keys), dtype=np.float64, count=n,
+        ) / 100.0
+        factor = np.where(has_uptime, actual, uptime_frac)
+    else:
+        has_uptime = np.zeros(n, dtype=bool)
+        factor = np.full(n, uptime_frac)
+    factor = factor.clip(min=0.01)  # avoid division by zero
+    assumed_count = int(n - np.count_nonzero(has_uptime))
+
+    # Full precision — rounding is applied when the well card is assembled
+    uptime_col = factor.tolist()
+    boe_col    = (_column("boe_boepd")  / factor).tolist()
+    oil_col    = (_column("oil_bopd")   / factor).tolist()
+    gas_col    = (_column("gas_mmcfd")  / factor).tolist()
+    water_col  = (_column("water_bwpd") / factor).tolist()
 
-        if uptime_data and period in uptime_data:
-            factor = uptime_data[period] / 100.0
-            source = "actual"
-        else:
-            factor = uptime_frac
-            source = "assumed"
-            assumed_count += 1
-
-        factor = max(factor, 0.01)  # avoid division by zero
-        entry["uptime_factor"] = round(factor, 4)
-        entry["uptime_source"] = source
-        entry["boe_norm"]   = round(entry["boe_boepd"]   / factor, 1)
-        entry["oil_norm"]   = round(entry["oil_bopd"]    / factor, 1)
-        entry["gas_norm"]   = round(entry["gas_mmcfd"]   / factor, 4)
-        entry["water_norm"] = round(entry["water_bwpd"]  / factor, 1)
+    normalized_list: list[dict] = []
+    for i, period in enumerate(keys):
+        entry = dict(periods[period], period=period)  # ensure accessible as .get("period")
+        entry["uptime_factor"] = uptime_col[i]
+        entry["uptime_source"] = "actual" if has_uptime[i] else "assumed"
+        entry["boe_norm"]   = boe_col[i]
+        entry["oil_norm"]   = oil_col[i]
+        entry["gas_norm"]   = gas_col[i]
+        entry["water_norm"] = water_col[i]
         normalized_list.append(entry)
 
     if assumed_count > 0 and uptime_data is None:
@@ -302,83 +548,217 @@ def normalize_production(
 
 # ── Secondary metrics ─────────────────────────────────────────────────────────
 
-def compute_secondary_metrics(periods: list[dict] | dict) -> list[dict]:
+@dataclass(slots=True)
+class PeriodColumns:
     """
-    Add GOR and WC columns to normalized periods.
-    Add 12-month trend for GOR and WC (delta vs. 12 months prior).
+    Column (structure-of-arrays) view of a well's enriched monthly periods.
+
+    Row i of every column is period[i]. The DCA fit, RAG lookup and summary
+    statistics read these columns directly; to_records() rebuilds the
+    list-of-dicts form for the chart generator and the card's
+    _production_history export.
+    """
+    period:        list[str]
+    month_idx:     np.ndarray   # float64; period index unless the rows carry month_idx
+    boe:           np.ndarray   # float64 boe/d — boe_norm, else boe_boepd, missing → 0
+    gor:           np.ndarray   # float64 scf/stb, NaN where no oil
+    wc:            np.ndarray   # float64 %
+    gor_trend:     np.ndarray   # float64 % vs. 12 months prior, NaN where undefined
+    wc_trend:      np.ndarray   # float64 ppts vs. 12 months prior, NaN where undefined
+    uptime_factor: np.ndarray   # float64 fraction, missing → 0.9
+    uptime_actual: np.ndarray   # bool, uptime_source == "actual"
+    rows:          list[dict] = field(repr=False)
+
+    def __len__(self) -> int:
+        return len(self.period)
+
+    def to_records(self) -> list[dict]:
+        """Per-period dicts: the source rows plus period, GOR, WC and trend keys."""
+        def _opt(a: np.ndarray) -> list[float | None]:
+            return [None if v != v else v for v in a.tolist()]   # NaN → None
+
+        gor_col, gor_trend_col, wc_trend_col = _opt(self.gor), _opt(self.gor_trend), _opt(self.wc_trend)
+        wc_col = self.wc.tolist()
+
+        result: list[dict] = []
+        for i, raw in enumerate(self.rows):
+            entry = dict(raw)
+            entry["period"]            = self.period[i]
+            entry["gor_scf_stb"]       = gor_col[i]
+            entry["wc_pct"]            = wc_col[i]
+            entry["gor_12m_trend_pct"] = gor_trend_col[i]
+            entry["wc_12m_trend_ppts"] = wc_trend_col[i]
+            result.append(entry)
+        return result
+
+
+def compute_secondary_columns(periods: list[dict] | dict) -> PeriodColumns:
+    """
+    Column form of compute_secondary_metrics(): GOR, WC and their 12-month
+    trends as arrays alongside the rate, time and uptime columns.
 
     Accepts either a list[dict] (from normalize_production) or a legacy dict[str,dict].
-    Returns list[dict] sorted by period, each entry with "period" key.
 
     GOR (scf/stb) = gas_norm_mmcfd * 1_000_000 / oil_norm_bopd
     WC% = water_norm / (water_norm + oil_norm) * 100
     """
-    # Normalise input to list[dict]
+    # Normalise input to list[dict]. normalize_production() and pivot_production()
+    # already emit periods in order, so only sort when the caller's list is not.
     if isinstance(periods, dict):
         period_list = [dict(v, period=k) for k, v in sorted(periods.items())]
     else:
-        period_list = sorted(periods, key=lambda p: p.get("period", p.get("period_start", "")))
-
-    result: list[dict] = []
+        period_list = periods
+        keys = [p.get("period", p.get("period_start", "")) for p in period_list]
+        if any(a > b for a, b in zip(keys, keys[1:])):
+            period_list = sorted(period_list, key=lambda p: p.get("period", p.get("period_start", "")))
 
-    for i, raw in enumerate(period_list):
-        entry = dict(raw)
-        # Ensure period key present
-        if "period" not in entry:
-            entry["period"] = entry.get("period_start", str(i))
+    n = len(period_list)
 
-        oil   = entry.get("oil_norm",   entry.get("oil_bopd",   0.0)) or 0.0
-        gas   = entry.get("gas_norm",   entry.get("gas_mmcfd",  0.0)) or 0.0
-        water = entry.get("water_norm", entry.get("water_bwpd", 0.0)) or 0.0
+    def _column(norm_key: str, raw_key: str) -> np.ndarray:
+        return np.fromiter(
+            (p.get(norm_key, p.get(raw_key, 0.0)) or 0.0 for p in period_list),
+            dtype=np.float64, count=n,
+        )
 
-        # GOR in scf/stb
-        entry["gor_scf_stb"] = round(gas * 1_000_000 / oil, 0) if oil > 0 else None
+    oil   = _column("oil_norm",   "oil_bopd")
+    gas   = _column("gas_norm",   "gas_mmcfd")
+    water = _column("water_norm", "water_bwpd")
 
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # GOR in scf/stb (NaN where there is no oil)
+        gor = np.where(oil > 0, gas * 1_000_000 / oil, np.nan)
         # Water cut %
         total_liquids = oil + water
-        entry["wc_pct"] = round(water / total_liquids * 100, 2) if total_liquids > 0 else 0.0
-
-        # 12-month trends
-        entry["gor_12m_trend_pct"]  = None
-        entry["wc_12m_trend_ppts"]  = None
-        if i >= 12:
-            prior = result[i - 12]
-            if prior.get("gor_scf_stb") and entry.get("gor_scf_stb"):
-                entry["gor_12m_trend_pct"] = round(
-                    (entry["gor_scf_stb"] - prior["gor_scf_stb"]) / prior["gor_scf_stb"] * 100, 1
-                )
-            if prior.get("wc_pct") is not None and entry.get("wc_pct") is not None:
-                entry["wc_12m_trend_ppts"] = round(entry["wc_pct"] - prior["wc_pct"], 2)
-
-        result.append(entry)
+        wc = np.where(total_liquids > 0, water / total_liquids * 100, 0.0)
+
+        # 12-month trends: GOR only where both ends are non-zero
+        gor_trend = np.full(n, np.nan)
+        wc_trend  = np.full(n, np.nan)
+        if n > 12:
+            now, prior = gor[12:], gor[:-12]
+            valid = (now != 0) & (prior != 0) & ~np.isnan(now) & ~np.isnan(prior)
+            gor_trend[12:] = np.where(valid, (now - prior) / prior * 100, np.nan)
+            wc_trend[12:] = wc[12:] - wc[:-12]
+
+    return PeriodColumns(
+        # Ensure a period label for every row
+        period        = [p["period"] if "period" in p else p.get("period_start", str(i))
+                         for i, p in enumerate(period_list)],
+        month_idx     = np.fromiter((p.get("month_idx", i) for i, p in enumerate(period_list)),
+                                    dtype=np.float64, count=n),
+        boe           = _column("boe_norm", "boe_boepd"),
+        gor           = gor,
+        wc            = wc,
+        gor_trend     = gor_trend,
+        wc_trend      = wc_trend,
+        uptime_factor = np.fromiter((p.get("uptime_factor", 0.9) for p in period_list),
+                                    dtype=np.float64, count=n),
+        uptime_actual = np.fromiter((p.get("uptime_source", "assumed") == "actual" for p in period_list),
+                                    dtype=bool, count=n),
+        rows          = period_list,
+    )
 
-    return result
+
+def compute_secondary_metrics(periods: list[dict] | dict) -> list[dict]:
+    """
+    Add GOR and WC columns to normalized periods.
+    Add 12-month trend for GOR and WC (delta vs. 12 months prior).
+
+    Accepts either a list[dict] (from normalize_production) or a legacy dict[str,dict].
+    Returns list[dict] sorted by period, each entry with "period" key.
+    See compute_secondary_columns() for the column form.
+    """
+    return compute_secondary_columns(periods).to_records()
 
 
 # ── Summary statistics ────────────────────────────────────────────────────────
 
-def compute_summary_stats(periods: list[dict] | dict) -> dict:
+@dataclass(frozen=True, slots=True)
+class SummaryStats:
+    """
+    Well-level summary statistics (see compute_summary()).
+
+    Values are full precision; the well card rounds them for presentation.
+    None marks a statistic that could not be computed (e.g. GOR with no oil).
+    """
+    current_rate_boepd: float | None = None
+    peak_rate_boepd:    float | None = None
+    cumulative_mmboe:   float        = 0.0
+    ip30_boepd:         float | None = None
+    ip90_boepd:         float | None = None
+    ip180_boepd:        float | None = None
+    trend_12m_pct:      float | None = None
+    gor_scf_stb:        float | None = None
+    gor_trend_12m_pct:  float | None = None
+    water_cut_pct:      float | None = None
+    wc_trend_12m_ppts:  float | None = None
+    uptime_pct:         float | None = None
+    uptime_source:      str          = "assumed"
+    months_of_data:     int          = 0
+    completeness_pct:   float        = 0.0
+
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+def compute_summary_stats(periods: list[dict] | dict | PeriodColumns) -> dict:
     """
     Compute well-level summary statistics from normalized period data.
 
-    Accepts list[dict] (from compute_secondary_metrics) or legacy dict[str,dict].
+    Accepts PeriodColumns (from compute_secondary_columns), list[dict] (from
+    compute_secondary_metrics) or legacy dict[str,dict].
     Returns dict with: current_rate_boepd, peak_rate_boepd, cumulative_mmboe,
     ip30_boepd, ip90_boepd, ip180_boepd, trend_12m_pct, gor_scf_stb (latest),
     gor_trend_12m_pct, water_cut_pct, wc_trend_12m_ppts,
     months_of_data, completeness_pct.
+    Values are full precision; the well card rounds them for presentation.
     """
-    if not periods:
+    if not len(periods):
         return {"months_of_data": 0, "completeness_pct": 0.0,
                 "current_rate_boepd": None, "peak_rate_boepd": None, "cumulative_mmboe": 0.0}
+    return compute_summary(periods).to_dict()
 
-    # Normalise to list
-    if isinstance(periods, dict):
-        period_list = [dict(v) for _, v in sorted(periods.items())]
+
+def compute_summary(periods: list[dict] | dict | PeriodColumns) -> SummaryStats:
+    """
+    SummaryStats form of compute_summary_stats() (same inputs); no periods
+    gives the all-default SummaryStats().
+    """
+    if not len(periods):
+        return SummaryStats()
+
+    if isinstance(periods, PeriodColumns):
+        boe_arr = periods.boe
+
+        def _last(a: np.ndarray) -> float | None:
+            v = float(a[-1])
+            return None if v != v else v   # NaN → None
+
+        latest = {
+            "gor_scf_stb":       _last(periods.gor),
+            "gor_12m_trend_pct": _last(periods.gor_trend),
+            "wc_pct":            float(periods.wc[-1]),
+            "wc_12m_trend_ppts": _last(periods.wc_trend),
+        }
+        non_zero       = int(np.count_nonzero(boe_arr > 0))
+        uptime_factors = periods.uptime_factor
+        all_actual     = bool(periods.uptime_actual.all())
     else:
-        period_list = list(periods)
+        # Normalise to list (list input is used as-is — compute_secondary_metrics output is sorted)
+        if isinstance(periods, dict):
+            period_list = [v for _, v in sorted(periods.items())]
+        else:
+            period_list = periods
 
-    boe_rates = [p.get("boe_norm", p.get("boe_boepd", 0.0)) or 0.0 for p in period_list]
-    boe_arr = np.array(boe_rates, dtype=float)
+        boe_arr = np.fromiter(
+            (p.get("boe_norm", p.get("boe_boepd", 0.0)) or 0.0 for p in period_list),
+            dtype=np.float64, count=len(period_list),
+        )
+        latest         = period_list[-1]
+        non_zero       = sum(1 for p in period_list
+                             if (p.get("boe_norm") or p.get("boe_boepd") or 0) > 0)
+        uptime_factors = [p.get("uptime_factor", 0.9) for p in period_list]
+        all_actual     = all(p.get("uptime_source", "assumed") == "actual" for p in period_list)
 
     current_rate = float(boe_arr[-1]) if len(boe_arr) else 0.0
     peak_rate    = float(np.max(boe_arr)) if len(boe_arr) else 0.0
@@ -392,7 +772,7 @@ def compute_summary_stats(periods: list[dict] | dict) -> dict:
             return None
         window = boe_arr[:n]
         nonzero = window[window > 0]
-        return round(float(np.mean(nonzero)), 1) if len(nonzero) else None
+        return float(np.mean(nonzero)) if len(nonzero) else None
 
     ip30  = _ip(1)   # 1 month ≈ IP30
     ip90  = _ip(3)   # 3 months ≈ IP90
@@ -403,40 +783,33 @@ def compute_summary_stats(periods: list[dict] | dict) -> dict:
     if len(boe_arr) >= 13:
         rate_12m_ago = float(boe_arr[-13]) if boe_arr[-13] > 0 else None
         if rate_12m_ago and rate_12m_ago > 0:
-            trend_12m_pct = round((current_rate - rate_12m_ago) / rate_12m_ago * 100, 1)
-
-    # Latest GOR, WC and their 12m trends
-    latest = period_list[-1]
+            trend_12m_pct = (current_rate - rate_12m_ago) / rate_12m_ago * 100
 
     # Completeness
-    total_possible = len(period_list)
-    non_zero = sum(1 for p in period_list
-                   if (p.get("boe_norm") or p.get("boe_boepd") or 0) > 0)
-    completeness = round(non_zero / total_possible * 100, 1) if total_possible else 0.0
+    total_possible = len(boe_arr)
+    completeness = non_zero / total_possible * 100 if total_possible else 0.0
 
     # Average uptime
-    uptime_factors = [p.get("uptime_factor", 0.9) for p in period_list]
-    avg_uptime_pct = round(float(np.mean(uptime_factors)) * 100, 1)
-    uptime_sources = [p.get("uptime_source", "assumed") for p in period_list]
-    uptime_source = "actual" if all(s == "actual" for s in uptime_sources) else "assumed"
-
-    return {
-        "current_rate_boepd":   round(current_rate, 1),
-        "peak_rate_boepd":      round(peak_rate, 1),
-        "cumulative_mmboe":     round(cumulative_boe / 1e6, 3),
-        "ip30_boepd":           ip30,
-        "ip90_boepd":           ip90,
-        "ip180_boepd":          ip180,
-        "trend_12m_pct":        trend_12m_pct,
-        "gor_scf_stb":          latest.get("gor_scf_stb"),
-        "gor_trend_12m_pct":    latest.get("gor_12m_trend_pct"),
-        "water_cut_pct":        latest.get("wc_pct"),
-        "wc_trend_12m_ppts":    latest.get("wc_12m_trend_ppts"),
-        "uptime_pct":           avg_uptime_pct,
-        "uptime_source":        uptime_source,
-        "months_of_data":       total_possible,
-        "completeness_pct":     completeness,
-    }
+    avg_uptime_pct = float(np.mean(uptime_factors)) * 100
+    uptime_source = "actual" if all_actual else "assumed"
+
+    return SummaryStats(
+        current_rate_boepd = current_rate,
+        peak_rate_boepd    = peak_rate,
+        cumulative_mmboe   = cumulative_boe / 1e6,
+        ip30_boepd         = ip30,
+        ip90_boepd         = ip90,
+        ip180_boepd        = ip180,
+        trend_12m_pct      = trend_12m_pct,
+        gor_scf_stb        = latest.get("gor_scf_stb"),
+        gor_trend_12m_pct  = latest.get("gor_12m_trend_pct"),
+        water_cut_pct      = latest.get("wc_pct"),
+        wc_trend_12m_ppts  = latest.get("wc_12m_trend_ppts"),
+        uptime_pct         = avg_uptime_pct,
+        uptime_source      = uptime_source,
+        months_of_data     = total_possible,
+        completeness_pct   = completeness,
+    )
 
 
 # ── CPR EUR extraction ────────────────────────────────────────────────────────
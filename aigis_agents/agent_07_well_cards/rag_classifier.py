@@ -13,8 +13,12 @@ Learned patterns from MemoryManager can override default thresholds.
 
 from __future__ import annotations
 
+import re
+from bisect import bisect_right
 from dataclasses import dataclass, field
 
+import numpy as np
+
 # ── RAG colour constants ──────────────────────────────────────────────────────
 
 GREEN  = "GREEN"
@@ -55,32 +59,160 @@ R2_POOR                = 0.70    # R² < 0.70 → data quality flag
 UPTIME_LOW_AMBER_PCT   = 85.0    # < 85% → operational flag
 UPTIME_LOW_RED_PCT     = 70.0    # < 70% → serious operational flag
 
+# Threshold table used when no learned patterns apply (copied before overriding)
+_DEFAULT_THRESHOLDS: dict[str, float] = {
+    "outperformer":   OUTPERFORMER_THRESHOLD,
+    "on_track_lower": ON_TRACK_LOWER,
+    "amber_lower":    AMBER_LOWER,
+    "gor_amber":      GOR_RISE_AMBER_PCT,
+    "gor_red":        GOR_RISE_RED_PCT,
+    "wc_amber":       WC_RISE_AMBER_PPTS,
+    "wc_red":         WC_RISE_RED_PPTS,
+    "di_amber":       DI_STEEP_AMBER_PCT,
+    "di_red":         DI_STEEP_RED_PCT,
+    "uptime_amber":   UPTIME_LOW_AMBER_PCT,
+    "uptime_red":     UPTIME_LOW_RED_PCT,
+}
+
+# Operational statuses (lower-cased) classified BLACK without looking at rates
+_SHUT_IN_STATES = frozenset({"shut-in", "shut_in", "suspended", "abandonment", "p&a", "plugged"})
+
+
+# ── Severity ordering ─────────────────────────────────────────────────────────
+
+_SEVERITY_ORDER = {BLACK: 4, RED: 3, AMBER: 2, GREEN: 1}
+_SEV_TO_STATUS = (None, GREEN, AMBER, RED, BLACK)   # inverse of _SEVERITY_ORDER
+
+_GREEN_SEV, _AMBER_SEV, _RED_SEV = 1, 2, 3
+
+
+# ── Banded classification tables ──────────────────────────────────────────────
+# Each check places its value in a band with bisect_right over ascending cut
+# points (so a value equal to a cut falls in the upper band, i.e. ">=").
+# The band index selects (severity, label, flag) or (escalation severity,
+# flag) below; escalation 0 means the value is unremarkable.
+
+_PRIMARY_BANDS: tuple[tuple[int, str, str | None], ...] = (
+    (_RED_SEV, "Significantly below forecast ({v:+.0%} vs CPR)",
+     "CRITICAL: Production {a:.0%} below CPR base case "
+     "({cur:,.0f} boe/d actual vs {fc:,.0f} boe/d CPR) — material reserve revision risk"),
+    (_AMBER_SEV, "Underperformer ({v:+.0%} vs CPR forecast)",
+     "Production {a:.0%} below CPR base case forecast "
+     "({cur:,.0f} boe/d actual vs {fc:,.0f} boe/d CPR)"),
+    (_GREEN_SEV, "On-track ({v:+.0%} vs CPR forecast)", None),
+    (_GREEN_SEV, "Outperformer ({v:+.0%} vs CPR forecast)", None),
+)
+
+_SECONDARY_BANDS: dict[str, tuple[tuple[int, str | None], ...]] = {
+    "gor": (
+        (0, None),
+        (_AMBER_SEV,
+         "GOR rising {v:+.0f}% over 12 months — "
+         "monitor closely; cross-check against CPR PVT model"),
+        (_RED_SEV,
+         "GOR rising {v:+.0f}% over 12 months — "
+         "possible gas coning, aquifer encroachment, or depletion drive change; "
+         "recommend well test and PVT re-sampling"),
+    ),
+    "wc": (
+        (0, None),
+        (_AMBER_SEV,
+         "Water cut rising {v:+.1f} ppts over 12 months — "
+         "monitor; compare against CPR WC forecast trajectory"),
+        (_RED_SEV,
+         "Water cut rising {v:+.1f} ppts over 12 months — "
+         "possible early water breakthrough; review sweep efficiency and aquifer model"),
+    ),
+    "di": (
+        (0, None),
+        (_AMBER_SEV,
+         "Annual decline {v:.0f}%/yr is above GoM deepwater benchmark (15–25%/yr)"),
+        (_RED_SEV,
+         "Annual decline {v:.0f}%/yr exceeds 50%/yr — "
+         "verify production data quality; may indicate reservoir compartmentalization or mechanical damage"),
+    ),
+    "uptime": (   # low is bad: bands run RED → AMBER → none
+        (_RED_SEV,
+         "Well uptime {v:.0f}% is critically low (<70%) — "
+         "significant operational reliability concern; investigate root cause"),
+        (_AMBER_SEV,
+         "Well uptime {v:.0f}% is below GoM benchmark (88–92%) — "
+         "review maintenance history and equipment reliability"),
+        (0, None),
+    ),
+}
+
+
+def _band_cuts(thresholds: dict) -> dict[str, tuple[float, ...]]:
+    """Ascending cut points per check, aligned with the band tables above."""
+    return {
+        "primary": (thresholds["amber_lower"], thresholds["on_track_lower"], thresholds["outperformer"]),
+        "gor":     (thresholds["gor_amber"], thresholds["gor_red"]),
+        "wc":      (thresholds["wc_amber"], thresholds["wc_red"]),
+        "di":      (thresholds["di_amber"], thresholds["di_red"]),
+        "uptime":  (thresholds["uptime_red"], thresholds["uptime_amber"]),
+    }
+
+
+_DEFAULT_CUTS = _band_cuts(_DEFAULT_THRESHOLDS)
+
 
 # ── Data classes ──────────────────────────────────────────────────────────────
 
-@dataclass
+# A flag message before formatting: (template, str.format kwargs or None if literal)
+FlagSpec = tuple[str, dict | None]
+
+
+@dataclass(slots=True)
 class RAGResult:
-    """Traffic-light classification result for a single well."""
+    """
+    Traffic-light classification result for a single well.
+
+    Flag messages are kept as (template, kwargs) specs and only formatted
+    the first time .flags is read, so status-only consumers never pay for
+    building the text.
+    """
     status:            str                       # "GREEN" | "AMBER" | "RED" | "BLACK"
     label:             str                       # Human description
     emoji:             str                       # Single emoji
     variance_pct:      float | None = None       # Actual vs. forecast %
-    flags:             list[str] = field(default_factory=list)
     learned_overrides: list[str] = field(default_factory=list)  # patterns applied
+    flag_specs:        list[FlagSpec] = field(default_factory=list, repr=False)
+    _flags:            list[str] | None = field(default=None, init=False, repr=False, compare=False)
 
+    @property
+    def flags(self) -> list[str]:
+        """Formatted flag messages (rendered once, on first access)."""
+        if self._flags is None:
+            self._flags = [t if kw is None else t.format(**kw) for t, kw in self.flag_specs]
+        return self._flags
 
-# ── Severity ordering ─────────────────────────────────────────────────────────
 
-_SEVERITY_ORDER = {BLACK: 4, RED: 3, AMBER: 2, GREEN: 1}
+# Flags counted as critical. Case-insensitive on purpose: besides the
+# "CRITICAL:" primary flag it also matches "critically low" uptime flags.
+_CRITICAL_RE = re.compile("critical", re.IGNORECASE)
 
-
-def _max_severity(a: str, b: str) -> str:
-    """Return the more severe of two RAG statuses."""
-    return a if _SEVERITY_ORDER.get(a, 0) >= _SEVERITY_ORDER.get(b, 0) else b
+# Status → small-int code for array tallies (GREEN first, BLACK last)
+_RAG_CODES = {GREEN: 0, AMBER: 1, RED: 2, BLACK: 3}
 
 
 # ── Pattern override helpers ──────────────────────────────────────────────────
 
+def _h_gor_gas_condensate(thresholds: dict, p: dict, overrides: list[str]) -> None:
+    overrides.append(f"Pattern '{p['classification']}' applied: {p.get('rule', '')}")
+
+
+def _h_uptime_benchmark(thresholds: dict, p: dict, overrides: list[str]) -> None:
+    overrides.append(f"Pattern '{p['classification']}' noted: {p.get('rule', '')}")
+
+
+# classification → handler(thresholds, pattern, overrides); unknown classes are ignored
+_PATTERN_HANDLERS = {
+    "gor_threshold_gas_condensate": _h_gor_gas_condensate,
+    "gom_uptime_benchmark":         _h_uptime_benchmark,
+}
+
+
 def _apply_pattern_overrides(
     thresholds: dict,
     patterns: list[dict],
@@ -96,18 +228,15 @@ def _apply_pattern_overrides(
     This implementation applies a simple heuristic: if a pattern mentions
     specific numeric thresholds in its rule text, a caller-side override
     should be done. Here we log that patterns were considered.
+
+    Patterns are dispatched by classification through _PATTERN_HANDLERS, so
+    cost is one dict lookup per pattern however many handlers exist.
     """
     overrides: list[str] = []
     for p in patterns:
-        cls = p.get("classification", "")
-        rule = p.get("rule", "")
-        weight = p.get("weight", "MEDIUM")
-        if weight == "STALE":
-            continue
-        if cls == "gor_threshold_gas_condensate":
-            overrides.append(f"Pattern '{cls}' applied: {rule}")
-        elif cls == "gom_uptime_benchmark":
-            overrides.append(f"Pattern '{cls}' noted: {rule}")
+        handler = _PATTERN_HANDLERS.get(p.get("classification", ""))
+        if handler is not None and p.get("weight", "MEDIUM") != "STALE":
+            handler(thresholds, p, overrides)
     return thresholds, overrides
 
 
@@ -145,183 +274,186 @@ def classify_well(
     Returns:
         RAGResult with status, label, flags, and applied pattern notes.
     """
-    patterns = patterns or []
-    flags: list[str] = []
-
-    thresholds: dict = {
-        "outperformer":  OUTPERFORMER_THRESHOLD,
-        "on_track_lower": ON_TRACK_LOWER,
-        "amber_lower":   AMBER_LOWER,
-        "gor_amber":     GOR_RISE_AMBER_PCT,
-        "gor_red":       GOR_RISE_RED_PCT,
-        "wc_amber":      WC_RISE_AMBER_PPTS,
-        "wc_red":        WC_RISE_RED_PPTS,
-        "di_amber":      DI_STEEP_AMBER_PCT,
-        "di_red":        DI_STEEP_RED_PCT,
-        "uptime_amber":  UPTIME_LOW_AMBER_PCT,
-        "uptime_red":    UPTIME_LOW_RED_PCT,
-    }
-    thresholds, overrides = _apply_pattern_overrides(thresholds, patterns)
+    flags: list[FlagSpec] = []
+
+    if patterns:
+        thresholds, overrides = _apply_pattern_overrides(dict(_DEFAULT_THRESHOLDS), patterns)
+    else:
+        thresholds, overrides = _DEFAULT_THRESHOLDS, []
 
     # ── BLACK: shut-in ────────────────────────────────────────────────────────
     status_str = (well_status or "").lower()
-    if status_str in ("shut-in", "shut_in", "suspended", "abandonment", "p&a", "plugged"):
+    if status_str in _SHUT_IN_STATES:
         return RAGResult(
             status=BLACK, label="Shut-in / Suspended", emoji=RAG_EMOJI[BLACK],
-            flags=["Well is currently shut-in or suspended — no production data"],
+            flag_specs=[("Well is currently shut-in or suspended — no production data", None)],
             learned_overrides=overrides,
         )
 
     if current_rate_boepd <= 0:
         return RAGResult(
             status=BLACK, label="No production recorded", emoji=RAG_EMOJI[BLACK],
-            flags=["Zero or negative production rate recorded"],
+            flag_specs=[("Zero or negative production rate recorded", None)],
             learned_overrides=overrides,
         )
 
+    cuts = _DEFAULT_CUTS if thresholds is _DEFAULT_THRESHOLDS else _band_cuts(thresholds)
+
     # ── Primary classification: rate vs. forecast ─────────────────────────────
     variance_pct: float | None = None
 
     if forecast_rate_boepd and forecast_rate_boepd > 0:
         variance_pct = (current_rate_boepd - forecast_rate_boepd) / forecast_rate_boepd
-
-        if variance_pct >= thresholds["outperformer"]:
-            rag = GREEN
-            label = f"Outperformer ({variance_pct:+.0%} vs CPR forecast)"
-        elif variance_pct >= thresholds["on_track_lower"]:
-            rag = GREEN
-            label = f"On-track ({variance_pct:+.0%} vs CPR forecast)"
-        elif variance_pct >= thresholds["amber_lower"]:
-            rag = AMBER
-            label = f"Underperformer ({variance_pct:+.0%} vs CPR forecast)"
-            flags.append(
-                f"Production {abs(variance_pct):.0%} below CPR base case forecast "
-                f"({current_rate_boepd:,.0f} boe/d actual vs {forecast_rate_boepd:,.0f} boe/d CPR)"
-            )
-        else:
-            rag = RED
-            label = f"Significantly below forecast ({variance_pct:+.0%} vs CPR)"
-            flags.append(
-                f"CRITICAL: Production {abs(variance_pct):.0%} below CPR base case "
-                f"({current_rate_boepd:,.0f} boe/d actual vs {forecast_rate_boepd:,.0f} boe/d CPR) — "
-                "material reserve revision risk"
-            )
+        sev, label, flag = _PRIMARY_BANDS[bisect_right(cuts["primary"], variance_pct)]
+        label = label.format(v=variance_pct)
+        if flag:
+            flags.append((flag, {
+                "a": abs(variance_pct), "cur": current_rate_boepd, "fc": forecast_rate_boepd,
+            }))
     else:
         # No forecast available — classify on trends only
-        rag = GREEN
+        sev = _GREEN_SEV
         label = "On-track (no CPR forecast for comparison)"
-        flags.append("No CPR forecast found for this well — RAG based on trend metrics only")
-
-    # ── Secondary: GOR trend ──────────────────────────────────────────────────
-    if gor_trend_12m_pct is not None:
-        if gor_trend_12m_pct >= thresholds["gor_red"]:
-            rag = _max_severity(rag, RED)
-            flags.append(
-                f"GOR rising {gor_trend_12m_pct:+.0f}% over 12 months — "
-                "possible gas coning, aquifer encroachment, or depletion drive change; "
-                "recommend well test and PVT re-sampling"
-            )
-        elif gor_trend_12m_pct >= thresholds["gor_amber"]:
-            rag = _max_severity(rag, AMBER)
-            flags.append(
-                f"GOR rising {gor_trend_12m_pct:+.0f}% over 12 months — "
-                "monitor closely; cross-check against CPR PVT model"
-            )
-
-    # ── Secondary: WC trend ───────────────────────────────────────────────────
-    if wc_trend_12m_ppts is not None:
-        if wc_trend_12m_ppts >= thresholds["wc_red"]:
-            rag = _max_severity(rag, RED)
-            flags.append(
-                f"Water cut rising {wc_trend_12m_ppts:+.1f} ppts over 12 months — "
-                "possible early water breakthrough; review sweep efficiency and aquifer model"
-            )
-        elif wc_trend_12m_ppts >= thresholds["wc_amber"]:
-            rag = _max_severity(rag, AMBER)
-            flags.append(
-                f"Water cut rising {wc_trend_12m_ppts:+.1f} ppts over 12 months — "
-                "monitor; compare against CPR WC forecast trajectory"
-            )
-
-    # ── Secondary: steep decline ──────────────────────────────────────────────
-    if di_annual_pct is not None:
-        if di_annual_pct >= thresholds["di_red"]:
-            rag = _max_severity(rag, RED)
-            flags.append(
-                f"Annual decline {di_annual_pct:.0f}%/yr exceeds 50%/yr — "
-                "verify production data quality; may indicate reservoir compartmentalization or mechanical damage"
-            )
-        elif di_annual_pct >= thresholds["di_amber"]:
-            rag = _max_severity(rag, AMBER)
-            flags.append(
-                f"Annual decline {di_annual_pct:.0f}%/yr is above GoM deepwater benchmark (15–25%/yr)"
-            )
-
-    # ── Secondary: low uptime ─────────────────────────────────────────────────
-    if uptime_pct is not None:
-        if uptime_pct < thresholds["uptime_red"]:
-            rag = _max_severity(rag, RED)
-            flags.append(
-                f"Well uptime {uptime_pct:.0f}% is critically low (<70%) — "
-                "significant operational reliability concern; investigate root cause"
-            )
-        elif uptime_pct < thresholds["uptime_amber"]:
-            rag = _max_severity(rag, AMBER)
-            flags.append(
-                f"Well uptime {uptime_pct:.0f}% is below GoM benchmark (88–92%) — "
-                "review maintenance history and equipment reliability"
-            )
+        flags.append(("No CPR forecast found for this well — RAG based on trend metrics only", None))
+
+    # ── Secondary: GOR / WC trend, steep decline, low uptime ──────────────────
+    for key, value in (
+        ("gor", gor_trend_12m_pct),
+        ("wc", wc_trend_12m_ppts),
+        ("di", di_annual_pct),
+        ("uptime", uptime_pct),
+    ):
+        if value is None:
+            continue
+        escalation, flag = _SECONDARY_BANDS[key][bisect_right(cuts[key], value)]
+        if escalation:
+            sev = max(sev, escalation)
+            flags.append((flag, {"v": value}))
 
     # ── Secondary: poor DCA fit ───────────────────────────────────────────────
     if fit_r2 is not None and fit_r2 < R2_POOR:
-        flags.append(
-            f"DCA fit R²={fit_r2:.2f} is poor — EUR projection has limited confidence; "
-            "request additional production history or well tests"
-        )
+        flags.append((
+            "DCA fit R²={v:.2f} is poor — EUR projection has limited confidence; "
+            "request additional production history or well tests",
+            {"v": fit_r2},
+        ))
 
+    rag = _SEV_TO_STATUS[sev]
     return RAGResult(
         status=rag,
         label=label,
         emoji=RAG_EMOJI[rag],
         variance_pct=round(variance_pct * 100, 1) if variance_pct is not None else None,
-        flags=flags,
         learned_overrides=overrides,
+        flag_specs=flags,
     )
 
 
+def top_flag(flags: list[str], width: int = 80) -> str:
+    """First flag for summary tables, cut to width characters plus an ellipsis."""
+    if not flags:
+        return ""
+    first = flags[0]
+    return first[:width] + "…" if len(first) > width else first
+
+
+# ── Bulk classifier ───────────────────────────────────────────────────────────
+
+# Primary band (np.digitize over cuts["primary"]) → severity
+_PRIMARY_SEV = np.array([band[0] for band in _PRIMARY_BANDS], dtype=np.int8)
+_SECONDARY_SEV = {
+    key: np.array([band[0] for band in bands], dtype=np.int8)
+    for key, bands in _SECONDARY_BANDS.items()
+}
+
+
+def classify_wells_bulk(
+    current_rate_boepd:  np.ndarray,
+    forecast_rate_boepd: np.ndarray,
+    gor_trend_12m_pct:   np.ndarray | None = None,
+    wc_trend_12m_ppts:   np.ndarray | None = None,
+    di_annual_pct:       np.ndarray | None = None,
+    uptime_pct:          np.ndarray | None = None,
+    well_status:         list[str | None] | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized RAG status for a whole fleet, using the default thresholds.
+
+    Takes parallel arrays (one entry per well) and gives the same status as
+    classify_well() would for each well, without building labels or flags —
+    call classify_well() for wells that need the full RAGResult. Missing
+    values are NaN (or a None array for an absent metric); a forecast that
+    is NaN or <= 0 means "no CPR forecast".
+
+    Returns:
+        (status_codes, variance_pct):
+          status_codes — int8 codes, 0..3 = GREEN, AMBER, RED, BLACK
+                         (the _soa.RAG_STATUSES order);
+          variance_pct — actual vs. forecast % rounded to 0.1, NaN where
+                         there is no forecast or the well is BLACK.
+    """
+    cur = np.asarray(current_rate_boepd, dtype=np.float64)
+    fc  = np.asarray(forecast_rate_boepd, dtype=np.float64)
+
+    has_fc = fc > 0                      # False for NaN
+    with np.errstate(divide="ignore", invalid="ignore"):
+        variance = np.where(has_fc, (cur - fc) / fc, np.nan)
+    sev = np.where(
+        has_fc, _PRIMARY_SEV[np.digitize(variance, _DEFAULT_CUTS["primary"])], _GREEN_SEV,
+    ).astype(np.int8)
+
+    for key, values in (
+        ("gor", gor_trend_12m_pct),
+        ("wc", wc_trend_12m_ppts),
+        ("di", di_annual_pct),
+        ("uptime", uptime_pct),
+    ):
+        if values is None:
+            continue
+        v = np.asarray(values, dtype=np.float64)
+        escalation = _SECONDARY_SEV[key][np.digitize(v, _DEFAULT_CUTS[key])]
+        np.maximum(sev, np.where(np.isnan(v), 0, escalation), out=sev, casting="unsafe")
+
+    black = cur <= 0
+    if well_status is not None:
+        black |= np.fromiter(
+            ((s or "").lower() in _SHUT_IN_STATES for s in well_status),
+            dtype=bool, count=len(well_status),
+        )
+    sev[black] = _SEVERITY_ORDER[BLACK]
+    variance[black] = np.nan
+
+    return (sev - 1).astype(np.int8), np.round(variance * 100, 1)
+
+
 def summarize_fleet_rag(well_cards: list[dict]) -> dict:
     """
     Aggregate RAG counts and fleet statistics from a list of well card dicts.
+
+    One pass pulls the per-well fields into flat arrays; counts and totals
+    then run as NumPy reductions.
     """
-    counts = {GREEN: 0, AMBER: 0, RED: 0, BLACK: 0}
-    critical_flags = 0
-    rates = []
-    eurs = []
-
-    for card in well_cards:
-        status = card.get("rag_status", GREEN)
-        counts[status] = counts.get(status, 0) + 1
-        flags = card.get("flags", [])
-        critical_flags += sum(1 for f in flags if "CRITICAL" in f.upper())
-        if card.get("metrics", {}).get("current_rate_boepd"):
-            rates.append(card["metrics"]["current_rate_boepd"])
-        if card.get("decline_curve", {}).get("eur_mmboe"):
-            eurs.append(card["decline_curve"]["eur_mmboe"])
-
-    total_rate = round(sum(rates), 1)
-    total_eur  = round(sum(eurs), 3)
-
-    di_values = [
-        c.get("decline_curve", {}).get("Di_annual_pct", 0)
-        for c in well_cards
-        if c.get("decline_curve", {}).get("Di_annual_pct")
-    ]
-    weighted_di = round(float(sum(di_values) / len(di_values)), 1) if di_values else None
+    codes = dict(_RAG_CODES)   # unknown statuses get appended codes
+    statuses = np.fromiter(
+        (codes.setdefault(c.get("rag_status", GREEN), len(codes)) for c in well_cards),
+        dtype=np.int16, count=len(well_cards),
+    )
+    tally = np.bincount(statuses, minlength=len(codes))
+    counts = {s: int(tally[i]) for s, i in codes.items()}
+
+    metrics = [c.get("metrics") or {} for c in well_cards]
+    curves  = [c.get("decline_curve") or {} for c in well_cards]
+    rates = np.fromiter((v for m in metrics if (v := m.get("current_rate_boepd"))), dtype=float)
+    eurs  = np.fromiter((v for d in curves if (v := d.get("eur_mmboe"))), dtype=float)
+    di    = np.fromiter((v for d in curves if (v := d.get("Di_annual_pct"))), dtype=float)
+
+    search = _CRITICAL_RE.search
+    critical_flags = sum(1 for c in well_cards for f in c.get("flags", []) if search(f))
 
     return {
         "rag_summary":              counts,
-        "total_current_rate_boepd": total_rate,
-        "total_eur_mmboe":          total_eur,
+        "total_current_rate_boepd": round(float(rates.sum()), 1),
+        "total_eur_mmboe":          round(float(eurs.sum()), 3),
         "critical_flag_count":      critical_flags,
-        "weighted_decline_rate_pct": weighted_di,
+        "weighted_decline_rate_pct": round(float(di.mean()), 1) if di.size else None,
     }
@@ -9,18 +9,32 @@ from __future__ import annotations
 
 import logging
 import os
-from datetime import datetime
+import tempfile
+from collections.abc import Iterator
+from datetime import datetime, timezone
 from pathlib import Path
 
+from aigis_agents.agent_07_well_cards._soa import build_soa, rag_order
 from aigis_agents.agent_07_well_cards.rag_classifier import (
-    GREEN, AMBER, RED, BLACK, RAG_EMOJI, summarize_fleet_rag,
+    GREEN, AMBER, RED, BLACK, RAG_EMOJI, summarize_fleet_rag, top_flag,
 )
 
 log = logging.getLogger(__name__)
 
-# RAG ordering for report sections (GREEN first, BLACK last)
-_RAG_ORDER = {GREEN: 0, AMBER: 1, RED: 2, BLACK: 3}
+# Per-well charts directory relative to the report, as a link prefix
+_CHARTS_PREFIX = "07_well_charts/"
 
+# "Generated:" timestamp in the report header
+_TS_FMT = "%d %b %Y %H:%M UTC"
+
+# Write buffer for the streamed report (fleet reports run to several MB)
+_WRITE_BUFFER = 1 << 20
+
+# Mode a plain open() would give the report (mkstemp creates 0600). The umask
+# can only be read by setting it, so read it once at import, not per report.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+_REPORT_MODE = 0o666 & ~_UMASK
 
 # ── Section builders ──────────────────────────────────────────────────────────
 
@@ -42,33 +56,106 @@ def _fleet_overview_table(fleet: dict) -> str:
     return "\n".join(["| Metric | Value |", "|--------|-------|"] + rows)
 
 
-def _rag_summary_table(well_cards: list[dict]) -> str:
+def _rag_meta(well_cards: list[dict]) -> list[tuple[str, str]]:
+    """(emoji, status) per card, resolved once and shared by the section builders."""
+    meta = []
+    for card in well_cards:
+        rag = card.get("rag_status", GREEN)
+        meta.append((RAG_EMOJI.get(rag, ""), rag))
+    return meta
+
+
+def _rag_summary_table(
+    well_cards: list[dict],
+    meta: list[tuple[str, str]] | None = None,
+) -> str:
     header = (
         "| Well | Rate (boe/d) | EUR (MMboe) | vs CPR 2P | RAG | Top Flag |\n"
         "|------|-------------|-------------|-----------|-----|----------|\n"
     )
-    rows = []
-    for card in well_cards:
-        m   = card.get("metrics", {})
-        dc  = card.get("decline_curve", {})
-        rag = card.get("rag_status", GREEN)
-        em  = RAG_EMOJI.get(rag, "")
-        rate = f"{m.get('current_rate_boepd', 0):,.0f}" if m.get("current_rate_boepd") else "—"
-        eur  = f"{dc.get('eur_mmboe', 0):.2f}" if dc.get("eur_mmboe") else "—"
+    if meta is None:
+        meta = _rag_meta(well_cards)
+    rows: list[str] = []
+    append = rows.append
+    for card, (em, rag) in zip(well_cards, meta):
+        get  = card.get
+        rate = get("metrics", {}).get("current_rate_boepd")
+        dc   = get("decline_curve", {})
+        eur  = dc.get("eur_mmboe")
         vs_cpr = dc.get("eur_vs_cpr_2p_pct")
-        vs_str = f"{vs_cpr:+.0f}%" if vs_cpr is not None else "N/A"
-        flags   = card.get("flags", [])
-        top_flag = flags[0][:80] + "…" if flags and len(flags[0]) > 80 else (flags[0] if flags else "")
-        rows.append(
-            f"| {card.get('well_name', '?')} | {rate} | {eur} | {vs_str} | {em} {rag} | {top_flag} |"
-        )
+        top = get("top_flag")
+        if top is None:   # cards built before top_flag was stored
+            top = top_flag(get("flags", []))
+        append("| %s | %s | %s | %s | %s %s | %s |" % (
+            get("well_name", "?"),
+            format(rate, ",.0f") if rate else "—",
+            format(eur, ".2f") if eur else "—",
+            format(vs_cpr, "+.0f") + "%" if vs_cpr is not None else "N/A",
+            em, rag,
+            top,
+        ))
     return header + "\n".join(rows)
 
 
-def _well_section(card: dict, charts_rel_dir: str | None) -> str:
+# (label, key, format spec, unit) for the per-well Key Metrics and DCA tables
+_METRIC_SPEC: tuple[tuple[str, str, str, str], ...] = (
+    ("Current rate",  "current_rate_boepd", ",.0f", " boe/d"),
+    ("Peak rate",     "peak_rate_boepd",    ",.0f", " boe/d"),
+    ("Cumulative",    "cumulative_mmboe",   ".3f",  " MMboe"),
+    ("IP30",          "ip30_boepd",         ",.0f", " boe/d"),
+    ("IP90",          "ip90_boepd",         ",.0f", " boe/d"),
+    ("IP180",         "ip180_boepd",        ",.0f", " boe/d"),
+    ("12-mo trend",   "trend_12m_pct",      "+.1f", " %"),
+    ("GOR (latest)",  "gor_scf_stb",        ",.0f", " scf/stb"),
+    ("GOR trend 12m", "gor_trend_12m_pct",  "+.1f", " %"),
+    ("Water cut",     "water_cut_pct",      ".1f",  " %"),
+    ("WC trend 12m",  "wc_trend_12m_ppts",  "+.1f", "  ppts"),
+)
+
+_DCA_SPEC: tuple[tuple[str, str, str, str], ...] = (
+    ("qi (initial rate)", "qi_boepd",          ",.0f", " boe/d"),
+    ("Di (annual)",       "Di_annual_pct",     ".1f",  " %/yr"),
+    ("b-factor",          "b_factor",          ".3f",  ""),
+    ("DCA EUR",           "eur_mmboe",         ".3f",  " MMboe"),
+    ("EUR vs CPR 2P",     "eur_vs_cpr_2p_pct", "+.1f", " %"),
+    ("Fit R²",            "fit_r2",            ".3f",  ""),
+)
+
+
+def _row(label: str, val, fmt: str = ".1f", unit: str = "") -> str:
+    if val is None:
+        return f"| {label} | N/A |"
+    try:
+        return f"| {label} | {format(val, fmt)}{' ' + unit if unit else ''} |"
+    except (TypeError, ValueError):
+        return f"| {label} | {val} |"
+
+
+def _spec_rows(d: dict, spec: tuple[tuple[str, str, str, str], ...]) -> list[str]:
+    """Render one table row per spec entry; units in spec carry their leading space."""
+    get, fmt = d.get, format
+    rows: list[str] = []
+    append = rows.append
+    for label, key, f, unit in spec:
+        val = get(key)
+        if val is None:
+            append(f"| {label} | N/A |")
+            continue
+        try:
+            append(f"| {label} | {fmt(val, f)}{unit} |")
+        except (TypeError, ValueError):
+            append(f"| {label} | {val} |")
+    return rows
+
+
+def _well_section(
+    card: dict,
+    charts_prefix: str | None,
+    meta: tuple[str, str] | None = None,
+) -> str:
+    """Render one well card; charts_prefix is the chart link directory ending in '/'."""
     well  = card.get("well_name", "Unknown")
-    rag   = card.get("rag_status", GREEN)
-    em    = RAG_EMOJI.get(rag, "")
+    em, rag = meta if meta is not None else _rag_meta([card])[0]
     label = card.get("rag_label", "")
     m     = card.get("metrics", {})
     dc    = card.get("decline_curve", {})
@@ -84,28 +171,10 @@ def _well_section(card: dict, charts_rel_dir: str | None) -> str:
         "|--------|-------|",
     ]
 
-    def _row(label: str, val, fmt: str = ".1f", unit: str = "") -> str:
-        if val is None:
-            return f"| {label} | N/A |"
-        try:
-            return f"| {label} | {format(val, fmt)}{' ' + unit if unit else ''} |"
-        except (TypeError, ValueError):
-            return f"| {label} | {val} |"
-
-    lines += [
-        _row("Current rate",   m.get("current_rate_boepd"), ",.0f", "boe/d"),
-        _row("Peak rate",      m.get("peak_rate_boepd"),    ",.0f", "boe/d"),
-        _row("Cumulative",     m.get("cumulative_mmboe"),   ".3f",  "MMboe"),
-        _row("IP30",           m.get("ip30_boepd"),         ",.0f", "boe/d"),
-        _row("IP90",           m.get("ip90_boepd"),         ",.0f", "boe/d"),
-        _row("IP180",          m.get("ip180_boepd"),        ",.0f", "boe/d"),
-        _row("12-mo trend",    m.get("trend_12m_pct"),      "+.1f", "%"),
-        _row("GOR (latest)",   m.get("gor_scf_stb"),        ",.0f", "scf/stb"),
-        _row("GOR trend 12m",  m.get("gor_trend_12m_pct"),  "+.1f", "%"),
-        _row("Water cut",      m.get("water_cut_pct"),      ".1f",  "%"),
-        _row("WC trend 12m",   m.get("wc_trend_12m_ppts"),  "+.1f", " ppts"),
-        _row("Uptime",         m.get("uptime_pct"),         ".1f",  f"% ({m.get('uptime_source', 'assumed')})"),
-    ]
+    lines += _spec_rows(m, _METRIC_SPEC)
+    lines.append(_row(
+        "Uptime", m.get("uptime_pct"), ".1f", f"% ({m.get('uptime_source', 'assumed')})",
+    ))
 
     lines += [
         "",
@@ -113,13 +182,8 @@ def _well_section(card: dict, charts_rel_dir: str | None) -> str:
         "| Parameter | Value |",
         "|-----------|-------|",
         f"| Curve type | {dc.get('curve_type', 'N/A')} |",
-        _row("qi (initial rate)", dc.get("qi_boepd"),      ",.0f", "boe/d"),
-        _row("Di (annual)",       dc.get("Di_annual_pct"), ".1f",  "%/yr"),
-        _row("b-factor",          dc.get("b_factor"),      ".3f"),
-        _row("DCA EUR",           dc.get("eur_mmboe"),     ".3f",  "MMboe"),
-        _row("EUR vs CPR 2P",     dc.get("eur_vs_cpr_2p_pct"), "+.1f", "%"),
-        _row("Fit R²",            dc.get("fit_r2"),        ".3f"),
     ]
+    lines += _spec_rows(dc, _DCA_SPEC)
 
     if res:
         lines += [
@@ -137,9 +201,8 @@ def _well_section(card: dict, charts_rel_dir: str | None) -> str:
 
     # Chart embed
     chart_path = card.get("chart_path")
-    if chart_path and charts_rel_dir:
-        chart_filename = os.path.basename(chart_path)
-        rel_path = os.path.join(charts_rel_dir, chart_filename).replace("\\", "/")
+    if chart_path and charts_prefix:
+        rel_path = charts_prefix + chart_path.replace("\\", "/").rpartition("/")[2]
         lines += ["", f"![{well} production chart]({rel_path})", ""]
 
     # Narrative
@@ -190,8 +253,8 @@ Production history is fitted using Arps hyperbolic decline:
 
 where t is time in months, qi is initial rate, Di is monthly decline rate, and b is the
 hyperbolic exponent. If the hyperbolic fit fails (R² < 0.70 or scipy convergence error),
-exponential decline is used as a conservative fallback. EUR is computed by numerical
-integration (trapezoid rule) to economic limit ({economic_limit_boepd:.0f} boe/d) over a
+exponential decline is used as a conservative fallback. EUR is computed by analytic
+integration of the fitted curve to economic limit ({economic_limit_boepd:.0f} boe/d) over a
 {projection_years}-year horizon.
 
 **GoM deepwater benchmarks applied:**
@@ -228,6 +291,64 @@ Secondary metrics (GOR trend, WC trend, annual decline, uptime) can escalate but
 """
 
 
+# ── Section iterator ──────────────────────────────────────────────────────────
+
+def _iter_sections(
+    sorted_cards:     list[dict],
+    fleet:            dict,
+    deal_name:        str,
+    deal_id:          str,
+    now:              str,
+    output_path:      str,
+    fleet_chart_path: str | None,
+    dashboard_path:   str | None,
+    methodology:      dict,
+) -> Iterator[str]:
+    """Yield the report's sections in order; the writer joins them with newlines."""
+    n = fleet["total_wells"]
+
+    # Fleet chart / dashboard links are relative to the report's directory
+    charts_dir = os.path.dirname(output_path)
+
+    # Header
+    yield (
+        f"# Well Performance Intelligence Cards — {deal_name}\n"
+        f"*Generated: {now} | {n} well{'s' if n != 1 else ''} | Deal ID: `{deal_id}`*\n"
+    )
+
+    # Fleet overview
+    yield "## Fleet Overview\n"
+    yield _fleet_overview_table(fleet)
+    yield ""
+
+    if fleet_chart_path:
+        rel = os.path.relpath(fleet_chart_path, charts_dir).replace("\\", "/")
+        yield f"![Fleet production overview]({rel})\n"
+
+    if dashboard_path:
+        rel = os.path.relpath(dashboard_path, charts_dir).replace("\\", "/")
+        yield f"📊 [Interactive Fleet Dashboard]({rel})\n"
+
+    # RAG summary table
+    sorted_meta = _rag_meta(sorted_cards)
+    yield "## RAG Status Summary\n"
+    yield _rag_summary_table(sorted_cards, sorted_meta)
+    yield ""
+
+    # Individual well cards
+    yield "---\n## Individual Well Cards\n"
+    yield (
+        "> Wells ordered by RAG severity (GREEN → AMBER → RED → BLACK), "
+        "then by current production rate.\n"
+    )
+
+    for card, meta in zip(sorted_cards, sorted_meta):
+        yield _well_section(card, _CHARTS_PREFIX, meta)
+
+    # Methodology appendix
+    yield _methodology_appendix(**methodology)
+
+
 # ── Main report generator ─────────────────────────────────────────────────────
 
 def generate_md_report(
@@ -242,6 +363,7 @@ def generate_md_report(
     forecast_case:        str        = "cpr_base_case",
     economic_limit_boepd: float      = 25.0,
     projection_years:     int        = 20,
+    soa:                  dict | None = None,
 ) -> str:
     """
     Assemble and write the Markdown fleet performance report.
@@ -255,11 +377,12 @@ def generate_md_report(
         dashboard_path:   Path to Plotly HTML dashboard (linked, not embedded).
         downtime_treatment, default_uptime_pct, forecast_case, economic_limit_boepd,
         projection_years: Passed to methodology appendix for transparency.
+        soa:              Column view from _soa.build_soa(); built here if omitted.
 
     Returns:
         The output_path that was written.
     """
-    now = datetime.utcnow().strftime("%d %b %Y %H:%M UTC")
+    now = datetime.now(timezone.utc).strftime(_TS_FMT)
     n   = len(well_cards)
 
     # Fleet stats
@@ -267,63 +390,41 @@ def generate_md_report(
     fleet["total_wells"] = n
 
     # Sort: GREEN → AMBER → RED → BLACK
-    sorted_cards = sorted(well_cards, key=lambda c: _RAG_ORDER.get(c.get("rag_status", GREEN), 0))
-
-    # Relative charts directory (sibling folder)
-    charts_dir  = os.path.dirname(output_path)
-    charts_rel  = "07_well_charts"  # relative to report location
-
-    # ── Assemble sections ─────────────────────────────────────────────────────
-    sections: list[str] = []
-
-    # Header
-    sections.append(
-        f"# Well Performance Intelligence Cards — {deal_name}\n"
-        f"*Generated: {now} | {n} well{'s' if n != 1 else ''} | Deal ID: `{deal_id}`*\n"
+    if soa is None:
+        soa = build_soa(well_cards)
+    sorted_cards = [well_cards[i] for i in rag_order(soa)]
+
+    sections = _iter_sections(
+        sorted_cards, fleet, deal_name, deal_id, now, output_path,
+        fleet_chart_path, dashboard_path,
+        methodology=dict(
+            downtime_treatment   = downtime_treatment,
+            default_uptime_pct   = default_uptime_pct,
+            forecast_case        = forecast_case,
+            economic_limit_boepd = economic_limit_boepd,
+            projection_years     = projection_years,
+        ),
     )
 
-    # Fleet overview
-    sections.append("## Fleet Overview\n")
-    sections.append(_fleet_overview_table(fleet))
-    sections.append("")
-
-    if fleet_chart_path:
-        rel = os.path.relpath(fleet_chart_path, charts_dir).replace("\\", "/")
-        sections.append(f"![Fleet production overview]({rel})\n")
-
-    if dashboard_path:
-        rel = os.path.relpath(dashboard_path, charts_dir).replace("\\", "/")
-        sections.append(f"📊 [Interactive Fleet Dashboard]({rel})\n")
-
-    # RAG summary table
-    sections.append("## RAG Status Summary\n")
-    sections.append(_rag_summary_table(sorted_cards))
-    sections.append("")
-
-    # Individual well cards
-    sections.append("---\n## Individual Well Cards\n")
-    sections.append(
-        "> Wells ordered by RAG severity (GREEN → AMBER → RED → BLACK), "
-        "then by current production rate.\n"
-    )
-
-    for card in sorted_cards:
-        sections.append(_well_section(card, charts_rel))
-
-    # Methodology appendix
-    sections.append(_methodology_appendix(
-        downtime_treatment   = downtime_treatment,
-        default_uptime_pct   = default_uptime_pct,
-        forecast_case        = forecast_case,
-        economic_limit_boepd = economic_limit_boepd,
-        projection_years     = projection_years,
-    ))
-
-    # Write file
-    content = "\n".join(sections)
-    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w", encoding="utf-8") as fh:
-        fh.write(content)
+    # Stream sections to a temp file beside the report, then swap it in, so a
+    # failure part-way through never leaves a truncated report behind
+    out = Path(output_path)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=out.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline="\n", buffering=_WRITE_BUFFER) as fh:
+            fh.write(next(sections))
+            for section in sections:
+                fh.write("\n")
+                fh.write(section)
+        os.chmod(tmp, _REPORT_MODE)
+        os.replace(tmp, out)
+    except Exception:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
 
     log.info("Written well performance report: %s", output_path)
     return output_path
@@ -10,6 +10,9 @@ Orchestrates:
   6. LLM narrative + anomaly flags via DCA_REVIEW_PROMPT
   7. Chart generation via chart_generator
   8. Assemble final WellCard dict
+
+build_well_cards_bulk() runs steps 1–5 for every well first, then sends all
+narrative prompts in one main_llm.batch() call before finishing each card.
 """
 
 from __future__ import annotations
@@ -17,32 +20,64 @@ from __future__ import annotations
 import json
 import logging
 import os
+import re
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
+
+from langchain_core.messages import HumanMessage, SystemMessage
+from pydantic import BaseModel, Field
 
+from aigis_agents.agent_07_well_cards._pool import PARALLEL_MIN_WELLS, pool_size, process_pool
 from aigis_agents.agent_07_well_cards.dca_engine import fit_decline_curve
 from aigis_agents.agent_07_well_cards.production_processor import (
+    load_all_pivoted,
+    load_all_production_series,
+    load_all_reserve_estimates,
+    load_all_scalar_metrics,
+    load_pivoted,
     load_production_series,
     load_reserve_estimates,
     load_scalar_metrics,
     pivot_production,
     pivot_forecast,
+    split_pivoted,
     normalize_production,
-    compute_secondary_metrics,
-    compute_summary_stats,
+    compute_secondary_columns,
+    SummaryStats,
+    compute_summary,
     extract_cpr_eur,
 )
 from aigis_agents.agent_07_well_cards.rag_classifier import (
     classify_well,
     RAGResult,
+    top_flag,
 )
 
 log = logging.getLogger(__name__)
 
+# orjson parses LLM replies several times faster than the stdlib; optional
+_ORJSON_AVAILABLE = False
+try:
+    import orjson  # type: ignore[import]
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    pass
+
+_json_loads = orjson.loads if _ORJSON_AVAILABLE else json.loads
+
+# First "{" to last "}" of a text reply (greedy, so nested objects stay whole)
+_JSON_OBJECT_RE = re.compile(r"\{.*\}", re.DOTALL)
+
 # ── LLM prompt template ───────────────────────────────────────────────────────
 
-DCA_REVIEW_PROMPT = """You are a senior reservoir engineer conducting M&A due diligence.
-Review the Decline Curve Analysis (DCA) and production trends for well {well_name}.
+# Split so the deal-level part is a stable prefix: the system message is
+# identical for every well in a run (prompt-caching providers reuse it) and
+# only the short per-well block changes.
+
+DCA_REVIEW_SYSTEM = """You are a senior reservoir engineer conducting M&A due diligence.
+You review the Decline Curve Analysis (DCA) and production trends of one well at a time.
 
 DOMAIN KNOWLEDGE CONTEXT:
 {dk_context}
@@ -50,6 +85,15 @@ DOMAIN KNOWLEDGE CONTEXT:
 ENTITY CONTEXT:
 {entity_context}
 
+TASKS — for the well in the user message:
+1. Validate the b-factor against the stated drive mechanism in entity context. Flag if inconsistent with GoM Miocene deepwater benchmarks (b=0.3–0.7 for partial water drive).
+2. Comment on the annual decline rate vs. GoM deepwater benchmarks (15–25%/yr initial; 3–6%/yr terminal). Is it plausible given the well's age and production history?
+3. If DCA EUR deviates more than ±15% from CPR 2P, identify the likely cause.
+4. List the top 2–3 reservoir engineering red flags relevant to this well.
+5. Write a 3–4 sentence well card narrative suitable for a due diligence report, citing specific numbers and comparing against CPR forecasts."""
+
+DCA_REVIEW_PROMPT = """Review well {well_name}.
+
 DCA PARAMETERS:
   Curve type:     {curve_type}
   qi (initial):   {qi:.0f} boe/d
@@ -80,23 +124,28 @@ DCA FLAGS FROM AUTOMATED ANALYSIS:
 
 RAG STATUS: {rag_status} — {rag_label}
 RAG FLAGS:
-{rag_flags}
+{rag_flags}"""
 
-TASKS — respond ONLY with the JSON object below (no markdown, no prose outside JSON):
-1. Validate the b-factor ({b:.3f}) against the stated drive mechanism in entity context. Flag if inconsistent with GoM Miocene deepwater benchmarks (b=0.3–0.7 for partial water drive).
-2. Comment on the annual decline rate ({di:.1f}%/yr) vs. GoM deepwater benchmarks (15–25%/yr initial; 3–6%/yr terminal). Is it plausible given the well's age and production history?
-3. If DCA EUR ({eur:.3f} MMboe) deviates more than ±15% from CPR 2P ({cpr_2p}), identify the likely cause.
-4. List the top 2–3 reservoir engineering red flags relevant to this well.
-5. Write a 3–4 sentence well card narrative suitable for a due diligence report, citing specific numbers and comparing against CPR forecasts.
+# Appended for models without with_structured_output(): the reply is parsed as text.
+_JSON_RESPONSE_FORMAT = """
 
-Return JSON ONLY:
-{{
+Respond ONLY with this JSON object (no markdown, no prose outside JSON):
+{
   "b_flag": "<string or null>",
   "di_flag": "<string or null>",
   "eur_flag": "<string or null>",
   "red_flags": ["<flag 1>", "<flag 2>"],
   "narrative": "<3-4 sentence narrative>"
-}}"""
+}"""
+
+
+class DCAReview(BaseModel):
+    """LLM review of one well's DCA, bound as the structured-output schema."""
+    b_flag:    Optional[str] = Field(None, description="b-factor inconsistency vs. drive mechanism, or null")
+    di_flag:   Optional[str] = Field(None, description="Decline-rate comment vs. GoM benchmarks, or null")
+    eur_flag:  Optional[str] = Field(None, description="Likely cause of DCA EUR vs. CPR 2P deviation, or null")
+    red_flags: list[str]     = Field(default_factory=list, description="Top 2–3 reservoir engineering red flags")
+    narrative: str           = Field("", description="3–4 sentence well card narrative")
 
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
@@ -110,35 +159,75 @@ def _safe(val: Any, fmt: str = ".1f", fallback: str = "N/A") -> str:
         return fallback
 
 
+# Decimal places per well-card metric. Production and DCA maths run at full
+# precision; values are rounded once here, when the card is assembled.
+_METRIC_DECIMALS: dict[str, int] = {
+    "current_rate_boepd": 1,
+    "peak_rate_boepd":    1,
+    "cumulative_mmboe":   3,
+    "ip30_boepd":         1,
+    "ip90_boepd":         1,
+    "ip180_boepd":        1,
+    "trend_12m_pct":      1,
+    "gor_scf_stb":        0,
+    "gor_trend_12m_pct":  1,
+    "water_cut_pct":      2,
+    "wc_trend_12m_ppts":  2,
+    "uptime_pct":         1,
+}
+
+
+def _round_report(d: dict, decimals: dict[str, int] = _METRIC_DECIMALS) -> dict:
+    """Round the numeric fields of d listed in decimals (None / non-numeric left as-is)."""
+    for key, nd in decimals.items():
+        val = d.get(key)
+        if isinstance(val, float):
+            d[key] = round(val, nd)
+    return d
+
+
 def _format_flags(flags: list[str]) -> str:
     if not flags:
         return "  None"
     return "\n".join(f"  - {f}" for f in flags)
 
 
-def _call_llm_for_narrative(
+def _clip(text: str, limit: int) -> str:
+    """
+    text cut to at most limit characters, at the last whitespace when one
+    falls in the final fifth, so a figure like "1,500 scf/stb" isn't left
+    as "1,5". Falls back to a hard cut for unbroken text.
+    """
+    if len(text) <= limit:
+        return text
+    cut = text.rfind(" ", limit * 4 // 5, limit + 1)
+    cut = max(cut, text.rfind("\n", limit * 4 // 5, limit + 1))
+    return text[:cut] if cut > 0 else text[:limit]
+
+
+@lru_cache(maxsize=8)
+def _system_prompt(dk_context: str, entity_context: str) -> str:
+    """Format DCA_REVIEW_SYSTEM once per deal context."""
+    return DCA_REVIEW_SYSTEM.format(
+        dk_context=_clip(dk_context, 2000) if dk_context else "Not provided",
+        entity_context=_clip(entity_context, 1500) if entity_context else "Not provided",
+    )
+
+
+def _narrative_prompt(
     well_name: str,
     dca_result: Any,
     rag_result: RAGResult,
-    summary: dict,
+    summary: SummaryStats,
     reserve_estimates: dict,
-    dk_context: str,
-    entity_context: str,
-    main_llm: Any,
-) -> dict:
-    """
-    Call main_llm with DCA_REVIEW_PROMPT and parse the JSON response.
-    Returns dict with keys: b_flag, di_flag, eur_flag, red_flags, narrative.
-    Falls back to empty values on any failure.
-    """
+) -> str:
+    """Format the per-well DCA_REVIEW_PROMPT block."""
     cpr_1p = f"{reserve_estimates.get('1P'):.3f} MMboe" if reserve_estimates.get("1P") else "Not provided"
     cpr_2p = f"{reserve_estimates.get('2P'):.3f} MMboe" if reserve_estimates.get("2P") else "Not provided"
     cpr_3p = f"{reserve_estimates.get('3P'):.3f} MMboe" if reserve_estimates.get("3P") else "Not provided"
 
-    prompt = DCA_REVIEW_PROMPT.format(
+    return DCA_REVIEW_PROMPT.format(
         well_name=well_name,
-        dk_context=dk_context[:2000] if dk_context else "Not provided",
-        entity_context=entity_context[:1500] if entity_context else "Not provided",
         curve_type=dca_result.curve_type if dca_result else "N/A",
         qi=dca_result.qi_boepd if dca_result else 0,
         di=dca_result.Di_annual_pct if dca_result else 0,
@@ -149,101 +238,236 @@ def _call_llm_for_narrative(
         cpr_1p=cpr_1p,
         cpr_2p=cpr_2p,
         cpr_3p=cpr_3p,
-        current_rate=summary.get("current_rate_boepd", 0) or 0,
-        peak_rate=summary.get("peak_rate_boepd", 0) or 0,
-        cumulative=summary.get("cumulative_mmboe", 0) or 0,
-        trend_12m=summary.get("trend_12m_pct", 0) or 0,
-        gor_latest=_safe(summary.get("gor_scf_stb"), ",.0f"),
-        gor_trend=summary.get("gor_trend_12m_pct", 0) or 0,
-        wc_latest=summary.get("water_cut_pct", 0) or 0,
-        wc_trend=summary.get("wc_trend_12m_ppts", 0) or 0,
-        uptime=summary.get("uptime_pct", 90.0) or 90.0,
-        uptime_source=summary.get("uptime_source", "assumed"),
+        current_rate=summary.current_rate_boepd or 0,
+        peak_rate=summary.peak_rate_boepd or 0,
+        cumulative=summary.cumulative_mmboe or 0,
+        trend_12m=summary.trend_12m_pct or 0,
+        gor_latest=_safe(summary.gor_scf_stb, ",.0f"),
+        gor_trend=summary.gor_trend_12m_pct or 0,
+        wc_latest=summary.water_cut_pct or 0,
+        wc_trend=summary.wc_trend_12m_ppts or 0,
+        uptime=summary.uptime_pct or 90.0,
+        uptime_source=summary.uptime_source,
         dca_flags=_format_flags(dca_result.flags if dca_result else []),
         rag_status=rag_result.status,
         rag_label=rag_result.label,
         rag_flags=_format_flags(rag_result.flags),
     )
 
+
+def _parse_narrative(response: Any) -> dict:
+    """
+    Turn an LLM response into the narrative dict (raises on invalid output).
+
+    Structured-output responses arrive as DCAReview (or a plain dict from
+    some providers); from a text response the outermost JSON object is
+    extracted and parsed.
+    """
+    if isinstance(response, DCAReview):
+        return response.model_dump()
+    if isinstance(response, dict):
+        return DCAReview.model_validate(response).model_dump()
+    raw = response.content if hasattr(response, "content") else str(response)
+    # Outermost {...}: drops code fences and any prose around the object
+    m = _JSON_OBJECT_RE.search(raw)
+    return _json_loads(m.group(0) if m else raw)
+
+
+def _fallback_narrative(
+    well_name: str,
+    dca_result: Any,
+    rag_result: RAGResult,
+    summary: SummaryStats,
+) -> dict:
+    """Deterministic narrative used when the LLM call or its JSON fails."""
+    return {
+        "b_flag":    None,
+        "di_flag":   None,
+        "eur_flag":  None,
+        "red_flags": [],
+        "narrative": (
+            f"Well {well_name} shows a current rate of "
+            f"{summary.current_rate_boepd or 0:,.0f} boe/d. "
+            f"DCA analysis yielded {dca_result.curve_type if dca_result else 'insufficient data'} "
+            f"decline with EUR {dca_result.eur_mmboe:.3f} MMboe. "
+            f"RAG status: {rag_result.status} — {rag_result.label}."
+        ) if dca_result else f"No DCA available for {well_name}.",
+    }
+
+
+def _insufficient_data_narrative(well_name: str, dca_result: Any, summary: SummaryStats) -> dict:
+    """
+    Canned narrative for a well too short for DCA. There is no fit for the
+    LLM to review, so no call is made; the reason is already in the DCA flags.
+    """
+    return {
+        "b_flag":    None,
+        "di_flag":   None,
+        "eur_flag":  None,
+        "red_flags": [],
+        "narrative": (
+            f"Well {well_name} has {dca_result.months_of_data} months of production "
+            f"history, too few for decline curve analysis. Current rate "
+            f"{summary.current_rate_boepd or 0:,.0f} boe/d."
+        ),
+    }
+
+
+def _narrative_from_response(draft: dict, response: Any) -> dict:
+    """
+    Parse the LLM response for a prepared card into the narrative dict
+    (keys: b_flag, di_flag, eur_flag, red_flags, narrative).
+
+    response may be the exception raised by the call; that, or output that
+    doesn't fit DCAReview, yields the deterministic fallback narrative.
+    """
     try:
-        from langchain_core.messages import HumanMessage
-        response = main_llm.invoke([HumanMessage(content=prompt)])
-        raw = response.content if hasattr(response, "content") else str(response)
-        # Strip markdown code fences if present
-        raw = raw.strip()
-        if raw.startswith("```"):
-            raw = raw.split("```")[1]
-            if raw.startswith("json"):
-                raw = raw[4:]
-        result = json.loads(raw)
-        return result
+        if isinstance(response, BaseException):
+            raise response
+        return _parse_narrative(response)
     except Exception as exc:
-        log.warning("LLM narrative call failed for %s: %s", well_name, exc)
-        return {
-            "b_flag":    None,
-            "di_flag":   None,
-            "eur_flag":  None,
-            "red_flags": [],
-            "narrative": (
-                f"Well {well_name} shows a current rate of "
-                f"{summary.get('current_rate_boepd', 0):,.0f} boe/d. "
-                f"DCA analysis yielded {dca_result.curve_type if dca_result else 'insufficient data'} "
-                f"decline with EUR {dca_result.eur_mmboe:.3f} MMboe. "
-                f"RAG status: {rag_result.status} — {rag_result.label}."
-            ) if dca_result else f"No DCA available for {well_name}.",
-        }
+        log.warning("LLM narrative call failed for %s: %s", draft["well_name"], exc)
+        return _fallback_narrative(
+            draft["well_name"], draft["dca_result"], draft["rag_result"], draft["summary"],
+        )
 
 
-# ── Main builder ──────────────────────────────────────────────────────────────
+def _structured(main_llm: Any) -> Any | None:
+    """main_llm bound to the DCAReview schema, or None if the model can't bind one."""
+    if not hasattr(main_llm, "with_structured_output"):
+        return None
+    try:
+        return main_llm.with_structured_output(DCAReview)
+    except (NotImplementedError, ValueError) as exc:
+        log.debug("Structured output unavailable (%s); parsing JSON text", exc)
+        return None
 
-def build_well_card(
+
+def _system_message(system: str, main_llm: Any) -> Any:
+    """
+    SystemMessage for the deal-level prompt. On Anthropic models the block is
+    marked cache_control=ephemeral so repeat calls read it from the prompt
+    cache; OpenAI and Gemini cache a repeated prefix automatically.
+    """
+    if type(main_llm).__name__ == "ChatAnthropic":
+        return SystemMessage(content=[
+            {"type": "text", "text": system, "cache_control": {"type": "ephemeral"}},
+        ])
+    return SystemMessage(content=system)
+
+
+def _batch_invoke(
+    main_llm: Any,
+    system: str,
+    prompts: list[str],
+    max_concurrency: int,
+) -> list[Any]:
+    """
+    Send one [system, human] conversation per prompt and return the responses
+    in order, with an exception object in place of any failed call.
+
+    The DCAReview schema is bound with with_structured_output() where the model
+    supports it, so the provider enforces the reply shape; otherwise the JSON
+    format instructions are appended to the system prompt. Uses .batch()
+    (LangChain runs the calls concurrently, capped at max_concurrency) when
+    available, else invokes serially.
+    """
+    llm = _structured(main_llm)
+    if llm is None:
+        llm = main_llm
+        system += _JSON_RESPONSE_FORMAT
+    system_msg = _system_message(system, main_llm)
+    inputs = [[system_msg, HumanMessage(content=p)] for p in prompts]
+
+    if hasattr(llm, "batch"):
+        try:
+            return llm.batch(
+                inputs, config={"max_concurrency": max_concurrency}, return_exceptions=True,
+            )
+        except Exception as exc:
+            log.warning("LLM batch call failed (%s); falling back to per-well calls", exc)
+
+    responses: list[Any] = []
+    for messages in inputs:
+        try:
+            responses.append(llm.invoke(messages))
+        except Exception as exc:
+            responses.append(exc)
+    return responses
+
+
+def error_card(deal_id: str, well_name: str, exc: BaseException) -> dict:
+    """Placeholder BLACK card for a well whose card could not be built."""
+    return {
+        "deal_id":   deal_id,
+        "well_name": well_name,
+        "rag_status": "BLACK",
+        "rag_label":  "Error — card generation failed",
+        "rag_emoji":  "⚫",
+        "flags":     [f"Card generation error: {exc}"],
+        "narrative":  "",
+        "metrics":    {},
+        "decline_curve": {},
+        "data_quality": {"months_of_data": 0, "completeness_pct": 0},
+    }
+
+
+# ASCII characters other than alphanumerics and "-_" → "_"
+_SAFE_NAME_TABLE = str.maketrans({
+    c: "_" for c in map(chr, range(128)) if not (c.isalnum() or c in "-_")
+})
+
+
+def _chart_path(charts_dir: str, well_name: str) -> str:
+    """Per-well production chart path (well name made filesystem-safe)."""
+    if well_name.isascii():
+        safe_name = well_name.translate(_SAFE_NAME_TABLE)
+    else:
+        safe_name = "".join(c if c.isalnum() or c in "-_" else "_" for c in well_name)
+    return os.path.join(charts_dir, f"{safe_name}_production.png")
+
+
+# ── Card phases ───────────────────────────────────────────────────────────────
+
+def _prepare_card(
     deal_id:              str,
     well_name:            str,
-    main_llm:             Any,
-    dk_context:           str,
-    entity_context:       str,
     patterns:             list[dict],
-    output_dir:           str       = "./outputs",
-    downtime_treatment:   str       = "strip_estimated",
-    default_uptime_pct:   float     = 90.0,
-    forecast_case:        str       = "cpr_base_case",
-    economic_limit_boepd: float     = 25.0,
-    projection_years:     int       = 20,
-    charts_dir:           str | None = None,
-    generate_charts:      bool      = True,
+    output_dir:           str,
+    downtime_treatment:   str,
+    default_uptime_pct:   float,
+    forecast_case:        str,
+    economic_limit_boepd: float,
+    projection_years:     int,
+    records:              list[dict] | None,
+    pivoted:              dict[str, dict] | None,
+    reserve_records:      list[dict] | None,
+    scalar_records:       dict[str, float] | None,
 ) -> dict:
     """
-    Build a complete Well Intelligence Card dict for one well.
+    Run the deterministic steps (load → DCA → RAG) for one well.
 
-    Args:
-        deal_id:              Aigis deal identifier.
-        well_name:            Exact entity_name in production_series table.
-        main_llm:             Langchain-compatible LLM instance.
-        dk_context:           Domain knowledge text (GoM benchmarks, playbooks).
-        entity_context:       Entity-level context from deal documents.
-        patterns:             Learned patterns from MemoryManager.
-        output_dir:           Root output directory (Agent 02 DB lives here).
-        downtime_treatment:   "strip_estimated" (default) or "use_raw".
-        default_uptime_pct:   Assumed uptime % when no actual data (GoM: 90%).
-        forecast_case:        Which DB case to use for CPR forecast.
-        economic_limit_boepd: EUR integration cut-off rate.
-        projection_years:     DCA EUR projection horizon.
-        charts_dir:           Directory for PNG charts (None → skip charts).
-        generate_charts:      Set False to skip chart generation entirely.
-
-    Returns:
-        WellCard dict matching the spec return structure.
+    Returns the intermediate results plus the formatted narrative prompt, for
+    _finalize_card to complete once the LLM response is available.
     """
     data_flags: list[str] = []
 
     # ── 1. Load production data ───────────────────────────────────────────────
-    records = load_production_series(deal_id, well_name, output_dir)
-    reserve_records = load_reserve_estimates(deal_id, well_name, output_dir)
-    scalar_records  = load_scalar_metrics(deal_id, well_name, output_dir)
+    if pivoted is None and records is None:
+        pivoted = load_pivoted(deal_id, well_name, output_dir)   # None → no materialized view
+    if pivoted is None and records is None:
+        records = load_production_series(deal_id, well_name, output_dir)
+    if reserve_records is None:
+        reserve_records = load_reserve_estimates(deal_id, well_name, output_dir)
+    if scalar_records is None:
+        scalar_records  = load_scalar_metrics(deal_id, well_name, output_dir)
 
     # ── 2. Pivot actuals + forecast ───────────────────────────────────────────
-    actual_periods  = pivot_production(records, case_name=None)
-    forecast_data   = pivot_forecast(records, forecast_case=forecast_case)
+    if pivoted is not None:
+        actual_periods, forecast_data = split_pivoted(pivoted, forecast_case=forecast_case)
+    else:
+        actual_periods  = pivot_production(records, case_name=None)
+        forecast_data   = pivot_forecast(records, forecast_case=forecast_case)
 
     # ── 3. Downtime normalization ─────────────────────────────────────────────
     uptime_data = None
@@ -256,18 +480,14 @@ def build_well_card(
     data_flags.extend(norm_flags)
 
     # ── 4. Secondary metrics (GOR, WC, trends) ────────────────────────────────
-    enriched_periods = compute_secondary_metrics(normalized_periods)
-    summary          = compute_summary_stats(enriched_periods)
+    columns          = compute_secondary_columns(normalized_periods)
+    summary          = compute_summary(columns)
     reserve_ests     = extract_cpr_eur(reserve_records)
 
     # ── 5. DCA fitting ────────────────────────────────────────────────────────
-    import numpy as np
-    times = np.array([p.get("month_idx", i) for i, p in enumerate(enriched_periods)], dtype=float)
-    rates = np.array([p.get("boe_norm", p.get("boe_boepd", 0)) or 0.0 for p in enriched_periods], dtype=float)
-
     dca_result = fit_decline_curve(
-        times=times,
-        rates=rates,
+        times=columns.month_idx,
+        rates=columns.boe,
         economic_limit_boepd=economic_limit_boepd,
         projection_years=projection_years,
     )
@@ -279,52 +499,77 @@ def build_well_card(
         eur_vs_cpr_pct = round((dca_result.eur_mmboe - cpr_2p) / cpr_2p * 100, 1)
 
     # ── 6. RAG classification ─────────────────────────────────────────────────
-    current_rate   = summary.get("current_rate_boepd", 0) or 0.0
+    current_rate   = summary.current_rate_boepd or 0.0
     forecast_rate  = forecast_data.get(
-        enriched_periods[-1]["period"] if enriched_periods else "", {}
+        columns.period[-1] if len(columns) else "", {}
     ).get("boe_boepd") if forecast_data else None
 
     rag_result = classify_well(
         current_rate_boepd  = current_rate,
         forecast_rate_boepd = forecast_rate,
-        gor_trend_12m_pct   = summary.get("gor_trend_12m_pct"),
-        wc_trend_12m_ppts   = summary.get("wc_trend_12m_ppts"),
+        gor_trend_12m_pct   = summary.gor_trend_12m_pct,
+        wc_trend_12m_ppts   = summary.wc_trend_12m_ppts,
         di_annual_pct       = dca_result.Di_annual_pct if dca_result else None,
         fit_r2              = dca_result.fit_r2        if dca_result else None,
-        uptime_pct          = summary.get("uptime_pct"),
+        uptime_pct          = summary.uptime_pct,
         well_status         = scalar_records.get("well_status"),
         patterns            = patterns,
     )
 
-    # ── 7. LLM narrative ─────────────────────────────────────────────────────
-    llm_output = _call_llm_for_narrative(
-        well_name        = well_name,
-        dca_result       = dca_result,
-        rag_result       = rag_result,
-        summary          = summary,
-        reserve_estimates = reserve_ests,
-        dk_context       = dk_context,
-        entity_context   = entity_context,
-        main_llm         = main_llm,
-    )
+    # No fit to review → no LLM call (prompt None)
+    prompt = None if dca_result.insufficient_data else \
+        _narrative_prompt(well_name, dca_result, rag_result, summary, reserve_ests)
+
+    return {
+        "well_name":        well_name,
+        "data_flags":       data_flags,
+        "columns":          columns,
+        "forecast_data":    forecast_data,
+        "summary":          summary,
+        "reserve_ests":     reserve_ests,
+        "dca_result":       dca_result,
+        "eur_vs_cpr_pct":   eur_vs_cpr_pct,
+        "rag_result":       rag_result,
+        "prompt":           prompt,
+    }
+
+
+def _finalize_card(
+    deal_id:         str,
+    draft:           dict,
+    llm_output:      dict,
+    charts_dir:      str | None,
+    generate_charts: bool,
+) -> dict:
+    """Merge the LLM review into the flags, render the chart and assemble the card."""
+    well_name        = draft["well_name"]
+    data_flags       = draft["data_flags"]
+    enriched_periods = draft["periods"] if "periods" in draft else draft["columns"].to_records()
+    forecast_data    = draft["forecast_data"]
+    summary          = draft["summary"]
+    reserve_ests     = draft["reserve_ests"]
+    dca_result       = draft["dca_result"]
+    eur_vs_cpr_pct   = draft["eur_vs_cpr_pct"]
+    rag_result       = draft["rag_result"]
 
     # Merge LLM red_flags into overall flag list
     all_flags = list(rag_result.flags) + list(dca_result.flags)
-    for rf in llm_output.get("red_flags", []):
-        if rf and rf not in all_flags:
+    seen      = set(all_flags)
+    llm_flags = chain(
+        llm_output.get("red_flags", []),
+        (llm_output.get(key) for key in ("b_flag", "di_flag", "eur_flag")),
+    )
+    for rf in llm_flags:
+        if rf and rf not in seen:
+            seen.add(rf)
             all_flags.append(rf)
-    for key in ("b_flag", "di_flag", "eur_flag"):
-        val = llm_output.get(key)
-        if val and val not in all_flags:
-            all_flags.append(val)
 
     # ── 8. Charts ─────────────────────────────────────────────────────────────
     chart_path: str | None = None
     if generate_charts and charts_dir:
         try:
             from aigis_agents.agent_07_well_cards.chart_generator import generate_well_chart
-            safe_name = "".join(c if c.isalnum() or c in "-_" else "_" for c in well_name)
-            chart_path = os.path.join(charts_dir, f"{safe_name}_production.png")
+            chart_path = _chart_path(charts_dir, well_name)
             generate_well_chart(
                 well_name     = well_name,
                 periods       = enriched_periods,
@@ -350,21 +595,10 @@ def build_well_card(
         "rag_label":  rag_result.label,
         "rag_emoji":  rag_result.emoji,
 
-        "metrics": {
-            "current_rate_boepd":  summary.get("current_rate_boepd"),
-            "peak_rate_boepd":     summary.get("peak_rate_boepd"),
-            "cumulative_mmboe":    summary.get("cumulative_mmboe"),
-            "ip30_boepd":          summary.get("ip30_boepd"),
-            "ip90_boepd":          summary.get("ip90_boepd"),
-            "ip180_boepd":         summary.get("ip180_boepd"),
-            "trend_12m_pct":       summary.get("trend_12m_pct"),
-            "gor_scf_stb":         summary.get("gor_scf_stb"),
-            "gor_trend_12m_pct":   summary.get("gor_trend_12m_pct"),
-            "water_cut_pct":       summary.get("water_cut_pct"),
-            "wc_trend_12m_ppts":   summary.get("wc_trend_12m_ppts"),
-            "uptime_pct":          summary.get("uptime_pct"),
-            "uptime_source":       summary.get("uptime_source", "assumed"),
-        },
+        "metrics": _round_report({
+            **{key: getattr(summary, key) for key in _METRIC_DECIMALS},
+            "uptime_source": summary.uptime_source,
+        }),
 
         "decline_curve": {
             "curve_type":        dca_result.curve_type,
@@ -380,6 +614,7 @@ def build_well_card(
         "reserve_estimates": reserve_ests,
 
         "flags":     all_flags,
+        "top_flag":  top_flag(all_flags),
         "narrative": llm_output.get("narrative", ""),
         "learned_overrides": rag_result.learned_overrides,
 
@@ -397,3 +632,224 @@ def build_well_card(
     }
 
     return card
+
+
+# ── Main builder ──────────────────────────────────────────────────────────────
+
+def build_well_card(
+    deal_id:              str,
+    well_name:            str,
+    main_llm:             Any,
+    dk_context:           str,
+    entity_context:       str,
+    patterns:             list[dict],
+    output_dir:           str       = "./outputs",
+    downtime_treatment:   str       = "strip_estimated",
+    default_uptime_pct:   float     = 90.0,
+    forecast_case:        str       = "cpr_base_case",
+    economic_limit_boepd: float     = 25.0,
+    projection_years:     int       = 20,
+    charts_dir:           str | None = None,
+    generate_charts:      bool      = True,
+    records:              list[dict] | None            = None,
+    pivoted:              dict[str, dict] | None       = None,
+    reserve_records:      list[dict] | None            = None,
+    scalar_records:       dict[str, float] | None      = None,
+) -> dict:
+    """
+    Build a complete Well Intelligence Card dict for one well.
+
+    Args:
+        deal_id:              Aigis deal identifier.
+        well_name:            Exact entity_name in production_series table.
+        main_llm:             Langchain-compatible LLM instance.
+        dk_context:           Domain knowledge text (GoM benchmarks, playbooks).
+        entity_context:       Entity-level context from deal documents.
+        patterns:             Learned patterns from MemoryManager.
+        output_dir:           Root output directory (Agent 02 DB lives here).
+        downtime_treatment:   "strip_estimated" (default) or "use_raw".
+        default_uptime_pct:   Assumed uptime % when no actual data (GoM: 90%).
+        forecast_case:        Which DB case to use for CPR forecast.
+        economic_limit_boepd: EUR integration cut-off rate.
+        projection_years:     DCA EUR projection horizon.
+        charts_dir:           Directory for PNG charts (None → skip charts).
+        generate_charts:      Set False to skip chart generation entirely.
+        records:              Preloaded production rows (from load_all_production_series);
+                              None → queried for this well.
+        pivoted:              Preloaded per-case monthly pivots (from load_all_pivoted);
+                              used instead of records when given.
+        reserve_records:      Preloaded reserve estimate rows; None → queried.
+        scalar_records:       Preloaded scalar metrics; None → queried.
+
+    Returns:
+        WellCard dict matching the spec return structure.
+    """
+    draft = _prepare_card(
+        deal_id, well_name, patterns, output_dir,
+        downtime_treatment, default_uptime_pct, forecast_case,
+        economic_limit_boepd, projection_years,
+        records, pivoted, reserve_records, scalar_records,
+    )
+
+    # ── 7. LLM narrative ─────────────────────────────────────────────────────
+    if draft["prompt"] is None:
+        llm_output = _insufficient_data_narrative(well_name, draft["dca_result"], draft["summary"])
+    else:
+        response   = _batch_invoke(
+            main_llm, _system_prompt(dk_context, entity_context), [draft["prompt"]],
+            max_concurrency=1,
+        )[0]
+        llm_output = _narrative_from_response(draft, response)
+
+    return _finalize_card(deal_id, draft, llm_output, charts_dir, generate_charts)
+
+
+def build_well_cards_bulk(
+    deal_id:              str,
+    well_names:           list[str],
+    main_llm:             Any,
+    dk_context:           str,
+    entity_context:       str,
+    patterns:             list[dict],
+    output_dir:           str       = "./outputs",
+    downtime_treatment:   str       = "strip_estimated",
+    default_uptime_pct:   float     = 90.0,
+    forecast_case:        str       = "cpr_base_case",
+    economic_limit_boepd: float     = 25.0,
+    projection_years:     int       = 20,
+    charts_dir:           str | None = None,
+    generate_charts:      bool      = True,
+    all_records:          dict[str, list[dict]] | None       = None,
+    all_pivoted:          dict[str, dict[str, dict]] | None  = None,
+    all_reserves:         dict[str, list[dict]] | None       = None,
+    all_scalars:          dict[str, dict[str, float]] | None = None,
+    max_concurrency:      int       = 8,
+    max_workers:          int | None = None,
+) -> list[dict]:
+    """
+    Build Well Intelligence Cards for many wells with one batched LLM call.
+
+    Every well is prepared first (load → DCA → RAG), then all narrative
+    prompts go out together through main_llm.batch(), so the LLM round-trips
+    overlap instead of running back to back. A well that fails to prepare or
+    finalize gets an error card; a failed or unparseable LLM response falls
+    back to the deterministic narrative, as in build_well_card(). Wells with
+    too little history for DCA are left out of the batch and get a canned
+    narrative.
+
+    With all four preloads given and at least PARALLEL_MIN_WELLS wells, the
+    preparation runs across a process pool (the steps are CPU-bound Python and
+    need no database access). Charts render in the background via
+    submit_well_charts() while the LLM batch is in flight.
+
+    Args:
+        well_names:      Wells to build, in output order.
+        all_records:     Preloaded production rows by well (load_all_production_series).
+        all_pivoted:     Preloaded per-case pivots by well (load_all_pivoted);
+                         takes precedence over all_records.
+        all_reserves:    Preloaded reserve estimate rows by well.
+        all_scalars:     Preloaded scalar metrics by well.
+        max_concurrency: Cap on concurrent LLM requests within the batch.
+        max_workers:     Process count for preparation and charts
+                         (None → os.cpu_count(), capped at the well count;
+                         1 → serial).
+        (other args as for build_well_card)
+
+    With no preloads and more than one well, the four bulk loaders are called
+    here once; otherwise a None preload is queried per well.
+
+    Returns:
+        One card dict per well, in well_names order.
+    """
+    # Fleet runs: one query per table instead of three per well
+    if len(well_names) > 1 and all(
+        x is None for x in (all_records, all_pivoted, all_reserves, all_scalars)
+    ):
+        # Agent 02's materialized monthly pivot when present, else raw rows
+        all_pivoted  = load_all_pivoted(deal_id, output_dir)
+        all_records  = load_all_production_series(deal_id, output_dir) if all_pivoted is None else None
+        all_reserves = load_all_reserve_estimates(deal_id, output_dir)
+        all_scalars  = load_all_scalar_metrics(deal_id, well_names, output_dir)
+
+    jobs = [
+        (
+            deal_id, wn, patterns, output_dir,
+            downtime_treatment, default_uptime_pct, forecast_case,
+            economic_limit_boepd, projection_years,
+            all_records.get(wn, []) if all_records is not None else None,
+            all_pivoted.get(wn, {}) if all_pivoted is not None else None,
+            all_reserves.get(wn, []) if all_reserves is not None else None,
+            all_scalars.get(wn, {}) if all_scalars is not None else None,
+        )
+        for wn in well_names
+    ]
+    # Workers get the preloaded data only; they never open the deal's SQLite store
+    preloaded = (all_pivoted is not None or all_records is not None) \
+        and all_reserves is not None and all_scalars is not None
+    if preloaded and len(jobs) >= PARALLEL_MIN_WELLS and max_workers != 1:
+        workers = pool_size(max_workers, len(jobs))
+        chunksize = max(1, len(jobs) // (workers * 4))
+        with process_pool(workers) as ex:
+            drafts = list(ex.map(_prepare_job, jobs, chunksize=chunksize))
+    else:
+        drafts = [_prepare_job(job) for job in jobs]
+
+    ready = [d for d in drafts if isinstance(d, dict)]
+
+    # ── 8. Charts (background) ───────────────────────────────────────────────
+    # Charts need only the prepared data, so they render while the LLM batch
+    # is in flight rather than after it.
+    charts = None
+    if generate_charts and charts_dir and ready:
+        from aigis_agents.agent_07_well_cards.chart_generator import submit_well_charts
+        for d in ready:
+            d["periods"] = d["columns"].to_records()
+        charts = submit_well_charts(
+            [
+                (d["well_name"], d["periods"], d["dca_result"], d["forecast_data"],
+                 d["rag_result"].status, _chart_path(charts_dir, d["well_name"]))
+                for d in ready
+            ],
+            max_workers,
+        )
+
+    prompts = [d["prompt"] for d in ready if d["prompt"] is not None]
+    responses = iter(_batch_invoke(
+        main_llm, _system_prompt(dk_context, entity_context), prompts, max_concurrency,
+    ) if prompts else ())
+
+    cards: list[dict] = []
+    finished: list[dict | None] = []     # card per ready draft (None → error card)
+    for wn, draft in zip(well_names, drafts):
+        if isinstance(draft, BaseException):
+            cards.append(error_card(deal_id, wn, draft))
+            continue
+        if draft["prompt"] is None:
+            llm_output = _insufficient_data_narrative(wn, draft["dca_result"], draft["summary"])
+        else:
+            llm_output = _narrative_from_response(draft, next(responses))
+        try:
+            card = _finalize_card(deal_id, draft, llm_output, None, False)
+        except Exception as exc:
+            log.error("Agent07: failed to build card for %s: %s", wn, exc)
+            cards.append(error_card(deal_id, wn, exc))
+            finished.append(None)
+            continue
+        cards.append(card)
+        finished.append(card)
+
+    if charts is not None:
+        for card, path in zip(finished, charts.result()):
+            if card is not None:
+                card["chart_path"] = path
+    return cards
+
+
+def _prepare_job(job: tuple) -> dict | BaseException:
+    """Pool worker: _prepare_card(*job), returning the exception on failure."""
+    log.info("Agent07: building card for well %s", job[1])
+    try:
+        return _prepare_card(*job)
+    except Exception as exc:
+        log.error("Agent07: failed to build card for %s: %s", job[1], exc)
+        return exc
@@ -6,7 +6,7 @@ Every agent in the mesh inherits from AgentBase and only needs to:
   2. Set DK_TAGS = [...] (class-level)
   3. Implement _run(deal_id, main_llm, dk_context, patterns, **inputs) -> dict
 
-AgentBase.invoke() handles the full pipeline:
+AgentBase.invoke() (or the async ainvoke()) handles the full pipeline:
   1.   Resolve models (from params → toolkit defaults)
   2.   Resolve API keys (from params → env vars)
   3.   Instantiate main LLM + audit LLM
@@ -14,12 +14,15 @@ AgentBase.invoke() handles the full pipeline:
   5.   Load domain knowledge (SemanticDKRouter: tag phase always + semantic phase if configured)
   5.5  Load buyer profile context
   5.6  Load deal context (per-deal accumulating markdown)
+  5.7  Load entity context (concept graph)
   6.   Load memory patterns
+       (steps 4–6 are independent I/O and run concurrently)
   7.   Run core logic (_run)
   7.5  Extract _deal_context_section internal key (before audit)
   8.   Output audit
   9.   Queue improvement suggestions for human review
   9.5  Detect buyer preference signals; prompt "Remember this?" in standalone mode
+       (interactive terminals only; prompts time out instead of blocking)
   10.  Log to deal audit trail
   10.5 Update deal context (if agent returned _deal_context_section)
   11.  Format and return (mode-dependent)
@@ -32,9 +35,14 @@ The caller inherits its own audit_model for the callee's audit layer.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
+import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Any
 
 from aigis_agents.mesh.audit_layer import AuditLayer
@@ -86,11 +94,46 @@ class AgentBase:
     ) -> dict:
         """Run the agent through the full 10-step mesh pipeline.
 
+        Synchronous wrapper around ainvoke(); safe to call from inside a
+        running event loop (the pipeline then runs on a helper thread).
+
         Returns:
             On success: a mode-appropriate dict (see _format_output)
             On input validation failure: an error dict (no LLM cost incurred)
             On execution error: an error dict with traceback details
         """
+        return _run_sync(self.ainvoke(
+            mode=mode,
+            deal_id=deal_id,
+            main_model=main_model,
+            main_api_key=main_api_key,
+            audit_model=audit_model,
+            audit_api_key=audit_api_key,
+            output_dir=output_dir,
+            refresh_dk=refresh_dk,
+            **inputs,
+        ))
+
+    async def ainvoke(
+        self,
+        mode: str,
+        deal_id: str,
+        main_model:    str | None = None,
+        main_api_key:  str | None = None,
+        audit_model:   str | None = None,
+        audit_api_key: str | None = None,
+        output_dir:    str = "./outputs",
+        refresh_dk:    bool = False,
+        **inputs: Any,
+    ) -> dict:
+        """Async form of invoke() (same arguments and return value).
+
+        The input audit and the context loads (steps 4–6) are gathered, so
+        pre-run latency is that of the slowest one — usually the audit LLM
+        call. The output audit (step 8) and preference detection (step 9.5)
+        are awaited too; _run() executes synchronously on the event loop
+        thread.
+        """
         start_ts = time.monotonic()
 
         # ── 1 & 2: Resolve models and API keys ────────────────────────────────
@@ -103,8 +146,28 @@ class AgentBase:
         audit_llm = get_chat_model(_audit_model, session_keys={"OPENAI_API_KEY": audit_api_key} if audit_api_key else None)
         audit_layer = AuditLayer(audit_llm)
 
-        # ── 4: Input audit ────────────────────────────────────────────────────
-        input_audit = audit_layer.check_inputs(self.AGENT_ID, inputs)
+        # ── 4–6: Input audit + context loads, concurrently ────────────────────
+        # 5:   domain knowledge; query derived from tags is used by
+        #      SemanticDKRouter for its Phase 2 search
+        # 5.5: buyer profile; 5.6: per-deal accumulating markdown;
+        # 5.7: concept graph entities; 6: memory patterns
+        _dk_query = " ".join(self.DK_TAGS) if self.DK_TAGS else None
+        deal_context_mgr = DealContextManager(deal_id=deal_id)
+        # Serialised once; reused by the input/output audits and step 9.5
+        inputs_json = AuditLayer.serialise_inputs(inputs)
+        (
+            input_audit, dk_context, buyer_context, deal_context, entity_context, patterns,
+        ) = await asyncio.gather(
+            audit_layer.acheck_inputs(self.AGENT_ID, inputs, inputs_json),
+            asyncio.to_thread(
+                self._dk_router.build_context_block,
+                self.DK_TAGS, refresh=refresh_dk, query=_dk_query,
+            ),
+            asyncio.to_thread(self._buyer_profile.load_as_context),
+            asyncio.to_thread(deal_context_mgr.load),
+            asyncio.to_thread(_load_entity_context, deal_id, output_dir),
+            asyncio.to_thread(self._memory.load_patterns, self.AGENT_ID),
+        )
         if not input_audit.get("valid", True):
             return self._error_response(
                 "input_validation_failed",
@@ -112,33 +175,6 @@ class AgentBase:
                 {"issues": input_audit.get("issues", [])},
             )
 
-        # ── 5: Load domain knowledge ──────────────────────────────────────────
-        # query derived from tags: used by SemanticDKRouter for Phase 2 search
-        _dk_query = " ".join(self.DK_TAGS) if self.DK_TAGS else None
-        dk_context = self._dk_router.build_context_block(
-            self.DK_TAGS, refresh=refresh_dk, query=_dk_query
-        )
-
-        # ── 5.5: Load buyer profile context ───────────────────────────────────
-        buyer_context = self._buyer_profile.load_as_context()
-
-        # ── 5.6: Load deal context (per-deal accumulating markdown) ───────────
-        deal_context_mgr = DealContextManager(deal_id=deal_id)
-        deal_context = deal_context_mgr.load()
-
-        # ── 5.7: Load entity context from concept graph ────────────────────────
-        entity_context = ""
-        try:
-            from pathlib import Path as _Path
-            from aigis_agents.mesh.concept_graph import ConceptGraph
-            _cg_path = _Path(output_dir) / deal_id / "02_data_store.db"
-            entity_context = ConceptGraph(_cg_path).get_deal_context_summary(deal_id)
-        except Exception as _exc:
-            logger.debug("Step 5.7 entity context load failed (non-blocking): %s", _exc)
-
-        # ── 6: Load memory patterns ───────────────────────────────────────────
-        patterns = self._memory.load_patterns(self.AGENT_ID)
-
         # ── 7: Core logic (_run) ──────────────────────────────────────────────
         try:
             raw_output = self._run(
@@ -165,7 +201,9 @@ class AgentBase:
         _dc_section = raw_output.pop("_deal_context_section", None)
 
         # ── 8: Output audit ───────────────────────────────────────────────────
-        output_audit = audit_layer.check_outputs(self.AGENT_ID, inputs, raw_output)
+        output_audit = await audit_layer.acheck_outputs(
+            self.AGENT_ID, inputs, raw_output, inputs_json,
+        )
 
         # ── 9: Queue improvement suggestions for human review ─────────────────
         for suggestion in output_audit.get("improvement_suggestions", []):
@@ -181,26 +219,14 @@ class AgentBase:
                 logger.warning("Failed to queue suggestion: %s", exc)
 
         # ── 9.5: Detect buyer preference signals; prompt to remember ─────────────
-        if mode == "standalone":
+        # Non-interactive contexts (CI, piped stdin) could never confirm a
+        # signal, so detection is skipped there too.
+        if mode == "standalone" and _stdin_is_tty():
             try:
-                signals = audit_layer.detect_preferences(inputs, raw_output)
-                for signal in signals:
-                    if signal.confidence >= 0.75:
-                        try:
-                            confirm = input(
-                                f"\n[Buyer Profile] Detected preference: "
-                                f"'{signal.value}' for '{signal.key}'.\n"
-                                f"Remember this for future runs? [y/N]: "
-                            )
-                            if confirm.strip().lower() == "y":
-                                self._buyer_profile.apply_signal(signal)
-                                logger.info(
-                                    "Buyer preference saved: %s = %s",
-                                    signal.key, signal.value,
-                                )
-                        except (EOFError, OSError):
-                            # Non-interactive context (CI, piped stdin) — skip prompt
-                            pass
+                signals = await asyncio.to_thread(
+                    audit_layer.detect_preferences, inputs, raw_output, inputs_json,
+                )
+                await self._prompt_preferences(signals)
             except Exception as exc:
                 logger.debug("Step 9.5 preference detection failed (non-blocking): %s", exc)
 
@@ -273,6 +299,52 @@ class AgentBase:
             ],
         )
 
+    def invoke_batch(self, calls: list[dict], max_concurrency: int | None = None) -> list[dict]:
+        """Synchronous wrapper around ainvoke_batch()."""
+        return _run_sync(self.ainvoke_batch(calls, max_concurrency=max_concurrency))
+
+    async def ainvoke_batch(
+        self,
+        calls: list[dict],
+        max_concurrency: int | None = None,
+    ) -> list[dict]:
+        """Run this agent over many deals, e.g. one portfolio-wide DD pass.
+
+        Args:
+            calls:           One dict of ainvoke() keyword arguments per run
+                             (mode, deal_id, plus any model overrides / inputs).
+            max_concurrency: Cap on runs in flight (None → AIGIS_MAX_CONCURRENCY
+                             env var, default 8); keep it under the provider's
+                             rate limit.
+
+        The input and output audits and the context loads of different runs
+        overlap; each run's _run() still executes on the event loop thread, one at a time,
+        since agents keep module-level state (connection caches, stdin
+        prompts) that is not safe to share across threads.
+
+        Returns:
+            One response per call, in order. A run that raises gets an
+            "execution_error" envelope instead of failing the batch.
+        """
+        limit = max_concurrency or int(os.getenv("AIGIS_MAX_CONCURRENCY", "8"))
+        sem = asyncio.Semaphore(max(1, limit))
+
+        async def _one(call: dict) -> dict:
+            async with sem:
+                return await self.ainvoke(**call)
+
+        results = await asyncio.gather(*(_one(c) for c in calls), return_exceptions=True)
+        out: list[dict] = []
+        for call, res in zip(calls, results):
+            if isinstance(res, BaseException):
+                logger.error("Agent %s batch run for deal %s failed: %s",
+                             self.AGENT_ID, call.get("deal_id"), res)
+                res = self._error_response(
+                    "execution_error", str(res), {"deal_id": call.get("deal_id")},
+                )
+            out.append(res)
+        return out
+
     def call_agent(
         self,
         agent_id:   str,
@@ -341,6 +413,29 @@ class AgentBase:
 
     # ── Output formatting ──────────────────────────────────────────────────────
 
+    async def _prompt_preferences(self, signals: list) -> None:
+        """Ask whether to remember each high-confidence signal (step 9.5).
+
+        Prompts are read off the event loop and time out after
+        AIGIS_PROMPT_TIMEOUT_S (default 30s), so an unanswered prompt cannot
+        stall a batch of runs; the remaining signals are then skipped.
+        """
+        timeout_s = float(os.getenv("AIGIS_PROMPT_TIMEOUT_S", "30"))
+        for signal in signals:
+            if signal.confidence < 0.75:
+                continue
+            confirm = await _ask(
+                f"\n[Buyer Profile] Detected preference: "
+                f"'{signal.value}' for '{signal.key}'.\n"
+                f"Remember this for future runs? [y/N]: ",
+                timeout_s,
+            )
+            if confirm is None:
+                return
+            if confirm.strip().lower() == "y":
+                self._buyer_profile.apply_signal(signal)
+                logger.info("Buyer preference saved: %s = %s", signal.key, signal.value)
+
     def _format_output(
         self,
         mode:          str,
@@ -403,6 +498,79 @@ class AgentBase:
 
 # ── Helpers ────────────────────────────────────────────────────────────────────
 
+def _run_sync(coro: Any) -> Any:
+    """Run *coro* to completion from synchronous code.
+
+    asyncio.run() refuses to start inside a running loop (Jupyter, async
+    callers of invoke()), so there the coroutine gets its own loop on a
+    helper thread.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as ex:
+        return ex.submit(asyncio.run, coro).result()
+
+
+def _stdin_is_tty() -> bool:
+    try:
+        return sys.stdin is not None and sys.stdin.isatty()
+    except ValueError:   # stdin closed
+        return False
+
+
+# Held by the reader thread while it waits on stdin. A timed-out prompt
+# leaves its (daemonic) reader holding it; prompts are skipped until that
+# reader returns, so two readers never compete for the same line.
+_STDIN_LOCK = threading.Lock()
+
+
+async def _ask(message: str, timeout_s: float) -> str | None:
+    """input(message) on a daemon thread without blocking the event loop.
+
+    Returns None on timeout, EOF, or while an earlier reader is still waiting.
+    """
+    if not _STDIN_LOCK.acquire(blocking=False):
+        return None
+    loop = asyncio.get_running_loop()
+    answer: asyncio.Future = loop.create_future()
+
+    def _settle(text: str | None) -> None:
+        if not answer.done():
+            answer.set_result(text)
+
+    def _read() -> None:
+        try:
+            text = input(message)
+        except (EOFError, OSError):
+            text = None
+        finally:
+            _STDIN_LOCK.release()
+        try:
+            loop.call_soon_threadsafe(_settle, text)
+        except RuntimeError:   # loop already closed after a timeout
+            pass
+
+    threading.Thread(target=_read, name="aigis-prompt", daemon=True).start()
+    try:
+        return await asyncio.wait_for(answer, timeout_s)
+    except asyncio.TimeoutError:
+        logger.info("No answer within %.0fs; skipping buyer preference prompts.", timeout_s)
+        return None
+
+
+def _load_entity_context(deal_id: str, output_dir: str) -> str:
+    """Step 5.7: concept graph summary for the deal ("" when unavailable)."""
+    try:
+        from aigis_agents.mesh.concept_graph import ConceptGraph
+        cg_path = Path(output_dir) / deal_id / "02_data_store.db"
+        return ConceptGraph(cg_path).get_deal_context_summary(deal_id)
+    except Exception as exc:
+        logger.debug("Step 5.7 entity context load failed (non-blocking): %s", exc)
+        return ""
+
+
 def _now() -> str:
     from datetime import datetime, timezone
     return datetime.now(timezone.utc).isoformat()
@@ -17,6 +17,16 @@ Every agent run passes through two audit stages:
      consistency, missed red flags, and value reasonableness.  It also
      generates improvement suggestions for the memory system.
 
+For offline work (retro-audits, CI evaluations) check_inputs_batch() and
+check_outputs_batch() submit many audits as one OpenAI Batch API job at half
+the token price.
+
+Audit replies can be cached (opt-in: cache_path / AIGIS_AUDIT_CACHE env var)
+in a SQLite file keyed on the audit model and exact prompt, so a retried or
+repeated run reuses the verdict instead of calling the audit LLM again.
+With AIGIS_AUDIT_SHAPE_SKIP=1 the same file also remembers input shapes that
+passed a clean audit, and later inputs of a known shape skip the input audit.
+
 All audit results are appended to {deal_id}/_audit_log.jsonl (one JSON
 record per line) so every run has a full, queryable audit trail.
 
@@ -24,6 +34,9 @@ The audit LLM is intentionally the *cheaper* model (default: gpt-4.1-mini)
 since the prompts are structured and relatively simple.  The main LLM does
 the heavy reasoning and extraction work inside the agent.
 
+Audit replies are streamed where the model supports it and read only up to
+the first complete JSON object, so trailing commentary is never waited for.
+
 Robustness: if the audit LLM returns malformed JSON, the layer falls back to
 a permissive default (valid=True for input audit; HIGH confidence for output
 audit) so a transient LLM failure never blocks an agent run.  The fallback is
@@ -32,18 +45,37 @@ flagged clearly in the audit log.
 
 from __future__ import annotations
 
+import asyncio
+import atexit
+import hashlib
 import json
 import logging
+import math
+import os
+import sqlite3
+import threading
+import time
 import uuid
+from contextlib import closing
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from functools import lru_cache
+from typing import IO, Any
 
 from aigis_agents.mesh.toolkit_registry import ToolkitRegistry
 from aigis_agents.mesh.buyer_profile_manager import PreferenceSignal
 
 logger = logging.getLogger(__name__)
 
+# orjson serialises audit payloads several times faster than the stdlib; optional
+_ORJSON_AVAILABLE = False
+try:
+    import orjson  # type: ignore[import]
+    _ORJSON_AVAILABLE = True
+    _ORJSON_OPTS = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+except ImportError:
+    pass
+
 
 # ── Prompt templates ───────────────────────────────────────────────────────────
 
@@ -117,6 +149,31 @@ flag types: "missing_citation", "inconsistency", "missed_red_flag", "out_of_rang
 flag severities: "CRITICAL", "WARNING", "INFO"
 """
 
+
+
+def _split_template(template: str, *payload_fields: str) -> tuple[str, ...]:
+    """Split *template* at each ``{payload_field}`` once, at import time.
+
+    The first chunk keeps its per-agent fields for _prompt_head(); the
+    remaining chunks have no fields left, so their ``{{ }}`` escapes are
+    resolved here and the chunks are joined verbatim per call.
+    """
+    chunks = [template]
+    for field in payload_fields:
+        head, tail = chunks.pop().split("{" + field + "}")
+        chunks += [head, tail]
+    return (chunks[0], *(chunk.format() for chunk in chunks[1:]))
+
+
+_INPUT_AUDIT_CHUNKS = _split_template(_INPUT_AUDIT_PROMPT, "inputs_json")
+_OUTPUT_AUDIT_CHUNKS = _split_template(_OUTPUT_AUDIT_PROMPT, "inputs_summary", "outputs_summary")
+
+
+@lru_cache(maxsize=128)
+def _prompt_head(head: str, agent_name: str, agent_description: str) -> str:
+    return head.format(agent_name=agent_name, agent_description=agent_description)
+
+
 _PREFERENCE_DETECT_PROMPT = """\
 You are the Buyer Preference Detector for the Aigis Analytics platform.
 Your job is to identify buyer preference signals in the agent inputs and outputs below.
@@ -157,17 +214,40 @@ Example:
 class AuditLayer:
     """Input and output auditor. Uses a separate (cheaper) audit LLM."""
 
-    def __init__(self, audit_llm: Any) -> None:
+    def __init__(
+        self,
+        audit_llm: Any,
+        cache_path: str | Path | None = None,
+        shape_skip: bool | None = None,
+    ) -> None:
         """
         Args:
-            audit_llm: A LangChain chat model instance (e.g. ChatOpenAI).
-                       This should be the *cheaper* model (e.g. gpt-4.1-mini).
+            audit_llm:  A LangChain chat model instance (e.g. ChatOpenAI).
+                        This should be the *cheaper* model (e.g. gpt-4.1-mini).
+            cache_path: SQLite file for the exact-match audit reply cache.
+                        None → AIGIS_AUDIT_CACHE env var; unset/empty → no cache.
+            shape_skip: Skip the input audit for inputs whose shape (keys, value
+                        types, numeric orders of magnitude) already passed a
+                        clean audit for the agent. None → AIGIS_AUDIT_SHAPE_SKIP
+                        env var ("1" enables). Needs the cache file to remember
+                        shapes in; without one it has no effect.
         """
         self._llm = audit_llm
+        path = cache_path if cache_path is not None else os.getenv("AIGIS_AUDIT_CACHE", "")
+        self._cache = _AuditCache(Path(path).expanduser(), _model_id(audit_llm)) if path else None
+        if shape_skip is None:
+            shape_skip = os.getenv("AIGIS_AUDIT_SHAPE_SKIP", "") == "1"
+        self._shape_skip = shape_skip and self._cache is not None
 
     # ── Input audit ───────────────────────────────────────────────────────────
 
-    def check_inputs(self, agent_id: str, inputs: dict) -> dict:
+    @staticmethod
+    def serialise_inputs(inputs: dict) -> str:
+        """Serialise *inputs* once per run; pass the result as inputs_json to
+        check_inputs(), check_outputs() and detect_preferences()."""
+        return _serialise(inputs)
+
+    def check_inputs(self, agent_id: str, inputs: dict, inputs_json: str | None = None) -> dict:
         """Audit agent inputs before core logic runs.
 
         Returns:
@@ -179,18 +259,32 @@ class AuditLayer:
             }
 
         If valid=False (any ERROR-severity issue), the caller should abort.
+        inputs_json (from serialise_inputs()) skips re-serialising *inputs*.
         """
-        entry = ToolkitRegistry.get(agent_id)
-        prompt = _INPUT_AUDIT_PROMPT.format(
-            agent_name=entry["name"],
-            agent_description=entry["description"],
-            inputs_json=json.dumps(inputs, indent=2, default=str),
-        )
-        return self._call_audit_llm(prompt, _safe_input_default)
+        shape = self._shape_key(agent_id, inputs)
+        if shape is not None and self._cache.has_shape(shape):
+            return _shape_match_result()
+        return self._remember_shape(shape, self._call_audit_llm(
+            _input_audit_prompt(agent_id, inputs, inputs_json), _safe_input_default,
+        ))
+
+    async def acheck_inputs(
+        self, agent_id: str, inputs: dict, inputs_json: str | None = None,
+    ) -> dict:
+        """Async form of check_inputs() — awaits the audit LLM's ainvoke()
+        so the call can overlap with other pre-run loads."""
+        shape = self._shape_key(agent_id, inputs)
+        if shape is not None and self._cache.has_shape(shape):
+            return _shape_match_result()
+        return self._remember_shape(shape, await self._acall_audit_llm(
+            _input_audit_prompt(agent_id, inputs, inputs_json), _safe_input_default,
+        ))
 
     # ── Output audit ──────────────────────────────────────────────────────────
 
-    def check_outputs(self, agent_id: str, inputs: dict, outputs: dict) -> dict:
+    def check_outputs(
+        self, agent_id: str, inputs: dict, outputs: dict, inputs_json: str | None = None,
+    ) -> dict:
         """Audit agent outputs after core logic completes.
 
         Returns:
@@ -202,19 +296,60 @@ class AuditLayer:
               "improvement_suggestions": [{"target_agent": str, "suggestion": str, "confidence": float}],
               "auditor_notes": str
             }
+
+        The inputs summary is cut from inputs_json when given.
         """
-        entry = ToolkitRegistry.get(agent_id)
-        prompt = _OUTPUT_AUDIT_PROMPT.format(
-            agent_name=entry["name"],
-            agent_description=entry["description"],
-            inputs_summary=_summarise(inputs, max_chars=800),
-            outputs_summary=_summarise(outputs, max_chars=1200),
+        return self._call_audit_llm(
+            _output_audit_prompt(agent_id, inputs, outputs, inputs_json), _safe_output_default,
         )
-        return self._call_audit_llm(prompt, _safe_output_default)
+
+    async def acheck_outputs(
+        self, agent_id: str, inputs: dict, outputs: dict, inputs_json: str | None = None,
+    ) -> dict:
+        """Async form of check_outputs(), so concurrent runs overlap their
+        output audits."""
+        return await self._acall_audit_llm(
+            _output_audit_prompt(agent_id, inputs, outputs, inputs_json), _safe_output_default,
+        )
+
+    # ── Offline batch audits ──────────────────────────────────────────────────
+
+    def check_inputs_batch(
+        self,
+        items: list[tuple[str, dict]],
+        poll_interval_s: float = 30.0,
+        timeout_s: float = 86_400.0,
+    ) -> list[dict]:
+        """check_inputs() for many (agent_id, inputs) pairs through the OpenAI
+        Batch API — half the token price, results within 24h.
+
+        For offline work (retro-audits of historical deals, CI evaluations),
+        not live runs: this blocks until the batch finishes. Audit models
+        other than OpenAI's own ChatOpenAI endpoint are audited one by one.
+        Returns one result per item, in order; items the batch could not
+        answer get the safe default flagged _audit_fallback.
+        """
+        prompts = [_input_audit_prompt(agent_id, inputs) for agent_id, inputs in items]
+        return self._batch_audit(prompts, _safe_input_default, poll_interval_s, timeout_s)
+
+    def check_outputs_batch(
+        self,
+        items: list[tuple[str, dict, dict]],
+        poll_interval_s: float = 30.0,
+        timeout_s: float = 86_400.0,
+    ) -> list[dict]:
+        """check_outputs() for many (agent_id, inputs, outputs) triples — see
+        check_inputs_batch()."""
+        prompts = [
+            _output_audit_prompt(agent_id, inputs, outputs) for agent_id, inputs, outputs in items
+        ]
+        return self._batch_audit(prompts, _safe_output_default, poll_interval_s, timeout_s)
 
     # ── Preference detection ───────────────────────────────────────────────────
 
-    def detect_preferences(self, inputs: dict, outputs: dict) -> list[PreferenceSignal]:
+    def detect_preferences(
+        self, inputs: dict, outputs: dict, inputs_json: str | None = None,
+    ) -> list[PreferenceSignal]:
         """Scan agent inputs and outputs for buyer preference signals.
 
         Returns a list of PreferenceSignal instances with confidence >= 0.5.
@@ -224,7 +359,7 @@ class AuditLayer:
         Only called in standalone mode — not during tool_call runs.
         """
         prompt = _PREFERENCE_DETECT_PROMPT.format(
-            inputs_summary=_summarise(inputs, max_chars=600),
+            inputs_summary=_summarise(inputs, max_chars=600, text=inputs_json),
             outputs_summary=_summarise(outputs, max_chars=800),
         )
         try:
@@ -330,9 +465,7 @@ class AuditLayer:
         }
 
         log_path = Path(output_dir) / deal_id / "_audit_log.jsonl"
-        log_path.parent.mkdir(parents=True, exist_ok=True)
-        with log_path.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        _append_line(log_path, json.dumps(record, ensure_ascii=False))
 
         return run_id
 
@@ -344,49 +477,470 @@ class AuditLayer:
         Falls back to fallback_factory() if the LLM returns invalid JSON or
         raises an exception.
         """
+        if self._cache is not None and (hit := self._cache.get(prompt)) is not None:
+            return hit
         try:
-            from langchain_core.messages import HumanMessage, SystemMessage
+            raw = self._complete(_audit_messages(prompt))
+            return self._cached(prompt, _parse_json_response(raw, fallback_factory))
+        except Exception as exc:
+            return _audit_failure(exc, fallback_factory)
+
+    def _complete(self, messages: list) -> str:
+        """Audit reply text. Streaming models are read only up to the first
+        complete JSON object; anything the model adds after it is never
+        waited for."""
+        if not hasattr(self._llm, "stream"):
+            return _reply_text(self._llm.invoke(messages))
+        scanner = _ObjectScanner()
+        stream = self._llm.stream(messages)
+        try:
+            for chunk in stream:
+                if scanner.feed(_reply_text(chunk)):
+                    break
+        finally:
+            if hasattr(stream, "close"):
+                stream.close()
+        return scanner.buf
+
+    def _batch_audit(
+        self,
+        prompts: list[str],
+        fallback_factory,
+        poll_interval_s: float,
+        timeout_s: float,
+    ) -> list[dict]:
+        # Batch API: OpenAI's own endpoint only (not the OpenAI-compatible providers)
+        client = None
+        if type(self._llm).__name__ == "ChatOpenAI" and not getattr(self._llm, "openai_api_base", None):
+            client = getattr(self._llm, "root_client", None)
+        if client is None:
+            logger.info("Audit model has no Batch API; auditing %d items one by one.", len(prompts))
+            return [self._call_audit_llm(p, fallback_factory) for p in prompts]
 
-            messages = [
-                SystemMessage(content=(
-                    "You are a precision JSON output machine. "
-                    "Always return valid JSON only. No markdown fences, no explanation outside the JSON."
-                )),
-                HumanMessage(content=prompt),
-            ]
-            response = self._llm.invoke(messages)
-            raw = response.content if hasattr(response, "content") else str(response)
-            return _parse_json_response(raw, fallback_factory)
+        try:
+            raws = _run_openai_batch(client, self._llm, prompts, poll_interval_s, timeout_s)
         except Exception as exc:
-            logger.warning("Audit LLM call failed: %s — using safe default.", exc)
-            result = fallback_factory()
-            result["_audit_fallback"] = True
-            result["_audit_error"]    = str(exc)
-            return result
+            return [_audit_failure(exc, fallback_factory) for _ in prompts]
+        return [
+            _parse_json_response(raw, fallback_factory) if raw is not None
+            else _audit_failure(RuntimeError("no result in batch output"), fallback_factory)
+            for raw in raws
+        ]
+
+    async def _acall_audit_llm(self, prompt: str, fallback_factory) -> dict:
+        """Async form of _call_audit_llm(). Models without ainvoke() are
+        invoked in a worker thread."""
+        if self._cache is not None and (hit := self._cache.get(prompt)) is not None:
+            return hit
+        try:
+            raw = await self._acomplete(_audit_messages(prompt))
+            return self._cached(prompt, _parse_json_response(raw, fallback_factory))
+        except Exception as exc:
+            return _audit_failure(exc, fallback_factory)
+
+    async def _acomplete(self, messages: list) -> str:
+        """Async form of _complete()."""
+        if hasattr(self._llm, "astream"):
+            scanner = _ObjectScanner()
+            stream = self._llm.astream(messages)
+            try:
+                async for chunk in stream:
+                    if scanner.feed(_reply_text(chunk)):
+                        break
+            finally:
+                if hasattr(stream, "aclose"):
+                    await stream.aclose()
+            return scanner.buf
+        if hasattr(self._llm, "ainvoke"):
+            return _reply_text(await self._llm.ainvoke(messages))
+        return await asyncio.to_thread(self._complete, messages)
+
+    def _shape_key(self, agent_id: str, inputs: dict) -> str | None:
+        return self._cache.shape_key(agent_id, inputs) if self._shape_skip else None
+
+    def _remember_shape(self, shape: str | None, result: dict) -> dict:
+        """Record *shape* after a clean pass: valid, HIGH, no issues at all."""
+        if (
+            shape is not None
+            and result.get("valid") is True
+            and result.get("confidence") == "HIGH"
+            and not result.get("issues")
+            and not result.get("_audit_fallback")
+        ):
+            try:
+                self._cache.add_shape(shape)
+            except sqlite3.Error as exc:
+                logger.debug("Audit shape write failed (non-blocking): %s", exc)
+        return result
+
+    def _cached(self, prompt: str, result: dict) -> dict:
+        """Store a parsed audit reply (never a fallback) and return it."""
+        if self._cache is not None and not result.get("_audit_fallback"):
+            try:
+                self._cache.put(prompt, result)
+            except sqlite3.Error as exc:
+                logger.debug("Audit cache write failed (non-blocking): %s", exc)
+        return result
+
+
+# ── Audit log handles ──────────────────────────────────────────────────────────
+
+# Append handles on deal audit logs, kept open across runs (LRU order)
+_MAX_LOG_HANDLES = 16
+_LOG_HANDLES: dict[str, IO[str]] = {}
+_LOG_LOCK = threading.Lock()
+
+
+def _append_line(path: Path, line: str) -> None:
+    """Append one line to *path* through a cached handle, flushed per line so
+    the record is on disk when log() returns. A file deleted or replaced
+    since the handle was opened gets a fresh one."""
+    key = str(path)
+    with _LOG_LOCK:
+        f = _LOG_HANDLES.pop(key, None)
+        if f is not None:
+            try:
+                on_disk, opened = path.stat(), os.fstat(f.fileno())
+                stale = (on_disk.st_dev, on_disk.st_ino) != (opened.st_dev, opened.st_ino)
+            except OSError:
+                stale = True
+            if stale:
+                f.close()
+                f = None
+        if f is None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            f = path.open("a", encoding="utf-8")
+            while len(_LOG_HANDLES) >= _MAX_LOG_HANDLES:
+                _LOG_HANDLES.pop(next(iter(_LOG_HANDLES))).close()
+        _LOG_HANDLES[key] = f   # re-insert → most recently used last
+        f.write(line + "\n")
+        f.flush()
+
+
+def close_audit_logs() -> None:
+    """Close every cached audit log handle (also runs at interpreter exit;
+    call it before moving or deleting a deal folder on Windows)."""
+    with _LOG_LOCK:
+        while _LOG_HANDLES:
+            _LOG_HANDLES.popitem()[1].close()
+
+
+atexit.register(close_audit_logs)
 
 
 # ── Helpers ────────────────────────────────────────────────────────────────────
 
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _input_audit_prompt(agent_id: str, inputs: dict, inputs_json: str | None = None) -> str:
+    entry = ToolkitRegistry.get(agent_id)
+    head, tail = _INPUT_AUDIT_CHUNKS
+    return "".join((
+        _prompt_head(head, entry["name"], entry["description"]),
+        _serialise(inputs) if inputs_json is None else inputs_json,
+        tail,
+    ))
+
+
+def _output_audit_prompt(
+    agent_id: str, inputs: dict, outputs: dict, inputs_json: str | None = None,
+) -> str:
+    entry = ToolkitRegistry.get(agent_id)
+    head, mid, tail = _OUTPUT_AUDIT_CHUNKS
+    return "".join((
+        _prompt_head(head, entry["name"], entry["description"]),
+        _summarise(inputs, max_chars=800, text=inputs_json),
+        mid,
+        _summarise(outputs, max_chars=1200),
+        tail,
+    ))
+
+
+def _dumps(data: Any) -> str:
+    """Indented JSON for audit prompts — orjson when installed.
+
+    Falls back to the stdlib for anything orjson rejects (e.g. ints wider
+    than 64 bits); unserialisable leaves become str() either way.
+    """
+    if _ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(data, default=str, option=_ORJSON_OPTS).decode()
+        except TypeError:
+            pass
+    return json.dumps(data, indent=2, default=str)
+
+
+_AUDIT_SYSTEM = (
+    "You are a precision JSON output machine. "
+    "Always return valid JSON only. No markdown fences, no explanation outside the JSON."
+)
+
+
+def _audit_messages(prompt: str) -> list:
+    from langchain_core.messages import HumanMessage, SystemMessage
+
+    return [SystemMessage(content=_AUDIT_SYSTEM), HumanMessage(content=prompt)]
+
+
+def _run_openai_batch(
+    client: Any,
+    llm: Any,
+    prompts: list[str],
+    poll_interval_s: float,
+    timeout_s: float,
+) -> list[str | None]:
+    """Submit *prompts* as one OpenAI Batch API job and wait for it.
+
+    Returns the reply text per prompt, in order (None where the batch
+    reported an error for that request). Raises if the batch itself fails,
+    expires or exceeds *timeout_s* (it is cancelled in that case).
+    """
+    body: dict[str, Any] = {"model": llm.model_name}
+    if getattr(llm, "temperature", None) is not None:
+        body["temperature"] = llm.temperature
+    lines = [
+        json.dumps({
+            "custom_id": f"audit-{i}",
+            "method":    "POST",
+            "url":       "/v1/chat/completions",
+            "body": {**body, "messages": [
+                {"role": "system", "content": _AUDIT_SYSTEM},
+                {"role": "user",   "content": prompt},
+            ]},
+        }, ensure_ascii=False)
+        for i, prompt in enumerate(prompts)
+    ]
+    upload = client.files.create(
+        file=("audit_batch.jsonl", "\n".join(lines).encode("utf-8")), purpose="batch",
+    )
+    batch = client.batches.create(
+        input_file_id=upload.id, endpoint="/v1/chat/completions", completion_window="24h",
+    )
+
+    deadline = time.monotonic() + timeout_s
+    while batch.status not in ("completed", "failed", "expired", "cancelled"):
+        if time.monotonic() >= deadline:
+            client.batches.cancel(batch.id)
+            raise TimeoutError(f"Audit batch {batch.id} still {batch.status} after {timeout_s:.0f}s")
+        time.sleep(poll_interval_s)
+        batch = client.batches.retrieve(batch.id)
+    if batch.status != "completed":
+        raise RuntimeError(f"Audit batch {batch.id} ended as {batch.status}")
+
+    results: list[str | None] = [None] * len(prompts)
+    if batch.output_file_id:
+        for line in client.files.content(batch.output_file_id).text.splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            response = record.get("response") or {}
+            if response.get("status_code") == 200:
+                idx = int(record["custom_id"].rsplit("-", 1)[1])
+                results[idx] = response["body"]["choices"][0]["message"]["content"]
+    return results
+
+
+def _model_id(llm: Any) -> str:
+    """Identity of the audit model for cache keys (a verdict is model-specific)."""
+    name = getattr(llm, "model_name", None) or getattr(llm, "model", None)
+    return f"{type(llm).__name__}:{name}"
+
+
+class _AuditCache:
+    """Exact-match audit reply cache in a SQLite file.
+
+    Keyed on blake2b(model id + system prompt + prompt). Only exact repeats
+    hit: a near-identical prompt may differ in the one figure the audit is
+    meant to judge. Hits are returned marked "_audit_cache_hit": True so the
+    audit log shows the verdict was reused.
+
+    The same file holds the input shapes that passed a clean audit, for the
+    opt-in shape skip (see _input_shape()).
+    """
+
+    def __init__(self, path: Path, model_id: str) -> None:
+        self._path = path
+        self._model_id = model_id
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(sqlite3.connect(path)) as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS audit_cache ("
+                "key TEXT PRIMARY KEY, result TEXT NOT NULL, created_at TEXT NOT NULL)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS input_shapes ("
+                "key TEXT PRIMARY KEY, created_at TEXT NOT NULL)"
+            )
+
+    def _key(self, prompt: str) -> str:
+        h = hashlib.blake2b(digest_size=16)
+        for part in (self._model_id, _AUDIT_SYSTEM, prompt):
+            h.update(part.encode("utf-8"))
+            h.update(b"\0")
+        return h.hexdigest()
+
+    def get(self, prompt: str) -> dict | None:
+        try:
+            with closing(sqlite3.connect(self._path)) as conn:
+                row = conn.execute(
+                    "SELECT result FROM audit_cache WHERE key = ?", (self._key(prompt),)
+                ).fetchone()
+        except sqlite3.Error as exc:
+            logger.debug("Audit cache read failed (non-blocking): %s", exc)
+            return None
+        if row is None:
+            return None
+        result = json.loads(row[0])
+        result["_audit_cache_hit"] = True
+        return result
+
+    def put(self, prompt: str, result: dict) -> None:
+        with closing(sqlite3.connect(self._path)) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO audit_cache (key, result, created_at) VALUES (?, ?, ?)",
+                (self._key(prompt), json.dumps(result, ensure_ascii=False),
+                 datetime.now(timezone.utc).isoformat()),
+            )
+
+    def shape_key(self, agent_id: str, inputs: dict) -> str:
+        h = hashlib.blake2b(digest_size=16)
+        for part in (self._model_id, _INPUT_AUDIT_PROMPT, agent_id, _input_shape(inputs)):
+            h.update(part.encode("utf-8"))
+            h.update(b"\0")
+        return h.hexdigest()
+
+    def has_shape(self, key: str) -> bool:
+        try:
+            with closing(sqlite3.connect(self._path)) as conn:
+                row = conn.execute(
+                    "SELECT 1 FROM input_shapes WHERE key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error as exc:
+            logger.debug("Audit shape read failed (non-blocking): %s", exc)
+            return False
+        return row is not None
+
+    def add_shape(self, key: str) -> None:
+        with closing(sqlite3.connect(self._path)) as conn, conn:
+            conn.execute(
+                "INSERT OR IGNORE INTO input_shapes (key, created_at) VALUES (?, ?)",
+                (key, datetime.now(timezone.utc).isoformat()),
+            )
+
+
+def _input_shape(value: Any) -> str:
+    """Structural fingerprint of audit inputs: dict keys, value types, and
+    for numbers the sign and order of magnitude. 1,200 and 4,800 bopd share
+    a shape; 1,200 and 120,000 do not, so an implausible jump still reaches
+    the audit LLM. Strings contribute only their type."""
+    if isinstance(value, dict):
+        items = sorted((str(k), _input_shape(v)) for k, v in value.items())
+        return "{" + ",".join(f"{k!r}:{v}" for k, v in items) + "}"
+    if isinstance(value, (list, tuple, set)):
+        return f"{type(value).__name__}[" + ",".join(sorted({_input_shape(v) for v in value})) + "]"
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        if value == 0 or not math.isfinite(value):
+            return f"{type(value).__name__}:{value!r}"
+        sign = "-" if value < 0 else "+"
+        return f"{type(value).__name__}:{sign}{math.floor(math.log10(abs(value)))}"
+    return type(value).__name__
+
+
+def _shape_match_result() -> dict:
+    return {
+        "valid":          True,
+        "confidence":     "HIGH",
+        "issues":         [],
+        "notes":          "Input shape matches an earlier clean audit — audit LLM skipped.",
+        "_audit_skipped": True,
+    }
+
+
+def _audit_failure(exc: Exception, fallback_factory) -> dict:
+    logger.warning("Audit LLM call failed: %s — using safe default.", exc)
+    result = fallback_factory()
+    result["_audit_fallback"] = True
+    result["_audit_error"]    = str(exc)
+    return result
+
+
+def _reply_text(message: Any) -> str:
+    """Text of a chat model reply or stream chunk (str or content blocks)."""
+    content = getattr(message, "content", message)
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        return "".join(
+            block if isinstance(block, str) else block.get("text", "")
+            for block in content
+        )
+    return str(content)
+
+
+class _ObjectScanner:
+    """Brace matcher fed a streamed reply chunk by chunk.
+
+    Tracks object depth (ignoring braces inside string literals) and reports
+    when the buffer holds a complete object that decodes — the same object
+    _parse_json_response() would pick from the full reply.
+    """
+
+    __slots__ = ("buf", "_pos", "_depth", "_start", "_in_str", "_escape")
+
+    def __init__(self) -> None:
+        self.buf = ""
+        self._pos = 0
+        self._depth = 0
+        self._start = -1
+        self._in_str = False
+        self._escape = False
+
+    def feed(self, text: str) -> bool:
+        """Append *text*; True once a complete, decodable object has closed."""
+        self.buf += text
+        buf = self.buf
+        for i in range(self._pos, len(buf)):
+            ch = buf[i]
+            if self._in_str:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_str = False
+            elif ch == '"':
+                self._in_str = self._depth > 0
+            elif ch == "{":
+                if not self._depth:
+                    self._start = i
+                self._depth += 1
+            elif ch == "}" and self._depth:
+                self._depth -= 1
+                if not self._depth:
+                    try:
+                        _JSON_DECODER.raw_decode(buf, self._start)
+                    except json.JSONDecodeError:
+                        continue
+                    self._pos = i + 1
+                    return True
+        self._pos = len(buf)
+        return False
+
+
 def _parse_json_response(raw: str, fallback_factory) -> dict:
-    """Extract JSON from the LLM response string."""
-    # Strip markdown fences if present
-    text = raw.strip()
-    if text.startswith("```"):
-        lines = text.splitlines()
-        # drop first and last fence lines
-        text = "\n".join(lines[1:-1] if lines[-1].startswith("```") else lines[1:])
+    """Extract the JSON object from the LLM response string.
 
-    try:
-        return json.loads(text)
-    except json.JSONDecodeError:
-        # Try to find the first {...} block
-        start = text.find("{")
-        end   = text.rfind("}")
-        if start != -1 and end != -1:
-            try:
-                return json.loads(text[start:end + 1])
-            except json.JSONDecodeError:
-                pass
+    Decodes from the first "{" that starts a valid object, so markdown
+    fences, prose before it and anything after it are skipped in one pass.
+    """
+    i = raw.find("{")
+    while i != -1:
+        try:
+            obj, _ = _JSON_DECODER.raw_decode(raw, i)
+            return obj
+        except json.JSONDecodeError:
+            i = raw.find("{", i + 1)
 
     logger.warning("Could not parse audit LLM response as JSON. Using fallback.")
     result = fallback_factory()
@@ -417,12 +971,21 @@ def _safe_output_default() -> dict:
     }
 
 
-def _summarise(data: dict, max_chars: int = 1000) -> str:
-    """Compact JSON summary of *data*, truncated to *max_chars*."""
+def _serialise(data: Any) -> str:
+    """_dumps(), or str(data) for what JSON cannot hold (e.g. cycles)."""
     try:
-        text = json.dumps(data, indent=2, default=str)
+        return _dumps(data)
     except (TypeError, ValueError):
-        text = str(data)
+        return str(data)
+
+
+def _summarise(data: dict, max_chars: int = 1000, text: str | None = None) -> str:
+    """Compact JSON summary of *data*, truncated to *max_chars*.
+
+    *text* is data already serialised by _serialise(), reused as is.
+    """
+    if text is None:
+        text = _serialise(data)
     if len(text) > max_chars:
         text = text[:max_chars] + "\n... [truncated]"
     return text
@@ -6,6 +6,8 @@ Design:
     in-memory cache.  This means the first call to build_context_block() for a
     given set of tags triggers disk reads; subsequent calls within the same
     process are instant.
+  - Wildcard patterns (e.g. "Upstream Oil & Gas 101*.md") are expanded once
+    and cached the same way.
   - Pass refresh=True to force a reload from disk (e.g. if files have been
     updated during a long-running session).
   - The router resolves file paths relative to the repository root, which is
@@ -58,6 +60,7 @@ class DomainKnowledgeRouter:
     """
 
     _cache: ClassVar[dict[str, str]] = {}   # relative_path → content
+    _glob_cache: ClassVar[dict[str, list[str]]] = {}   # wildcard pattern → relative paths
 
     # ── Public API ─────────────────────────────────────────────────────────────
 
@@ -70,7 +73,7 @@ class DomainKnowledgeRouter:
         Returns:
             Dict mapping relative file path → file content string.
         """
-        paths = self._resolve_paths(tags)
+        paths = self._resolve_paths(tags, refresh=refresh)
         result: dict[str, str] = {}
         for rel in paths:
             if refresh and rel in self._cache:
@@ -117,6 +120,7 @@ class DomainKnowledgeRouter:
     def clear_cache(self) -> None:
         """Evict all entries from the session cache."""
         self._cache.clear()
+        self._glob_cache.clear()
 
     def cache_stats(self) -> dict[str, int]:
         """Return stats about the current cache state."""
@@ -127,9 +131,13 @@ class DomainKnowledgeRouter:
 
     # ── Internal helpers ───────────────────────────────────────────────────────
 
-    @staticmethod
-    def _resolve_paths(tags: list[str]) -> list[str]:
-        """Expand tags to a de-duplicated ordered list of relative file paths."""
+    @classmethod
+    def _resolve_paths(cls, tags: list[str], refresh: bool = False) -> list[str]:
+        """Expand tags to a de-duplicated ordered list of relative file paths.
+
+        Wildcard expansions are cached like file contents; refresh=True
+        re-globs the directory.
+        """
         seen: set[str] = set()
         ordered: list[str] = []
         for tag in tags:
@@ -137,9 +145,12 @@ class DomainKnowledgeRouter:
             for pattern in patterns:
                 # Support glob wildcards (e.g. "Upstream Oil & Gas 101*.md")
                 if "*" in pattern or "?" in pattern:
-                    abs_matches = _glob.glob(str(_DK_ROOT / pattern))
-                    for abs_match in sorted(abs_matches):
-                        rel = str(Path(abs_match).relative_to(_DK_ROOT)).replace("\\", "/")
+                    if refresh or pattern not in cls._glob_cache:
+                        cls._glob_cache[pattern] = [
+                            str(Path(m).relative_to(_DK_ROOT)).replace("\\", "/")
+                            for m in sorted(_glob.glob(str(_DK_ROOT / pattern)))
+                        ]
+                    for rel in cls._glob_cache[pattern]:
                         if rel not in seen:
                             seen.add(rel)
                             ordered.append(rel)
@@ -37,6 +37,14 @@ def _load_raw() -> dict[str, Any]:
         return json.load(f)
 
 
+@lru_cache(maxsize=64)
+def _import_class(class_path: str) -> type:
+    """Resolve "package.module.ClassName" (cached by path, so a reload that
+    changes an agent's mesh_class resolves the new class)."""
+    module_path, class_name = class_path.rsplit(".", 1)
+    return getattr(importlib.import_module(module_path), class_name)
+
+
 class ToolkitRegistry:
     """Thin wrapper around toolkit.json with convenience accessors."""
 
@@ -102,9 +110,7 @@ class ToolkitRegistry:
         class_path: str | None = entry.get("mesh_class")
         if not class_path:
             return None
-        module_path, class_name = class_path.rsplit(".", 1)
-        module = importlib.import_module(module_path)
-        return getattr(module, class_name)
+        return _import_class(class_path)
 
     @staticmethod
     def get_invoke_fn(agent_id: str) -> Callable | None:
@@ -48,6 +48,19 @@ class TestAgentBaseEnvelope:
         assert "duration_s" in result["run_metadata"]
         assert result["run_metadata"]["mode"] == "tool_call"
 
+    def test_inputs_serialised_once_per_run(self, patch_toolkit, patch_get_chat_model,
+                                            tmp_path, deal_id, monkeypatch):
+        import aigis_agents.mesh.audit_layer as al
+        calls = []
+        real = al._dumps
+        monkeypatch.setattr(al, "_dumps", lambda data: calls.append(data) or real(data))
+        result = MinimalAgent().invoke(
+            mode="tool_call", deal_id=deal_id, output_dir=str(tmp_path), custom_kwarg="hello",
+        )
+        assert result["status"] == "success"
+        # inputs once, outputs once (output audit) — inputs never re-serialised
+        assert [c for c in calls if c == {"custom_kwarg": "hello"}] == [{"custom_kwarg": "hello"}]
+
     def test_agent_id_required(self):
         with pytest.raises((ValueError, AttributeError)):
             class NoIdAgent(AgentBase):
@@ -87,3 +100,90 @@ class TestAgentBaseEnvelope:
         assert result["status"] == "error"
         assert result["error_type"] == "input_validation_failed"
         assert run_called["called"] is False
+
+    def test_context_loads_overlap(self, patch_toolkit, patch_get_chat_model, tmp_path, deal_id,
+                                   monkeypatch):
+        """Steps 5 and 5.5 run concurrently: each waits for the other at a barrier."""
+        import threading
+        import aigis_agents.mesh.agent_base as ab_mod
+        barrier = threading.Barrier(2, timeout=5)
+
+        def _dk(*a, **k):
+            barrier.wait()
+            return "DK"
+
+        def _buyer():
+            barrier.wait()
+            return "BUYER"
+
+        monkeypatch.setattr(ab_mod._dk_router, "build_context_block", _dk)
+        monkeypatch.setattr(ab_mod._buyer_profile, "load_as_context", _buyer)
+        result = MinimalAgent().invoke(mode="tool_call", deal_id=deal_id, output_dir=str(tmp_path))
+        assert result["status"] == "success"
+
+    def test_ainvoke_and_invoke_inside_running_loop(self, patch_toolkit, patch_get_chat_model,
+                                                    tmp_path, deal_id):
+        import asyncio
+
+        async def _main():
+            direct = await MinimalAgent().ainvoke(
+                mode="tool_call", deal_id=deal_id, output_dir=str(tmp_path), x=1)
+            nested = MinimalAgent().invoke(   # sync call from within a running loop
+                mode="tool_call", deal_id=deal_id, output_dir=str(tmp_path), x=1)
+            return direct, nested
+
+        direct, nested = asyncio.run(_main())
+        assert direct["status"] == nested["status"] == "success"
+        assert direct["data"] == nested["data"]
+        assert direct["data"]["inputs_echo"]["x"] == 1
+
+    def test_batch_output_audits_overlap(self, patch_toolkit, tmp_path, monkeypatch):
+        """Output audits of different deals are in flight together: each
+        waits at an asyncio barrier that only the other run can release."""
+        import asyncio
+        from helpers import VALID_INPUT_AUDIT, VALID_OUTPUT_AUDIT  # type: ignore[import]
+
+        barrier = asyncio.Barrier(2)
+        passed = []
+
+        class AsyncAuditLLM(MockLLM):
+            async def ainvoke(self, messages):
+                if "Output Quality Auditor" in str(messages):
+                    await asyncio.wait_for(barrier.wait(), 5)
+                    passed.append(True)
+                return self.invoke(messages)
+
+        llm = AsyncAuditLLM(responses={
+            "Input Quality Auditor": VALID_INPUT_AUDIT,
+            "Output Quality Auditor": VALID_OUTPUT_AUDIT,
+        })
+        monkeypatch.setattr("aigis_agents.mesh.agent_base.get_chat_model", lambda *a, **k: llm)
+        monkeypatch.setattr("aigis_agents.mesh.deal_context._MEMORY_ROOT", tmp_path / "memory")
+        calls = [
+            {"mode": "tool_call", "deal_id": f"deal-{i}", "output_dir": str(tmp_path)}
+            for i in range(2)
+        ]
+        results = MinimalAgent().invoke_batch(calls, max_concurrency=2)
+        assert [r["status"] for r in results] == ["success", "success"]
+        assert passed == [True, True]
+
+    def test_invoke_batch_preserves_order_and_isolates_failures(
+        self, patch_toolkit, patch_get_chat_model, tmp_path, monkeypatch,
+    ):
+        class PickyAgent(MinimalAgent):
+            def _run(self, deal_id, **kwargs):
+                return {"deal": deal_id}
+
+        monkeypatch.setattr("aigis_agents.mesh.deal_context._MEMORY_ROOT", tmp_path / "memory")
+
+        calls = [
+            {"mode": "tool_call", "deal_id": f"deal-{i}", "output_dir": str(tmp_path)}
+            for i in range(5)
+        ]
+        calls[2] = {"mode": "tool_call"}   # missing deal_id → TypeError inside ainvoke
+        results = PickyAgent().invoke_batch(calls, max_concurrency=2)
+        assert [r["status"] for r in results] == ["success"] * 2 + ["error"] + ["success"] * 2
+        assert [r["data"]["deal"] for r in results if r["status"] == "success"] == \
+            ["deal-0", "deal-1", "deal-3", "deal-4"]
+        assert results[2]["error_type"] == "execution_error"
+
@@ -2,7 +2,7 @@
 import json
 import pytest
 from aigis_agents.mesh.audit_layer import AuditLayer
-from helpers import MockLLM, VALID_OUTPUT_AUDIT  # type: ignore[import]
+from helpers import MockLLM, MockMessage, FAILING_INPUT_AUDIT, VALID_OUTPUT_AUDIT  # type: ignore[import]
 
 
 @pytest.fixture()
@@ -51,6 +51,148 @@ class TestInputAudit:
         assert result.get("_audit_fallback") is True
 
 
+    def test_acheck_inputs_matches_sync(self, audit_layer, failing_audit_layer, patch_toolkit):
+        import asyncio
+        inputs = {"operation": "query"}
+        for layer in (audit_layer, failing_audit_layer):   # MockLLM: no ainvoke → thread
+            assert asyncio.run(layer.acheck_inputs("agent_02", inputs)) == \
+                layer.check_inputs("agent_02", inputs)
+
+    def test_acheck_inputs_awaits_ainvoke(self, patch_toolkit):
+        import asyncio
+
+        class AsyncLLM(MockLLM):
+            async def ainvoke(self, messages):
+                self.awaited = True
+                return self.invoke(messages)
+
+        llm = AsyncLLM(responses={"Input Quality Auditor": "not json"})
+        result = asyncio.run(AuditLayer(llm).acheck_inputs("agent_02", {}))
+        assert llm.awaited is True
+        assert result["valid"] is True and result["_audit_fallback"] is True
+
+
+@pytest.mark.unit
+class TestParseJsonResponse:
+
+    @pytest.mark.parametrize("raw", [
+        '{"valid": true, "n": {"x": 1}}',
+        '```json\n{"valid": true, "n": {"x": 1}}\n```',
+        'Here is the audit:\n{"valid": true, "n": {"x": 1}}\nLet me know {if} needed.',
+        '{not json} then {"valid": true, "n": {"x": 1}}',
+    ])
+    def test_first_complete_object_extracted(self, raw):
+        from aigis_agents.mesh.audit_layer import _parse_json_response, _safe_input_default
+        assert _parse_json_response(raw, _safe_input_default) == {"valid": True, "n": {"x": 1}}
+
+    @pytest.mark.parametrize("raw", ["no json here", '["a list"]', '{"unterminated": '])
+    def test_no_object_falls_back(self, raw):
+        from aigis_agents.mesh.audit_layer import _parse_json_response, _safe_input_default
+        result = _parse_json_response(raw, _safe_input_default)
+        assert result["_audit_fallback"] is True
+        assert result["_raw_audit_response"] == raw
+
+
+class _StreamingLLM:
+    """Streams *reply* in small chunks; records how much was consumed."""
+
+    def __init__(self, reply: str, chunk: int = 7):
+        self._chunks = [reply[i:i + chunk] for i in range(0, len(reply), chunk)]
+        self.sent = 0
+        self.closed = False
+
+    def _message(self, text):
+        self.sent += 1
+        return MockMessage(text)
+
+    def stream(self, messages):
+        try:
+            for text in self._chunks:
+                yield self._message(text)
+        finally:
+            self.closed = True
+
+    async def astream(self, messages):
+        try:
+            for text in self._chunks:
+                yield self._message(text)
+        finally:
+            self.closed = True
+
+
+@pytest.mark.unit
+class TestStreamedAudit:
+
+    _REPLY = ('Sure. {"valid": false, "issues": [{"field": "x", "severity": "ERROR", '
+              '"message": "brace } and \\"quote\\" in text"}], "notes": "{ok}"}'
+              + " Trailing commentary the model keeps adding." * 20)
+
+    def test_stream_stops_at_first_object(self, patch_toolkit):
+        import asyncio
+        for run in (lambda a: a.check_inputs("agent_02", {}),
+                    lambda a: asyncio.run(a.acheck_inputs("agent_02", {}))):
+            llm = _StreamingLLM(self._REPLY)
+            result = run(AuditLayer(llm))
+            assert result["valid"] is False
+            assert result["issues"][0]["message"] == 'brace } and "quote" in text'
+            assert result["notes"] == "{ok}"
+            assert llm.sent < len(llm._chunks) // 4
+            assert llm.closed is True
+
+    @pytest.mark.parametrize("raw", [
+        '{not json} then {"valid": true}',
+        'Here is the audit:\n```json\n{"valid": true}\n```',
+        '{"unterminated": ',
+        "no json here",
+    ])
+    def test_scanner_agrees_with_full_parse(self, raw):
+        from aigis_agents.mesh.audit_layer import (
+            _ObjectScanner, _parse_json_response, _safe_input_default,
+        )
+        scanner = _ObjectScanner()
+        for ch in raw:
+            if scanner.feed(ch):
+                break
+        streamed = _parse_json_response(scanner.buf, _safe_input_default)
+        assert streamed == _parse_json_response(raw, _safe_input_default)
+
+
+@pytest.mark.unit
+class TestAuditPrompts:
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_prompts_match_template_format(self, patch_toolkit, monkeypatch, use_orjson):
+        import aigis_agents.mesh.audit_layer as al
+        from aigis_agents.mesh.toolkit_registry import ToolkitRegistry
+        if use_orjson and not al._ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(al, "_ORJSON_AVAILABLE", use_orjson)
+        entry = ToolkitRegistry.get("agent_02")
+        fields = {"agent_name": entry["name"], "agent_description": entry["description"]}
+        inputs = {"rate": 1.5, "wells": ["A-1", "B-2"], "nested": {"wi": 0.5}}
+        outputs = {"eur": 2.0}
+        assert al._input_audit_prompt("agent_02", inputs) == al._INPUT_AUDIT_PROMPT.format(
+            **fields, inputs_json=json.dumps(inputs, indent=2),
+        )
+        assert al._output_audit_prompt("agent_02", inputs, outputs) == al._OUTPUT_AUDIT_PROMPT.format(
+            **fields,
+            inputs_summary=json.dumps(inputs, indent=2),
+            outputs_summary=json.dumps(outputs, indent=2),
+        )
+
+    def test_dumps_handles_awkward_payloads(self):
+        import numpy as np
+        from datetime import date
+        from aigis_agents.mesh.audit_layer import _dumps
+        assert json.loads(_dumps({1: "int key", "d": date(2024, 1, 31)})) == {
+            "1": "int key", "d": "2024-01-31",
+        }
+        assert json.loads(_dumps({"q": np.array([1.0, 2.0]), "big": 2 ** 70})) in (
+            {"q": [1.0, 2.0], "big": 2 ** 70},      # orjson
+            {"q": "[1. 2.]", "big": 2 ** 70},       # stdlib, default=str
+        )
+
+
 @pytest.mark.unit
 class TestOutputAudit:
 
@@ -85,6 +227,154 @@ class TestOutputAudit:
         assert len(result.get("improvement_suggestions", [])) == 1
 
 
+class _FakeBatchClient:
+    """Stand-in for openai.OpenAI: answers each batch request from *replies*
+    (None → that request errors) after one in_progress poll."""
+
+    def __init__(self, replies):
+        from types import SimpleNamespace as NS
+        self.requests: list[dict] = []
+        client = self
+
+        class Files:
+            def create(self, file, purpose):
+                assert purpose == "batch"
+                client.requests = [json.loads(l) for l in file[1].decode().splitlines()]
+                return NS(id="file-in")
+
+            def content(self, file_id):
+                lines = []
+                for req in reversed(client.requests):   # output order is not guaranteed
+                    reply = replies[int(req["custom_id"].split("-")[1])]
+                    response = ({"status_code": 200,
+                                 "body": {"choices": [{"message": {"content": reply}}]}}
+                                if reply is not None else {"status_code": 500, "body": {}})
+                    lines.append(json.dumps({"custom_id": req["custom_id"], "response": response}))
+                return NS(text="\n".join(lines))
+
+        class Batches:
+            def create(self, input_file_id, endpoint, completion_window):
+                assert (endpoint, completion_window) == ("/v1/chat/completions", "24h")
+                return NS(id="batch-1", status="in_progress")
+
+            def retrieve(self, batch_id):
+                return NS(id=batch_id, status="completed", output_file_id="file-out")
+
+        self.files, self.batches = Files(), Batches()
+
+
+class ChatOpenAI:   # named like langchain_openai's class, which the batch path checks for
+    openai_api_base = None
+    temperature     = 0.1
+
+    def __init__(self, client):
+        self.model_name, self.root_client = "gpt-4.1-mini", client
+
+
+@pytest.mark.unit
+class TestBatchAudit:
+
+    def test_batch_results_mapped_back_in_order(self, patch_toolkit):
+        client = _FakeBatchClient([FAILING_INPUT_AUDIT, None, "{\"valid\": true, \"issues\": []}"])
+        audit = AuditLayer(ChatOpenAI(client))
+        items = [("agent_02", {"n": i}) for i in range(3)]
+        results = audit.check_inputs_batch(items, poll_interval_s=0)
+        assert results[0]["valid"] is False
+        assert results[1]["_audit_fallback"] is True and results[1]["valid"] is True
+        assert results[2] == {"valid": True, "issues": []}
+        req = client.requests[0]
+        assert req["body"]["model"] == "gpt-4.1-mini" and req["body"]["temperature"] == 0.1
+        assert '"n": 0' in req["body"]["messages"][1]["content"]
+
+    def test_non_openai_model_audits_one_by_one(self, audit_layer, patch_toolkit):
+        items = [("agent_02", {}, {"x": 1}), ("agent_02", {}, {"x": 2})]
+        results = audit_layer.check_outputs_batch(items)
+        assert results == [audit_layer.check_outputs(*item) for item in items]
+        assert audit_layer._llm.call_count == 4
+
+
+@pytest.mark.unit
+class TestAuditCache:
+
+    def test_exact_repeat_served_from_cache(self, patch_toolkit, tmp_path):
+        import asyncio
+        cache = tmp_path / "audit_cache.db"
+        llm = MockLLM(responses={"Output Quality Auditor": VALID_OUTPUT_AUDIT})
+        audit = AuditLayer(llm, cache_path=cache)
+        first = audit.check_outputs("agent_02", {}, {"x": 1})
+        again = AuditLayer(llm, cache_path=cache).check_outputs("agent_02", {}, {"x": 1})
+        assert llm.call_count == 1
+        assert again == {**first, "_audit_cache_hit": True}
+        assert "_audit_cache_hit" not in first
+        audit.check_outputs("agent_02", {}, {"x": 2})            # different prompt → miss
+        asyncio.run(audit.acheck_inputs("agent_02", {}))         # async path stores too
+        asyncio.run(audit.acheck_inputs("agent_02", {}))
+        assert llm.call_count == 3
+
+    def test_model_keyed_and_fallbacks_not_cached(self, patch_toolkit, tmp_path, monkeypatch):
+        cache = tmp_path / "audit_cache.db"
+        monkeypatch.setenv("AIGIS_AUDIT_CACHE", str(cache))
+        broken = MockLLM(responses={"Input Quality Auditor": "not json"})
+        AuditLayer(broken).check_inputs("agent_02", {})
+        AuditLayer(broken).check_inputs("agent_02", {})
+        assert broken.call_count == 2                              # fallback never cached
+
+        class OtherModel(MockLLM):
+            model_name = "other"
+
+        llm, other = MockLLM(), OtherModel()
+        AuditLayer(llm).check_inputs("agent_02", {})
+        AuditLayer(other).check_inputs("agent_02", {})
+        assert (llm.call_count, other.call_count) == (1, 1)
+
+    def test_disabled_by_default(self, audit_layer, patch_toolkit, monkeypatch):
+        monkeypatch.delenv("AIGIS_AUDIT_CACHE", raising=False)
+        assert AuditLayer(audit_layer._llm)._cache is None
+
+
+@pytest.mark.unit
+class TestShapeSkip:
+
+    def test_known_shape_skips_input_audit(self, patch_toolkit, tmp_path, monkeypatch):
+        import asyncio
+        monkeypatch.setenv("AIGIS_AUDIT_SHAPE_SKIP", "1")
+        llm = MockLLM()                                           # valid, HIGH, no issues
+        audit = AuditLayer(llm, cache_path=tmp_path / "audit_cache.db")
+        audit.check_inputs("agent_02", {"rate_bopd": 1200.0, "file": "a.xlsx"})
+        result = AuditLayer(llm, cache_path=tmp_path / "audit_cache.db").check_inputs(
+            "agent_02", {"file": "b.xlsx", "rate_bopd": 4800.0},
+        )
+        assert result["valid"] is True and result["_audit_skipped"] is True
+        assert asyncio.run(audit.acheck_inputs("agent_02", {"rate_bopd": 2e3, "file": "c"}))["_audit_skipped"]
+        assert llm.call_count == 1
+        for changed in ({"rate_bopd": 120_000.0, "file": "a"},    # order of magnitude
+                        {"rate_bopd": "1200", "file": "a"},       # type
+                        {"rate_bopd": 1200.0}):                   # keys
+            assert "_audit_skipped" not in audit.check_inputs("agent_02", changed)
+        audit.check_inputs("agent_01", {"rate_bopd": 1200.0, "file": "a"})   # other agent
+        assert llm.call_count == 5
+
+    def test_only_clean_passes_recorded(self, patch_toolkit, tmp_path):
+        warned = json.dumps({"valid": True, "confidence": "HIGH", "notes": "",
+                             "issues": [{"field": "x", "severity": "WARNING", "message": "odd"}]})
+        for i, reply in enumerate((warned, FAILING_INPUT_AUDIT, "not json")):
+            llm = MockLLM(responses={"Input Quality Auditor": reply})
+            audit = AuditLayer(llm, cache_path=tmp_path / f"cache_{i}.db", shape_skip=True)
+            audit.check_inputs("agent_02", {"x": 1})
+            audit.check_inputs("agent_02", {"x": 2})
+            assert llm.call_count == 2
+
+    def test_off_by_default_and_without_cache(self, patch_toolkit, tmp_path, monkeypatch):
+        monkeypatch.delenv("AIGIS_AUDIT_SHAPE_SKIP", raising=False)
+        llm = MockLLM()
+        off = AuditLayer(llm, cache_path=tmp_path / "audit_cache.db")
+        no_cache = AuditLayer(llm, cache_path="", shape_skip=True)
+        for audit in (off, no_cache):
+            audit.check_inputs("agent_02", {"x": 1})
+            assert "_audit_skipped" not in audit.check_inputs("agent_02", {"x": 2})
+        assert llm.call_count == 4
+
+
 @pytest.mark.unit
 class TestAuditLog:
 
@@ -121,3 +411,23 @@ class TestAuditLog:
         log_path = tmp_path / deal_id / "_audit_log.jsonl"
         lines = [ln for ln in log_path.read_text().strip().split("\n") if ln.strip()]
         assert len(lines) == 3
+
+    def test_handle_reused_and_reopened_after_delete(self, audit_layer, patch_toolkit,
+                                                     tmp_path, deal_id):
+        from aigis_agents.mesh import audit_layer as al
+        kwargs = dict(agent_id="agent_02", deal_id=deal_id, mode="tool_call", inputs={},
+                      input_audit={}, output_audit={}, main_model="m", audit_model="a",
+                      output_dir=str(tmp_path))
+        log_path = tmp_path / deal_id / "_audit_log.jsonl"
+        audit_layer.log(**kwargs)
+        handle = al._LOG_HANDLES[str(log_path)]
+        audit_layer.log(**kwargs)
+        assert al._LOG_HANDLES[str(log_path)] is handle
+        assert len(log_path.read_text().splitlines()) == 2   # flushed per record
+
+        log_path.unlink()
+        run_id = audit_layer.log(**kwargs)
+        assert json.loads(log_path.read_text())["run_id"] == run_id
+        al.close_audit_logs()
+        assert al._LOG_HANDLES == {}
+
@@ -67,3 +67,14 @@ class TestDomainKnowledgeRouter:
     def test_load_returns_dict(self, router):
         result = router.load(["financial"])
         assert isinstance(result, dict)
+
+    def test_wildcard_expansion_cached(self, router, monkeypatch):
+        import aigis_agents.mesh.domain_knowledge as dk
+        first = router.load(["oil_gas_101"])
+        calls = []
+        real_glob = dk._glob.glob
+        monkeypatch.setattr(dk._glob, "glob", lambda p: calls.append(p) or real_glob(p))
+        assert router.load(["oil_gas_101"]) == first
+        assert calls == []
+        assert router.load(["oil_gas_101"], refresh=True) == first
+        assert len(calls) == 1
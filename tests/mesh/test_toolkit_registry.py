@@ -64,6 +64,14 @@ class TestToolkitRegistryLoad:
         from aigis_agents.agent_02_data_store.agent import Agent02
         assert cls is Agent02
 
+    def test_get_agent_class_import_cached(self, patch_toolkit, monkeypatch):
+        from types import SimpleNamespace
+        import aigis_agents.mesh.toolkit_registry as tr
+        first = ToolkitRegistry.get_agent_class("agent_02")
+        monkeypatch.setattr(tr, "importlib", SimpleNamespace(
+            import_module=lambda *a: pytest.fail("module re-imported")))
+        assert ToolkitRegistry.get_agent_class("agent_02") is first
+
     def test_tool_call_schema(self, patch_toolkit):
         schema = ToolkitRegistry.tool_call_schema("agent_02")
         assert "data" in schema or "conflicts" in schema
@@ -137,6 +137,31 @@ class TestGenerateWellChart:
         )
         assert os.path.exists(out)
 
+    def test_renders_without_gor_or_wc(self, tmp_path):
+        from aigis_agents.agent_07_well_cards.chart_generator import generate_well_chart
+        periods = [
+            {k: v for k, v in p.items() if k not in ("gor_scf_stb", "wc_pct")}
+            for p in _make_periods(12)
+        ]
+        out = str(tmp_path / "boe_only.png")
+        generate_well_chart("BOE-ONLY", periods, _make_dca_result(), {}, "AMBER", out)
+        assert os.path.getsize(out) > 5_000
+
+    def test_unchanged_inputs_skip_render(self, tmp_path):
+        from aigis_agents.agent_07_well_cards.chart_generator import generate_well_chart
+        out = str(tmp_path / "cached.png")
+        kwargs = dict(well_name="W", periods=_make_periods(12), dca_result=None,
+                      forecast_data={}, rag_status="GREEN", output_path=out)
+        generate_well_chart(**kwargs)
+        assert os.path.exists(out + ".hash")
+        os.utime(out, (0, 0))
+        assert generate_well_chart(**kwargs) == out
+        assert os.path.getmtime(out) == 0           # not re-rendered
+        generate_well_chart(**kwargs, force=True)
+        assert os.path.getmtime(out) > 0
+        generate_well_chart(**{**kwargs, "rag_status": "RED"})
+        assert os.path.getmtime(out) > 0
+
 
 # ── Fleet summary chart ───────────────────────────────────────────────────────
 
@@ -179,3 +204,66 @@ class TestGenerateFleetDashboard:
         from aigis_agents.agent_07_well_cards.chart_generator import generate_fleet_dashboard
         result = generate_fleet_dashboard([], str(tmp_path / "x.html"))
         assert result is None
+
+
+# ── SoA view ──────────────────────────────────────────────────────────────────
+
+class TestBuildSoa:
+    def test_columns_align_with_cards(self):
+        from aigis_agents.agent_07_well_cards._soa import build_soa, RAG_STATUSES
+        cards = _make_well_cards(3)
+        soa = build_soa(cards)
+        assert list(soa["names"]) == ["WELL-001", "WELL-002", "WELL-003"]
+        assert [RAG_STATUSES[c] for c in soa["rag"]] == [c["rag_status"] for c in cards]
+        assert soa["rate"].tolist() == [1000.0, 800.0, 600.0]
+        assert soa["cpr_2p"].tolist() == [1.2, 1.2, 1.2]
+
+    def test_missing_fields_default(self):
+        import math
+        from aigis_agents.agent_07_well_cards._soa import build_soa
+        soa = build_soa([{"well_name": "X", "metrics": {"current_rate_boepd": None}}])
+        assert soa["rate"][0] == 0.0
+        assert math.isnan(soa["eur"][0])
+
+    def test_orderings(self):
+        from aigis_agents.agent_07_well_cards._soa import build_soa, rate_order, rag_order
+        cards = _make_well_cards(3)[::-1]   # RED, AMBER, GREEN by ascending rate
+        soa = build_soa(cards)
+        assert [cards[i]["well_name"] for i in rate_order(soa)] == ["WELL-001", "WELL-002", "WELL-003"]
+        assert [cards[i]["rag_status"] for i in rag_order(soa)] == ["GREEN", "AMBER", "RED"]
+
+
+# ── Batch per-well rendering ──────────────────────────────────────────────────
+
+class TestGenerateWellCharts:
+    def _jobs(self, tmp_path, n):
+        return [
+            (f"W{i}", _make_periods(12), _make_dca_result(), {}, "GREEN",
+             str(tmp_path / f"w{i}.png"))
+            for i in range(n)
+        ]
+
+    def test_serial_small_batch(self, tmp_path):
+        from aigis_agents.agent_07_well_cards.chart_generator import generate_well_charts
+        jobs = self._jobs(tmp_path, 2)
+        assert generate_well_charts(jobs) == [j[5] for j in jobs]
+
+    def test_parallel_batch_preserves_order(self, tmp_path):
+        from aigis_agents.agent_07_well_cards.chart_generator import generate_well_charts
+        jobs = self._jobs(tmp_path, 4)
+        out = generate_well_charts(jobs, max_workers=2)
+        assert out == [j[5] for j in jobs]
+        assert all(os.path.getsize(p) > 5_000 for p in out)
+
+    def test_failed_job_returns_none(self, tmp_path):
+        from aigis_agents.agent_07_well_cards.chart_generator import generate_well_charts
+        bad = ("BAD", [{"no_period_key": 1}], None, {}, "RED", str(tmp_path / "bad.png"))
+        assert generate_well_charts([bad]) == [None]
+
+    def test_submit_matches_generate(self, tmp_path):
+        from aigis_agents.agent_07_well_cards.chart_generator import submit_well_charts
+        for n, workers in ((2, None), (4, 2)):
+            jobs = self._jobs(tmp_path / f"n{n}", n)
+            future = submit_well_charts(jobs, max_workers=workers)
+            assert future.result(timeout=120) == [j[5] for j in jobs]
+            assert all(os.path.getsize(j[5]) > 5_000 for j in jobs)
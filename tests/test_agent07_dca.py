@@ -11,6 +11,7 @@ Covers:
 from __future__ import annotations
 
 import importlib.util
+import math
 
 import numpy as np
 import pytest
@@ -63,6 +64,59 @@ class TestArpsExponential:
         assert all(q[i] > q[i + 1] for i in range(len(q) - 1))
 
 
+class TestArpsJacobians:
+    @staticmethod
+    def _fd_jac(fn, t, params, h=1e-6):
+        cols = []
+        for k in range(len(params)):
+            step = h * max(1.0, abs(params[k]))
+            bumped = list(params)
+            bumped[k] += step
+            cols.append((fn(t, *bumped) - fn(t, *params)) / step)
+        return np.column_stack(cols)
+
+    def test_hyperbolic_matches_finite_differences(self):
+        from aigis_agents.agent_07_well_cards.dca_engine import _arps_hyperbolic_jac
+        t = np.arange(0, 36, dtype=float)
+        params = (800.0, 0.04, 0.6)
+        np.testing.assert_allclose(
+            _arps_hyperbolic_jac(t, *params), self._fd_jac(arps_hyperbolic, t, params),
+            rtol=1e-3, atol=1e-3,
+        )
+
+    def test_exponential_matches_finite_differences(self):
+        from aigis_agents.agent_07_well_cards.dca_engine import _arps_exponential_jac
+        t = np.arange(0, 36, dtype=float)
+        params = (800.0, 0.04)
+        np.testing.assert_allclose(
+            _arps_exponential_jac(t, *params), self._fd_jac(arps_exponential, t, params),
+            rtol=1e-3, atol=1e-2,
+        )
+
+
+class TestNumbaKernels:
+    """The compiled kernels must agree with the NumPy expressions they replace."""
+
+    @pytest.mark.skipif(importlib.util.find_spec("numba") is None, reason="numba not installed")
+    def test_kernels_match_numpy_path(self, monkeypatch):
+        from aigis_agents.agent_07_well_cards import dca_engine as de
+        assert de._NUMBA_AVAILABLE
+        t = np.linspace(0.0, 120.0, 61)
+        y = 900.0 * np.exp(-0.03 * t) + 5.0 * np.sin(t)
+        calls = [
+            lambda: de.arps_hyperbolic(t, 1200.0, 0.06, 0.7),
+            lambda: de.arps_hyperbolic(t, 1200.0, 0.06, 0.0),
+            lambda: de.arps_exponential(t, 1200.0, 0.06),
+            lambda: de._arps_hyperbolic_jac(t, 1200.0, 0.06, 0.7),
+            lambda: de._arps_exponential_jac(t, 1200.0, 0.06),
+            lambda: de._r_squared(y, de.arps_exponential(t, 900.0, 0.03)),
+        ]
+        compiled = [fn() for fn in calls]
+        monkeypatch.setattr(de, "_NUMBA_AVAILABLE", False)
+        for got, fn in zip(compiled, calls):
+            np.testing.assert_allclose(got, fn(), rtol=1e-12)
+
+
 # ── EUR calculation ───────────────────────────────────────────────────────────
 
 class TestComputeEur:
@@ -89,6 +143,30 @@ class TestComputeEur:
                                 economic_limit_boepd=0.0, projection_months=240)
         assert eur_long > eur_short
 
+    @pytest.mark.parametrize("b", [0.0, 0.5, 1.0, 1.4])
+    def test_matches_numerical_integral(self, b):
+        t = np.linspace(0.0, 240.0, 200_001)
+        q = arps_hyperbolic(t, 1000.0, 0.03, b) if b else arps_exponential(t, 1000.0, 0.03)
+        q = np.where(q >= 25.0, q, 0.0)
+        expected = float(np.sum((q[1:] + q[:-1]) * np.diff(t)) / 2.0 * 30.44)
+        eur = compute_eur(qi=1000.0, Di_monthly=0.03, b=b,
+                          economic_limit_boepd=25.0, projection_months=240)
+        assert eur == pytest.approx(expected, rel=1e-3)
+
+    @pytest.mark.parametrize("b", [0.0, 0.5])
+    def test_economic_limit_truncates_at_abandonment_time(self, b):
+        # q(t_ab) = 25 exactly; integrating past t_ab must add nothing
+        ratio = 1000.0 / 25.0
+        t_ab = (ratio ** b - 1.0) / (b * 0.03) if b else math.log(ratio) / 0.03
+        to_limit = compute_eur(qi=1000.0, Di_monthly=0.03, b=b,
+                               economic_limit_boepd=25.0, projection_months=10_000)
+        to_t_ab  = compute_eur(qi=1000.0, Di_monthly=0.03, b=b,
+                               economic_limit_boepd=0.0, projection_months=t_ab)
+        assert to_limit == pytest.approx(to_t_ab, rel=1e-12)
+
+    def test_limit_above_qi_returns_zero(self):
+        assert compute_eur(qi=20.0, Di_monthly=0.05, b=0.5, economic_limit_boepd=25.0) == 0.0
+
 
 # ── fit_decline_curve ─────────────────────────────────────────────────────────
 
@@ -122,6 +200,19 @@ class TestFitDeclineCurve:
         assert result.insufficient_data is True
         assert result.curve_type == "insufficient_data"
 
+    def test_short_history_skips_optimizer(self, monkeypatch):
+        from aigis_agents.agent_07_well_cards import dca_engine
+
+        def _no_solve(*args, **kwargs):
+            raise AssertionError("optimizer called for a short history")
+
+        monkeypatch.setattr(dca_engine, "_fit_lm_first", _no_solve)
+        for n in range(1, dca_engine.MIN_DATA_POINTS):
+            t = np.arange(n, dtype=float)
+            result = fit_decline_curve(t, 800.0 * 0.97 ** t)
+            assert result.insufficient_data is True
+            assert result.months_of_data == n
+
     def test_all_zeros_returns_insufficient(self):
         t = np.zeros(12)
         q = np.zeros(12)
@@ -156,6 +247,36 @@ class TestFitDeclineCurve:
         result = fit_decline_curve(t, q)
         assert result.months_of_data == 24
 
+    @pytest.mark.skipif(not _scipy_available, reason="scipy not installed")
+    def test_clean_exponential_skips_hyperbolic_fit(self, monkeypatch):
+        import aigis_agents.agent_07_well_cards.dca_engine as de
+        fitted = []
+        real = de._fit_lm_first
+        monkeypatch.setattr(de, "_fit_lm_first", lambda f, *a, **k: fitted.append(f) or real(f, *a, **k))
+        rng = np.random.default_rng(7)
+        t = np.arange(36, dtype=float)
+        q = arps_exponential(t, 900.0, 0.04) * (1.0 + rng.uniform(-0.01, 0.01, size=36))
+        result = fit_decline_curve(t, q)
+        assert result.curve_type == "exponential"
+        assert fitted == [de.arps_exponential]
+        assert not any("Hyperbolic fit failed" in f for f in result.flags)
+        assert result.Di_annual_pct == pytest.approx(48.0, rel=0.05)
+
+    @pytest.mark.skipif(not _scipy_available, reason="scipy not installed")
+    @pytest.mark.parametrize("Di_monthly, phrase", [(0.03, "above GoM"), (0.06, "very steep")])
+    def test_clean_exponential_keeps_decline_flags(self, Di_monthly, phrase):
+        t = np.arange(36, dtype=float)
+        result = fit_decline_curve(t, arps_exponential(t, 900.0, Di_monthly))
+        assert result.curve_type == "exponential"
+        assert len(result.flags) == 1 and phrase in result.flags[0]
+
+    @pytest.mark.skipif(not _scipy_available, reason="scipy not installed")
+    def test_curved_history_still_fits_hyperbolic(self):
+        t, q = self._synthetic_hyperbolic(Di_monthly=0.08, b=0.6, noise_pct=0.01)
+        result = fit_decline_curve(t, q)
+        assert result.curve_type == "hyperbolic"
+        assert result.b_factor == pytest.approx(0.6, abs=0.15)
+
 
 # ── project_decline_curve ─────────────────────────────────────────────────────
 
@@ -174,3 +295,48 @@ class TestProjectDeclineCurve:
         assert len(t) == 25  # 0..24 inclusive
         assert len(q) == 25
         assert q[0] >= q[-1]   # declining
+
+
+# ── fit_all_wells ─────────────────────────────────────────────────────────────
+
+@pytest.mark.skipif(not _scipy_available, reason="scipy not installed")
+class TestFitAllWells:
+    @staticmethod
+    def _wells(n):
+        t = np.arange(24, dtype=float)
+        return {f"W{i}": (t, arps_hyperbolic(t, 500.0 + 50 * i, 0.03, 0.5)) for i in range(n)}
+
+    def test_serial_matches_single_fits(self):
+        from aigis_agents.agent_07_well_cards.dca_engine import fit_all_wells
+        wells = self._wells(3)
+        out = fit_all_wells(wells)
+        assert list(out) == list(wells)
+        for name, (t, r) in wells.items():
+            assert out[name] == fit_decline_curve(t, r)
+
+    def test_parallel_preserves_order_and_results(self):
+        from aigis_agents.agent_07_well_cards.dca_engine import fit_all_wells
+        wells = self._wells(8)
+        out = fit_all_wells(wells, max_workers=2)
+        assert list(out) == list(wells)
+        assert out == fit_all_wells(wells, max_workers=1)
+
+
+# ── DCAResult layout ──────────────────────────────────────────────────────────
+
+class TestDcaResultsToArray:
+    def test_columns_match_results(self):
+        from aigis_agents.agent_07_well_cards.dca_engine import dca_results_to_array
+        results = [
+            DCAResult("hyperbolic", qi_boepd=800.0, Di_annual_pct=20.0, b_factor=0.9,
+                      eur_mmboe=1.5, fit_r2=0.95),
+            DCAResult("insufficient_data", insufficient_data=True),
+        ]
+        arr = dca_results_to_array(results)
+        assert arr.shape == (2,)
+        assert arr["qi"].tolist() == [800.0, 0.0]
+        assert np.flatnonzero(arr["b"] > 0.8).tolist() == [0]
+
+    def test_slots_dataclass(self):
+        r = DCAResult("failed")
+        assert not hasattr(r, "__dict__")
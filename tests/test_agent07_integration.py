@@ -11,6 +11,7 @@ Uses:
 from __future__ import annotations
 
 import json
+import os
 import sqlite3
 import uuid
 from datetime import datetime
@@ -202,6 +203,18 @@ class TestSingleWellMode:
         # Rate may be normalised BOE; just check it's >= 0
         assert rate is None or rate >= 0
 
+    def test_metrics_rounded_for_presentation(self, mock_db, patch_get_chat_model_07):
+        deal_id, output_dir = mock_db
+        from aigis_agents.agent_07_well_cards.agent import Agent07
+        from aigis_agents.agent_07_well_cards.well_card_builder import _METRIC_DECIMALS
+        result = Agent07().invoke(
+            mode="tool_call", deal_id=deal_id, well_name="WELL-001", output_dir=output_dir
+        )
+        metrics = _unwrap(result)["metrics"]
+        for key, nd in _METRIC_DECIMALS.items():
+            if isinstance(metrics.get(key), float):
+                assert metrics[key] == round(metrics[key], nd), key
+
     def test_decline_curve_contains_eur(self, mock_db, patch_get_chat_model_07):
         deal_id, output_dir = mock_db
         from aigis_agents.agent_07_well_cards.agent import Agent07
@@ -259,6 +272,31 @@ class TestFleetMode:
         total = sum(rag.values())
         assert total == inner["total_wells"]
 
+    def test_connections_closed_when_build_raises(self, mock_db, patch_get_chat_model_07, monkeypatch):
+        from aigis_agents.agent_07_well_cards import production_processor as pp
+        from aigis_agents.agent_07_well_cards import well_card_builder as wcb
+        from aigis_agents.agent_07_well_cards.agent import Agent07
+        deal_id, output_dir = mock_db
+
+        def _boom(*args, **kwargs):
+            assert pp._CONNS                   # load_well_names left a cached handle
+            raise RuntimeError("build failed")
+
+        monkeypatch.setattr(wcb, "build_well_cards_bulk", _boom)
+        result = Agent07().invoke(mode="tool_call", deal_id=deal_id, output_dir=output_dir)
+        assert result["status"] == "error"
+        assert not pp._CONNS
+
+    def test_returned_cards_omit_internal_keys(self, mock_db, patch_get_chat_model_07):
+        deal_id, output_dir = mock_db
+        from aigis_agents.agent_07_well_cards.agent import Agent07
+        result = Agent07().invoke(
+            mode="tool_call", deal_id=deal_id, output_dir=output_dir
+        )
+        cards = _unwrap(result)["well_cards"]
+        assert cards and all("metrics" in c for c in cards)
+        assert not any(k.startswith("_") for c in cards for k in c)
+
     def test_fleet_metrics_present(self, mock_db, patch_get_chat_model_07):
         deal_id, output_dir = mock_db
         from aigis_agents.agent_07_well_cards.agent import Agent07
@@ -283,6 +321,14 @@ class TestFleetMode:
         if report:
             assert Path(report).exists(), f"MD report not found: {report}"
 
+    @pytest.mark.skipif(os.name != "posix", reason="POSIX file modes")
+    def test_md_report_mode_follows_umask(self, tmp_path):
+        from aigis_agents.agent_07_well_cards.report_generator import generate_md_report
+        report = Path(generate_md_report([], "Deal", "deal", str(tmp_path / "report.md")))
+        plain = tmp_path / "plain.md"
+        plain.write_text("")
+        assert report.stat().st_mode & 0o777 == plain.stat().st_mode & 0o777
+
     def test_standalone_succeeds_with_fleet_keys(self, mock_db, patch_get_chat_model_07):
         # _deal_context_section is consumed by AgentBase (step 10.5); verify outer success
         deal_id, output_dir = mock_db
@@ -323,3 +369,423 @@ class TestNoDataEdgeCases:
         assert isinstance(result, dict)
         inner = _unwrap(result)
         assert isinstance(inner, dict)
+
+
+# ── Bulk loaders / connection cache ───────────────────────────────────────────
+
+class TestBulkLoaders:
+    def test_bulk_matches_per_well(self, mock_db):
+        from aigis_agents.agent_07_well_cards import production_processor as pp
+        deal_id, output_dir = mock_db
+        wells = pp.load_well_names(deal_id, output_dir)
+        production = pp.load_all_production_series(deal_id, output_dir)
+        reserves   = pp.load_all_reserve_estimates(deal_id, output_dir)
+        scalars    = pp.load_all_scalar_metrics(deal_id, wells, output_dir)
+        assert sorted(production) == wells
+        for wn in wells:
+            assert production[wn] == pp.load_production_series(deal_id, wn, output_dir)
+            assert reserves[wn]   == pp.load_reserve_estimates(deal_id, wn, output_dir)
+            assert scalars[wn]    == pp.load_scalar_metrics(deal_id, wn, output_dir)
+        pp.close_connections()
+
+    def test_connection_reused_until_closed(self, mock_db):
+        from aigis_agents.agent_07_well_cards import production_processor as pp
+        deal_id, output_dir = mock_db
+        conn = pp._connect(deal_id, output_dir)
+        assert pp._connect(deal_id, output_dir) is conn
+        pp.close_connections()
+        assert pp._connect(deal_id, output_dir) is not conn
+        pp.close_connections()
+
+    def test_per_well_queries_use_entity_indexes(self, mock_db):
+        from aigis_agents.agent_07_well_cards import production_processor as pp
+        deal_id, output_dir = mock_db
+        conn = pp._connect(deal_id, output_dir)
+        plan = " ".join(
+            r[-1] for r in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT period_start FROM production_series "
+                "WHERE deal_id=? AND entity_name=? ORDER BY period_start, product",
+                (deal_id, "WELL-001"),
+            )
+        )
+        assert "idx_prod_deal_entity_period" in plan
+        assert "TEMP B-TREE" not in plan
+        pp.close_connections()
+
+    def test_scalar_fts_matches_substring_scan(self, mock_db):
+        from aigis_agents.agent_02_data_store import db_manager as db
+        from aigis_agents.agent_07_well_cards import production_processor as pp
+        deal_id, output_dir = mock_db
+        conn = db.get_connection(deal_id, output_dir)
+        doc_id = _seed_source_doc(conn, deal_id)
+        db.bulk_insert_scalars(conn, [
+            {"deal_id": deal_id, "doc_id": doc_id, "case_name": "actual", "category": "well",
+             "metric_name": "well_status", "metric_key": "Well-001 status", "value": 1.0, "unit": "-"},
+            {"deal_id": deal_id, "doc_id": doc_id, "case_name": "actual", "category": "well",
+             "metric_name": "choke_pct", "metric_key": "choke", "context": "for WELL-002 only",
+             "value": 40.0, "unit": "%"},
+        ])
+        conn.execute("DROP TABLE scalar_fts")   # simulate a store ingested before the FTS index
+        conn.commit()
+        conn.close()
+        pp.close_connections()
+
+        wells = ["WELL-001", "WELL-002"]
+        assert not db.has_scalar_fts(sqlite3.connect(str(Path(output_dir) / deal_id / "02_data_store.db")))
+        bulk = pp.load_all_scalar_metrics(deal_id, wells, output_dir)
+        assert not db.has_scalar_fts(pp._connect(deal_id, output_dir))   # Agent 07 never migrates
+        assert bulk == {"WELL-001": {"well_status": 1.0}, "WELL-002": {"choke_pct": 40.0}}
+        for wn in wells:
+            assert pp.load_scalar_metrics(deal_id, wn, output_dir) == bulk[wn]
+        pp.close_connections()
+
+        db.ensure_db(deal_id, output_dir)       # Agent 02 backfills the index
+        assert pp.load_all_scalar_metrics(deal_id, wells, output_dir) == bulk
+        pp.close_connections()
+
+    def test_failed_fts_rebuild_leaves_no_index(self, mock_db, monkeypatch):
+        from aigis_agents.agent_02_data_store import db_manager as db
+        deal_id, output_dir = mock_db
+        conn = db.get_connection(deal_id, output_dir)
+        if not db.has_scalar_fts(conn):
+            pytest.skip("SQLite built without FTS5 trigram")
+        conn.execute("DROP TABLE scalar_fts")
+        conn.commit()
+        monkeypatch.setattr(db, "_SCALAR_FTS_REBUILD",
+                            "INSERT INTO scalar_fts(scalar_fts) VALUES ('no-such-command');")
+        db.ensure_indexes(conn)
+        assert not db.has_scalar_fts(conn)       # no empty index left to trust
+        monkeypatch.undo()
+        db.ensure_indexes(conn)
+        assert db.has_scalar_fts(conn)
+        conn.close()
+
+    def test_materialized_pivot_matches_python_pivot(self, mock_db):
+        from aigis_agents.agent_02_data_store import db_manager as db
+        from aigis_agents.agent_07_well_cards import production_processor as pp
+        deal_id, output_dir = mock_db
+
+        def _check():
+            for wn in ("WELL-001", "WELL-002"):
+                records = pp.load_production_series(deal_id, wn, output_dir)
+                actual, forecast = pp.split_pivoted(pp.load_pivoted(deal_id, wn, output_dir))
+                for got, want in ((actual, pp.pivot_production(records)),
+                                  (forecast, pp.pivot_forecast(records))):
+                    assert list(got) == list(want)
+                    for period, entry in want.items():
+                        assert list(got[period]) == list(entry)
+                        for key, val in entry.items():
+                            assert got[period][key] == (pytest.approx(val) if isinstance(val, float) else val)
+            pp.close_connections()
+
+        _check()
+
+        # Re-ingesting a row (ON CONFLICT REPLACE) must not double count
+        conn = db.get_connection(deal_id, output_dir)
+        row = dict(conn.execute(
+            "SELECT * FROM production_series WHERE entity_name='WELL-001' LIMIT 1"
+        ).fetchone())
+        row["id"] = str(uuid.uuid4())
+        row["value_normalised"] = 123.0
+        cols = ", ".join(row)
+        conn.execute(f"INSERT INTO production_series ({cols}) VALUES ({', '.join('?' * len(row))})",
+                     tuple(row.values()))
+        conn.commit()
+        _check()
+
+        # Stores built before the view existed are pivoted in Python, not migrated
+        conn.executescript(
+            "DROP TRIGGER monthly_production_ai; DROP TRIGGER monthly_production_ad; "
+            "DROP TRIGGER monthly_production_au; DROP TABLE monthly_production;"
+        )
+        conn.close()
+        assert pp.load_pivoted(deal_id, "WELL-001", output_dir) is None
+        pp.close_connections()
+        db.ensure_db(deal_id, output_dir)       # Agent 02 backfills the view
+        _check()
+
+    def test_failed_pivot_backfill_leaves_no_view(self, mock_db, monkeypatch):
+        from aigis_agents.agent_02_data_store import db_manager as db
+        deal_id, output_dir = mock_db
+        conn = db.get_connection(deal_id, output_dir)
+        conn.executescript(
+            "DROP TRIGGER monthly_production_ai; DROP TRIGGER monthly_production_ad; "
+            "DROP TRIGGER monthly_production_au; DROP TABLE monthly_production;"
+        )
+        monkeypatch.setattr(db, "_MONTHLY_PRODUCTION_SELECT", "SELECT no_such_column FROM production_series")
+        with pytest.raises(sqlite3.OperationalError):
+            db.ensure_indexes(conn)
+        assert not db.has_monthly_production(conn)          # DDL rolled back with the backfill
+        monkeypatch.undo()
+        db.ensure_indexes(conn)
+        assert conn.execute("SELECT COUNT(*) FROM monthly_production").fetchone()[0] > 0
+        conn.close()
+
+
+# ── Batched narrative generation ──────────────────────────────────────────────
+
+class _BatchLLM(MockLLM):
+    """MockLLM with a LangChain-style batch(); records the batch calls."""
+
+    def __init__(self, *args, fail_well: str | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.batches: list[tuple[int, dict]] = []
+        self.fail_well = fail_well
+
+    def batch(self, inputs, config=None, return_exceptions=False):
+        self.batches.append((len(inputs), config))
+        out = []
+        for messages in inputs:
+            if self.fail_well and self.fail_well in str(messages):
+                out.append(RuntimeError("rate limited"))
+            else:
+                out.append(self.invoke(messages))
+        return out
+
+
+class TestBuildWellCardsBulk:
+    def _bulk(self, mock_db, llm, wells=None):
+        from aigis_agents.agent_07_well_cards import production_processor as pp
+        from aigis_agents.agent_07_well_cards.well_card_builder import build_well_cards_bulk
+        deal_id, output_dir = mock_db
+        wells = wells or pp.load_well_names(deal_id, output_dir)
+        cards = build_well_cards_bulk(
+            deal_id, wells, llm, "", "", [], output_dir=output_dir, generate_charts=False,
+        )
+        pp.close_connections()
+        return wells, cards
+
+    def test_single_batch_call_matches_per_well(self, mock_db):
+        from aigis_agents.agent_07_well_cards.well_card_builder import build_well_card
+        deal_id, output_dir = mock_db
+        llm = _BatchLLM(responses={"senior reservoir engineer": WELL_CARD_NARRATIVE})
+        wells, cards = self._bulk(mock_db, llm)
+        assert llm.batches == [(len(wells), {"max_concurrency": 8})]
+        for wn, card in zip(wells, cards):
+            single = build_well_card(deal_id, wn, _well_card_mock_llm(), "", "", [],
+                                     output_dir=output_dir, generate_charts=False)
+            assert card == single
+            assert card["narrative"].startswith("Well TEST-001")
+
+    def test_invoke_only_llm_and_failed_item_fall_back(self, mock_db):
+        llm = _BatchLLM(responses={"senior reservoir engineer": WELL_CARD_NARRATIVE},
+                        fail_well="WELL-002")
+        wells, cards = self._bulk(mock_db, llm)
+        by_name = dict(zip(wells, cards))
+        assert by_name["WELL-002"]["narrative"].startswith("Well WELL-002 shows")
+        assert by_name["WELL-001"]["narrative"].startswith("Well TEST-001")
+
+        plain = _well_card_mock_llm()   # no batch() → one invoke per well
+        _, cards = self._bulk(mock_db, plain)
+        assert plain.call_count == len(wells)
+        assert all(c["narrative"].startswith("Well TEST-001") for c in cards)
+
+    def test_insufficient_data_well_skips_llm(self, mock_db):
+        from aigis_agents.agent_02_data_store import db_manager as db
+        from aigis_agents.agent_07_well_cards.well_card_builder import build_well_card
+        deal_id, output_dir = mock_db
+        conn = db.get_connection(deal_id, output_dir)
+        _seed_production(conn, deal_id, "WELL-NEW", _seed_source_doc(conn, deal_id), n_months=3)
+        conn.close()
+
+        llm = _BatchLLM(responses={"senior reservoir engineer": WELL_CARD_NARRATIVE})
+        wells, cards = self._bulk(mock_db, llm)
+        assert llm.batches == [(len(wells) - 1, {"max_concurrency": 8})]
+        assert "WELL-NEW" not in llm.last_prompt
+        new = dict(zip(wells, cards))["WELL-NEW"]
+        assert new["decline_curve"]["insufficient_data"] is True
+        assert new["narrative"].startswith("Well WELL-NEW has 3 months")
+
+        single_llm = _well_card_mock_llm()
+        single = build_well_card(deal_id, "WELL-NEW", single_llm, "", "", [],
+                                 output_dir=output_dir, generate_charts=False)
+        assert single_llm.call_count == 0
+        assert single == new
+
+    def test_llm_flags_merged_once_in_order(self, mock_db):
+        from aigis_agents.agent_07_well_cards.well_card_builder import build_well_card
+        deal_id, output_dir = mock_db
+        reply = json.dumps({
+            "b_flag": "Check b", "di_flag": "Steep", "eur_flag": None,
+            "red_flags": ["Steep", "Water", "Water", ""], "narrative": "Dupes.",
+        })
+        base = build_well_card(deal_id, "WELL-001", MockLLM(responses={"senior": "{}"}),
+                               "", "", [], output_dir=output_dir, generate_charts=False)
+        card = build_well_card(deal_id, "WELL-001", MockLLM(responses={"senior": reply}),
+                               "", "", [], output_dir=output_dir, generate_charts=False)
+        assert card["flags"] == base["flags"] + ["Steep", "Water", "Check b"]
+
+    def test_prepare_failure_yields_error_card(self, mock_db, monkeypatch):
+        from aigis_agents.agent_07_well_cards import well_card_builder as wcb
+        real = wcb._prepare_card
+
+        def _prepare(deal_id, well_name, *args, **kwargs):
+            if well_name == "WELL-001":
+                raise ValueError("boom")
+            return real(deal_id, well_name, *args, **kwargs)
+
+        monkeypatch.setattr(wcb, "_prepare_card", _prepare)
+        llm = _BatchLLM(responses={"senior reservoir engineer": WELL_CARD_NARRATIVE})
+        wells, cards = self._bulk(mock_db, llm)
+        assert cards[0]["rag_status"] == "BLACK"
+        assert cards[0]["flags"] == ["Card generation error: boom"]
+        assert llm.batches[0][0] == len(wells) - 1
+
+    def test_structured_output_binding_used_when_available(self, mock_db):
+        from aigis_agents.agent_07_well_cards.well_card_builder import DCAReview
+
+        class _StructuredLLM(MockLLM):
+            def with_structured_output(self, schema):
+                assert schema is DCAReview
+                outer = self
+
+                class _Bound:
+                    def invoke(self, messages):
+                        outer.invoke(messages)
+                        return DCAReview(red_flags=["Water breakthrough"], narrative="Structured.")
+                return _Bound()
+
+        llm = _StructuredLLM()
+        wells, cards = self._bulk(mock_db, llm)
+        assert llm.call_count == len(wells)
+        assert "Respond ONLY with this JSON" not in llm.last_prompt
+        assert all(c["narrative"] == "Structured." for c in cards)
+        assert all("Water breakthrough" in c["flags"] for c in cards)
+
+        text_llm = _well_card_mock_llm()
+        self._bulk(mock_db, text_llm)
+        assert "Respond ONLY with this JSON" in text_llm.last_prompt
+
+    def test_deal_context_sent_once_as_shared_system_message(self, mock_db):
+        from langchain_core.messages import HumanMessage, SystemMessage
+        from aigis_agents.agent_07_well_cards import production_processor as pp
+        from aigis_agents.agent_07_well_cards.well_card_builder import build_well_cards_bulk
+        deal_id, output_dir = mock_db
+        llm = _BatchLLM(responses={"senior reservoir engineer": WELL_CARD_NARRATIVE})
+        seen: list = []
+        llm.invoke = lambda messages, _inv=llm.invoke: seen.append(messages) or _inv(messages)
+        wells = pp.load_well_names(deal_id, output_dir)
+        build_well_cards_bulk(deal_id, wells, llm, "GoM benchmarks " * 50, "Field X", [],
+                              output_dir=output_dir, generate_charts=False)
+        pp.close_connections()
+        assert len(seen) == len(wells)
+        systems = {m[0].content for m in seen}
+        assert len(systems) == 1 and "GoM benchmarks" in systems.pop()
+        for wn, (system, human) in zip(wells, seen):
+            assert isinstance(system, SystemMessage) and isinstance(human, HumanMessage)
+            assert wn in human.content and "GoM benchmarks" not in human.content
+
+    def test_finalize_failure_keeps_other_charts(self, mock_db, monkeypatch, tmp_path):
+        from aigis_agents.agent_07_well_cards import production_processor as pp
+        from aigis_agents.agent_07_well_cards import well_card_builder as wcb
+        deal_id, output_dir = mock_db
+        real = wcb._finalize_card
+
+        def _finalize(deal_id, draft, *args):
+            if draft["well_name"] == "WELL-001":
+                raise ValueError("boom")
+            return real(deal_id, draft, *args)
+
+        monkeypatch.setattr(wcb, "_finalize_card", _finalize)
+        wells = pp.load_well_names(deal_id, output_dir)
+        cards = wcb.build_well_cards_bulk(
+            deal_id, wells, _well_card_mock_llm(), "", "", [],
+            output_dir=output_dir, charts_dir=str(tmp_path / "charts"),
+        )
+        pp.close_connections()
+        assert cards[0]["flags"] == ["Card generation error: boom"]
+        assert "chart_path" not in cards[0]
+        assert Path(cards[1]["chart_path"]).exists()
+
+    def test_process_pool_preparation_matches_serial(self, mock_db, tmp_path):
+        from aigis_agents.agent_07_well_cards import production_processor as pp
+        from aigis_agents.agent_07_well_cards.well_card_builder import build_well_cards_bulk
+        deal_id, output_dir = mock_db
+        wells = pp.load_well_names(deal_id, output_dir) * 4       # ≥ PARALLEL_MIN_WELLS
+        preloads = dict(
+            all_pivoted  = pp.load_all_pivoted(deal_id, output_dir),
+            all_reserves = pp.load_all_reserve_estimates(deal_id, output_dir),
+            all_scalars  = pp.load_all_scalar_metrics(deal_id, wells, output_dir),
+        )
+        pp.close_connections()
+        assert preloads["all_pivoted"] is not None                # pool path is taken
+
+        def _build(max_workers, charts_dir):
+            return build_well_cards_bulk(
+                deal_id, wells, _well_card_mock_llm(), "", "", [], output_dir=output_dir,
+                charts_dir=str(charts_dir), max_workers=max_workers, **preloads,
+            )
+
+        serial   = _build(1, tmp_path / "serial")
+        parallel = _build(2, tmp_path / "parallel")
+        assert len(parallel) == len(wells)
+        for s_card, p_card in zip(serial, parallel):
+            s_path, p_path = s_card.pop("chart_path"), p_card.pop("chart_path")
+            assert s_card == p_card
+            assert Path(s_path).name == Path(p_path).name
+            assert Path(p_path).exists()
+
+    def test_process_pool_sized_to_jobs_without_fork(self, monkeypatch):
+        import os
+        from aigis_agents.agent_07_well_cards import _pool
+        monkeypatch.setattr(os, "cpu_count", lambda: 64)
+        assert _pool.pool_size(None, 8) == 8
+        assert _pool.pool_size(4, 8) == 4
+        assert _pool.pool_size(None, 0) == 1
+        assert _pool._MP_CONTEXT.get_start_method() in ("forkserver", "spawn")
+
+    def test_fleet_without_preloads_uses_bulk_loaders(self, mock_db, monkeypatch):
+        from aigis_agents.agent_07_well_cards import well_card_builder as wcb
+
+        def _per_well(*args, **kwargs):
+            raise AssertionError("per-well query on a fleet run")
+
+        for name in ("load_pivoted", "load_production_series",
+                     "load_reserve_estimates", "load_scalar_metrics"):
+            monkeypatch.setattr(wcb, name, _per_well)
+        wells, cards = self._bulk(mock_db, _well_card_mock_llm())
+        assert len(wells) > 1
+        assert all(c["metrics"]["current_rate_boepd"] for c in cards)
+
+
+# ── Narrative reply parsing ───────────────────────────────────────────────────
+
+class TestChartPath:
+    @pytest.mark.parametrize("name", ["WELL-001", "A/B 12 (ST1)", "Well_#3.x", "Ölfeld—Nord", ""])
+    def test_matches_per_character_sanitizer(self, name):
+        from aigis_agents.agent_07_well_cards.well_card_builder import _chart_path
+        expected = "".join(c if c.isalnum() or c in "-_" else "_" for c in name)
+        assert _chart_path("charts", name) == os.path.join("charts", f"{expected}_production.png")
+
+
+class TestClip:
+    def test_cuts_at_whitespace_near_limit(self):
+        from aigis_agents.agent_07_well_cards.well_card_builder import _clip
+        text = "x" * 90 + " GOR 1,500 scf/stb"
+        assert _clip(text, 98) == "x" * 90 + " GOR"
+        assert _clip(text, 100) == "x" * 90 + " GOR 1,500"
+        assert _clip(text, 200) == text
+
+    def test_hard_cut_without_nearby_whitespace(self):
+        from aigis_agents.agent_07_well_cards.well_card_builder import _clip
+        text = "a " + "°" * 200
+        assert _clip(text, 100) == "a " + "°" * 98
+
+
+class TestParseNarrative:
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_fenced_and_bare_json(self, monkeypatch, use_orjson):
+        from aigis_agents.agent_07_well_cards import well_card_builder as wcb
+        from helpers import MockMessage  # type: ignore[import]
+        if use_orjson and not wcb._ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        if not use_orjson:
+            monkeypatch.setattr(wcb, "_json_loads", json.loads)
+        expected = json.loads(WELL_CARD_NARRATIVE)
+        assert wcb._parse_narrative(MockMessage(WELL_CARD_NARRATIVE)) == expected
+        assert wcb._parse_narrative(MockMessage(f"```json\n{WELL_CARD_NARRATIVE}\n```")) == expected
+        assert wcb._parse_narrative(MockMessage(
+            f"Here is the review:\n```json\n{WELL_CARD_NARRATIVE}\n```\nLet me know if you need more."
+        )) == expected
+        with pytest.raises(ValueError):
+            wcb._parse_narrative(MockMessage("not json"))
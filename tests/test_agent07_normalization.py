@@ -148,6 +148,22 @@ class TestNormalizeProduction:
         assert isinstance(normalized, list)
         assert isinstance(flags, list)
 
+    def test_partial_uptime_data_mixes_sources(self):
+        from aigis_agents.agent_07_well_cards.production_processor import (
+            normalize_production, pivot_production,
+        )
+        periods_dict = pivot_production(_make_records())
+        first = next(iter(periods_dict))
+        normalized, flags = normalize_production(
+            periods_dict, uptime_data={first: 80.0}, default_uptime=90.0,
+        )
+        assert normalized[0]["uptime_source"] == "actual"
+        assert normalized[0]["uptime_factor"] == 0.8
+        assert normalized[0]["oil_norm"] == pytest.approx(normalized[0]["oil_bopd"] / 0.8)
+        assert all(p["uptime_source"] == "assumed" for p in normalized[1:])
+        assert all(p["uptime_factor"] == 0.9 for p in normalized[1:])
+        assert any(str(len(normalized) - 1) in f for f in flags)
+
     def test_returns_list_and_flags(self):
         from aigis_agents.agent_07_well_cards.production_processor import (
             normalize_production, pivot_production,
@@ -210,6 +226,29 @@ class TestComputeSecondaryMetrics:
         gor_trends = [p.get("gor_12m_trend_pct") for p in enriched]
         assert all(v is None for v in gor_trends)
 
+    def test_12mo_trends_against_prior_year(self):
+        from aigis_agents.agent_07_well_cards.production_processor import compute_secondary_metrics
+        periods = [
+            {"period": f"{2023 + i // 12}-{i % 12 + 1:02d}",
+             "oil_norm": 1000.0, "gas_norm": 1.0 + 0.1 * i, "water_norm": 10.0 * i}
+            for i in range(14)
+        ]
+        enriched = compute_secondary_metrics(periods)
+        assert enriched[11]["gor_12m_trend_pct"] is None
+        gor0, gor12 = enriched[0]["gor_scf_stb"], enriched[12]["gor_scf_stb"]
+        assert enriched[12]["gor_12m_trend_pct"] == pytest.approx((gor12 - gor0) / gor0 * 100)
+        assert enriched[13]["wc_12m_trend_ppts"] == pytest.approx(
+            enriched[13]["wc_pct"] - enriched[1]["wc_pct"]
+        )
+
+    def test_unsorted_list_input_is_ordered(self):
+        from aigis_agents.agent_07_well_cards.production_processor import (
+            compute_secondary_metrics, normalize_production, pivot_production,
+        )
+        normalized, _ = normalize_production(pivot_production(_make_records()))
+        enriched = compute_secondary_metrics(normalized[::-1])
+        assert [p["period"] for p in enriched] == [p["period"] for p in normalized]
+
 
 # ── compute_summary_stats ─────────────────────────────────────────────────────
 
@@ -243,6 +282,37 @@ class TestComputeSummaryStats:
         stats = compute_summary_stats([])
         assert stats.get("current_rate_boepd") is None or stats.get("current_rate_boepd") == 0
 
+    def test_columns_match_records(self):
+        import numpy as np
+        from aigis_agents.agent_07_well_cards.production_processor import (
+            compute_secondary_columns, compute_summary_stats, normalize_production, pivot_production,
+        )
+        normalized, _ = normalize_production(pivot_production(_make_records()))
+        cols = compute_secondary_columns(normalized)
+        records = cols.to_records()
+        assert cols.period == [p["period"] for p in records]
+        assert cols.boe.tolist() == [p["boe_norm"] for p in records]
+        assert np.array_equal(cols.month_idx, np.arange(len(records), dtype=float))
+        assert compute_summary_stats(cols) == compute_summary_stats(records)
+
+    def test_empty_columns_returns_defaults(self):
+        from aigis_agents.agent_07_well_cards.production_processor import (
+            compute_secondary_columns, compute_summary_stats,
+        )
+        assert compute_summary_stats(compute_secondary_columns([])) == compute_summary_stats([])
+
+    def test_summary_dataclass_matches_dict(self):
+        from aigis_agents.agent_07_well_cards.production_processor import (
+            SummaryStats, compute_secondary_columns, compute_summary, compute_summary_stats,
+            normalize_production, pivot_production,
+        )
+        normalized, _ = normalize_production(pivot_production(_make_records()))
+        cols = compute_secondary_columns(normalized)
+        stats = compute_summary(cols)
+        assert isinstance(stats, SummaryStats)
+        assert stats.to_dict() == compute_summary_stats(cols.to_records())
+        assert compute_summary([]) == SummaryStats()
+
 
 # ── extract_cpr_eur ───────────────────────────────────────────────────────────
 
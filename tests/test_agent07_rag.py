@@ -6,10 +6,12 @@ Covers:
   - Secondary flag escalation (GOR, WC, DI, uptime)
   - Pattern overrides (_apply_pattern_overrides)
   - summarize_fleet_rag fleet aggregation
+  - classify_wells_bulk agreement with classify_well
 """
 
 from __future__ import annotations
 
+import numpy as np
 import pytest
 
 from aigis_agents.agent_07_well_cards.rag_classifier import (
@@ -19,7 +21,9 @@ from aigis_agents.agent_07_well_cards.rag_classifier import (
     RED,
     RAGResult,
     classify_well,
+    classify_wells_bulk,
     summarize_fleet_rag,
+    top_flag,
     _apply_pattern_overrides,
 )
 
@@ -53,7 +57,7 @@ def _classify(
 # ── BLACK: shut-in ────────────────────────────────────────────────────────────
 
 class TestBlackStatus:
-    @pytest.mark.parametrize("status", ["shut-in", "shut_in", "suspended", "p&a", "plugged"])
+    @pytest.mark.parametrize("status", ["shut-in", "shut_in", "suspended", "p&a", "plugged", "Shut-In"])
     def test_shut_in_statuses_return_black(self, status):
         r = _classify(well_status=status)
         assert r.status == BLACK
@@ -195,6 +199,15 @@ class TestR2Flag:
         assert r.status == GREEN
         assert any("R²" in f or "r2" in f.lower() or "r²" in f.lower() for f in r.flags)
 
+    def test_result_is_slotted(self):
+        assert not hasattr(_classify(), "__dict__")
+
+    def test_flags_rendered_lazily_once(self):
+        r = _classify(current=1000.0, forecast=1000.0, fit_r2=0.60)
+        assert r._flags is None
+        assert any("R²=0.60" in f for f in r.flags)
+        assert r.flags is r.flags
+
 
 # ── Pattern overrides ─────────────────────────────────────────────────────────
 
@@ -218,12 +231,35 @@ class TestPatternOverrides:
         _, overrides = _apply_pattern_overrides({}, patterns)
         assert any("gom_uptime_benchmark" in o for o in overrides)
 
+    def test_unknown_classification_ignored(self):
+        patterns = [{"classification": "something_else", "rule": "x", "weight": "HIGH"}]
+        _, overrides = _apply_pattern_overrides({}, patterns)
+        assert overrides == []
+
+    @pytest.mark.parametrize("patterns", [None, []])
+    def test_no_patterns_skips_override_pass(self, monkeypatch, patterns):
+        from aigis_agents.agent_07_well_cards import rag_classifier
+
+        def _fail(*_args):
+            raise AssertionError("_apply_pattern_overrides called without patterns")
+
+        monkeypatch.setattr(rag_classifier, "_apply_pattern_overrides", _fail)
+        assert _classify(patterns=patterns).learned_overrides == []
+
     def test_classify_well_propagates_overrides(self):
         patterns = [{"classification": "gor_threshold_gas_condensate",
                      "rule": "GOR condensate rule", "weight": "MEDIUM"}]
         r = _classify(patterns=patterns)
         assert any("gor_threshold_gas_condensate" in o for o in r.learned_overrides)
 
+    def test_overrides_do_not_leak_into_default_thresholds(self):
+        from aigis_agents.agent_07_well_cards.rag_classifier import _DEFAULT_THRESHOLDS
+        before = dict(_DEFAULT_THRESHOLDS)
+        _classify(patterns=[{"classification": "gor_threshold_gas_condensate",
+                             "rule": "GOR condensate rule", "weight": "MEDIUM"}])
+        assert _DEFAULT_THRESHOLDS == before
+        assert _classify().learned_overrides == []
+
 
 # ── summarize_fleet_rag ───────────────────────────────────────────────────────
 
@@ -267,3 +303,63 @@ class TestSummarizeFleetRag:
         summary = summarize_fleet_rag([])
         assert summary["total_current_rate_boepd"] == 0.0
         assert summary["rag_summary"][GREEN] == 0
+
+    def test_missing_fields_and_unknown_status(self):
+        cards = [
+            {"rag_status": "GREY", "flags": ["critical: lower-case", "CRITICAL: two", "benign"]},
+            {"metrics": {"current_rate_boepd": None}, "decline_curve": {"Di_annual_pct": 30.0}},
+        ]
+        summary = summarize_fleet_rag(cards)
+        assert summary["rag_summary"] == {GREEN: 1, AMBER: 0, RED: 0, BLACK: 0, "GREY": 1}
+        assert summary["critical_flag_count"] == 2
+        assert summary["total_current_rate_boepd"] == 0.0
+        assert summary["weighted_decline_rate_pct"] == 30.0
+
+    def test_critically_low_uptime_flag_counts_as_critical(self):
+        r = _classify(uptime=50.0)
+        summary = summarize_fleet_rag([{"rag_status": r.status, "flags": r.flags}])
+        assert summary["critical_flag_count"] == 1
+
+    def test_top_flag_truncates_first_flag(self):
+        assert top_flag([]) == ""
+        assert top_flag(["short", "x" * 200]) == "short"
+        assert top_flag(["y" * 81]) == "y" * 80 + "…"
+        assert top_flag(["y" * 80]) == "y" * 80
+
+
+# ── classify_wells_bulk ───────────────────────────────────────────────────────
+
+class TestClassifyWellsBulk:
+    # (current, forecast, gor, wc, di, uptime, status) — boundaries on purpose
+    WELLS = [
+        (1100.0, 1000.0, None, None, None, None, None),    # outperformer at cut
+        (900.0,  1000.0, None, None, None, None, None),    # on-track lower cut
+        (800.0,  1000.0, None, None, None, None, None),    # amber
+        (700.0,  1000.0, None, None, None, None, None),    # red
+        (1000.0, None,   20.0, None, None, None, None),    # no forecast, GOR amber
+        (1000.0, 0.0,    None, 15.0, None, None, None),    # zero forecast, WC red
+        (1000.0, 1000.0, None, None, 30.0, 85.0, None),    # DI amber, uptime ok
+        (1000.0, 1000.0, None, None, None, 69.9, None),    # uptime red
+        (0.0,    1000.0, None, None, None, None, None),    # no production
+        (1000.0, 1000.0, 99.0, None, None, None, "Shut-In"),
+    ]
+
+    def test_matches_classify_well(self):
+        from aigis_agents.agent_07_well_cards._soa import RAG_STATUSES
+        nan = lambda x: np.nan if x is None else x
+        cols = list(zip(*self.WELLS))
+        codes, variance = classify_wells_bulk(
+            *[np.array([nan(x) for x in c], dtype=float) for c in cols[:6]],
+            well_status=list(cols[6]),
+        )
+        for i, (cur, fc, gor, wc, di, up, st) in enumerate(self.WELLS):
+            r = classify_well(cur, fc, gor, wc, di, None, up, st)
+            assert RAG_STATUSES[codes[i]] == r.status
+            if r.variance_pct is None:
+                assert np.isnan(variance[i])
+            else:
+                assert variance[i] == r.variance_pct
+
+    def test_absent_metrics_skip_escalation(self):
+        codes, _ = classify_wells_bulk(np.array([1000.0]), np.array([1000.0]))
+        assert codes.tolist() == [0]
@@ -13,6 +13,7 @@ Coverage:
   - detect_preferences() returns [] on LLM failure (non-blocking)
   - AgentBase injects buyer_context into _run() arguments
   - Step 9.5 prompts user only in standalone mode (not tool_call)
+  - Step 9.5 prompts time out without blocking; skipped without a terminal
 """
 from __future__ import annotations
 
@@ -347,3 +348,66 @@ class TestAgentBaseBuyerContext:
                 output_dir=str(tmp_path),
             )
             mock_input.assert_not_called()
+
+
+# ── Step 9.5 prompt (non-blocking) ────────────────────────────────────────────
+
+class TestPreferencePrompt:
+    @pytest.fixture()
+    def agent(self, tmp_path, patch_toolkit, patch_get_chat_model, monkeypatch):
+        from aigis_agents.mesh.agent_base import AgentBase
+        from aigis_agents.mesh.audit_layer import AuditLayer
+        import aigis_agents.mesh.agent_base as ab
+
+        class ConcreteAgent(AgentBase):
+            AGENT_ID = "agent_04"
+            DK_TAGS  = []
+
+            def _run(self, deal_id, main_llm, dk_context, patterns, **_):
+                return {"result": "ok"}
+
+        signals = [
+            PreferenceSignal("price_deck", "oil_price_deck", "$65/bbl flat", "use $65", 0.95),
+            PreferenceSignal("financial_threshold", "min_irr_pct", "15%", "15% IRR", 0.9),
+        ]
+        monkeypatch.setattr(AuditLayer, "detect_preferences", lambda *a: signals)
+        monkeypatch.setattr(ab, "_stdin_is_tty", lambda: True)
+        agent = ConcreteAgent()
+        agent._buyer_profile = BuyerProfileManager(tmp_path / "buyer_profile.md")
+        return agent
+
+    def _invoke(self, agent, tmp_path):
+        return agent.invoke(mode="standalone", deal_id="test-deal-001", output_dir=str(tmp_path))
+
+    def test_answers_applied(self, agent, tmp_path):
+        with patch("builtins.input", side_effect=["y", "n"]) as mock_input, \
+             patch.object(agent._buyer_profile, "apply_signal") as apply:
+            assert self._invoke(agent, tmp_path)["status"] == "success"
+        assert mock_input.call_count == 2
+        assert [c.args[0].key for c in apply.call_args_list] == ["oil_price_deck"]
+
+    def test_unanswered_prompt_times_out(self, agent, tmp_path, monkeypatch):
+        import threading
+        import time
+        import aigis_agents.mesh.agent_base as ab
+        monkeypatch.setenv("AIGIS_PROMPT_TIMEOUT_S", "0.05")
+        release = threading.Event()
+        with patch("builtins.input", side_effect=lambda _: release.wait(10) and "y") as mock_input:
+            start = time.monotonic()
+            assert self._invoke(agent, tmp_path)["status"] == "success"
+            assert self._invoke(agent, tmp_path)["status"] == "success"   # reader still pending
+            assert time.monotonic() - start < 5
+            assert mock_input.call_count == 1
+            release.set()
+            assert ab._STDIN_LOCK.acquire(timeout=5)   # reader returned
+            ab._STDIN_LOCK.release()
+
+    def test_non_tty_skips_detection(self, agent, tmp_path, monkeypatch):
+        from aigis_agents.mesh.audit_layer import AuditLayer
+        import aigis_agents.mesh.agent_base as ab
+        monkeypatch.setattr(ab, "_stdin_is_tty", lambda: False)
+        monkeypatch.setattr(AuditLayer, "detect_preferences",
+                            lambda *a: pytest.fail("detection without a terminal"))
+        with patch("builtins.input") as mock_input:
+            assert self._invoke(agent, tmp_path)["status"] == "success"
+            mock_input.assert_not_called()
@@ -18,7 +18,7 @@ from __future__ import annotations
 import json
 import sys
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -331,10 +331,11 @@ class TestAgentBaseEntityContext:
 
             audit_inst = MagicMock()
             audit_inst.check_inputs.return_value = {"valid": True, "issues": []}
-            audit_inst.check_outputs.return_value = {
+            audit_inst.acheck_inputs = AsyncMock(return_value={"valid": True, "issues": []})
+            audit_inst.acheck_outputs = AsyncMock(return_value={
                 "confidence_label": "HIGH", "confidence_score": 90,
                 "citation_coverage": 0.9, "flags": [], "improvement_suggestions": [],
-            }
+            })
             audit_inst.detect_preferences.return_value = []
             audit_inst.log.return_value = "run_001"
             mock_audit.return_value = audit_inst